@@ -4,4 +4,5 @@ from .decoder import lrpc_decode as lrpc_decode
 from .encoder import lrpc_encode as lrpc_encode
 from .lrpc_client import LrpcClient as LrpcClient
 from .lrpc_client import LrpcResponse as LrpcResponse
+from .stream_statistics import LrpcStreamStatistics as LrpcStreamStatistics
 from .transport import LrpcTransport as LrpcTransport
@@ -243,7 +243,7 @@ class ClientCliVisitor(LrpcVisitor):
         if param.base_type_is_string() or param.base_type_is_bytearray():
             t = click.STRING
 
-        if param.base_type_is_float():
+        if param.base_type_is_float() or param.is_fixed_point():
             t = click.FLOAT
 
         if param.base_type_is_bool():
@@ -2,6 +2,7 @@ import struct
 from typing import Any, cast
 
 from lrpc.core import LrpcDef, LrpcVar
+from lrpc.core.encoded_size import bit_field_size, varint_max_size
 from lrpc.types.lrpc_type import LrpcResponseBasicTypeValidator, LrpcResponseType
 
 
@@ -81,9 +82,36 @@ class LrpcDecoder:
         if not s:
             raise ValueError(f"Type {var.base_type()} not found in LRPC definition")
 
-        for field in s.fields():
-            decoded_field = self.lrpc_decode(field)
-            decoded.update({field.name(): decoded_field})
+        for group in s.field_groups():
+            if group[0].is_bit_field():
+                decoded.update(self._decode_bit_fields(group))
+            else:
+                field = group[0]
+                decoded.update({field.name(): self.lrpc_decode(field)})
+
+        return decoded
+
+    def _decode_bit_fields(self, bit_fields: list[LrpcVar]) -> dict[str, LrpcResponseType]:
+        size = bit_field_size(bit_fields)
+        if self.remaining() < size:
+            raise ValueError(f"Incomplete bit fields: expected {size} bytes but got {self.remaining()}")
+
+        packed = int.from_bytes(self._unpack_bytes(size), "little")
+        decoded: dict[str, LrpcResponseType] = {}
+
+        for field in bit_fields:
+            width = field.bit_width()
+            value = packed & ((1 << width) - 1)
+            packed >>= width
+
+            if field.base_type_is_bool():
+                decoded[field.name()] = value != 0
+            elif field.base_type_is_enum():
+                decoded[field.name()] = self._enum_field_name(field, value)
+            else:
+                if field.base_type_is_signed() and (value >= (1 << (width - 1))):
+                    value -= 1 << width
+                decoded[field.name()] = _physical_value(value, field)
 
         return decoded
 
@@ -93,16 +121,45 @@ class LrpcDecoder:
         if not e:
             raise ValueError(f"Type {var.base_type()} not found in LRPC definition")
 
-        fields = e.fields()
+        return self._enum_field_name(var, self._unpack_uint8_t())
 
-        identifier = self._unpack_uint8_t()
+    def _enum_field_name(self, var: LrpcVar, identifier: int) -> str:
+        e = self.lrpc_def.enum(var.base_type())
 
-        for f in fields:
+        for f in e.fields():
             if f.id() == identifier:
                 return f.name()
 
         raise ValueError(f"Value {identifier} ({hex(identifier)}) is not valid for enum {var.base_type()}")
 
+    def _decode_varint(self, var: LrpcVar) -> int:
+        value = 0
+        for i in range(varint_max_size(var)):
+            if self.start >= len(self.encoded):
+                raise ValueError(f"Incomplete varint for {var.name()}")
+
+            byte = self.encoded[self.start]
+            self.start += 1
+            value |= (byte & 0x7F) << (7 * i)
+
+            if (byte & 0x80) == 0:
+                break
+        else:
+            raise ValueError(f"Varint for {var.name()} exceeds the size of {var.base_type()}")
+
+        bits = struct.calcsize(f"<{var.pack_type()}") * 8
+        if value >= (1 << bits):
+            raise ValueError(f"Varint for {var.name()} exceeds the size of {var.base_type()}")
+
+        if var.base_type_is_signed():
+            value = (value >> 1) ^ -(value & 1)
+
+        return value
+
+    def _decode_fixed_point(self, var: LrpcVar) -> int | float:
+        raw = self._decode_varint(var) if var.is_varint() else cast(int, self._unpack(var.pack_type()))
+        return _physical_value(raw, var)
+
     def _unpack_bytes(self, size: int) -> bytes:
         return cast(bytes, self._unpack(f"{size}s"))
 
@@ -139,11 +196,24 @@ class LrpcDecoder:
         if var.base_type_is_enum():
             return self._decode_enum(var)
 
+        if var.is_fixed_point():
+            return self._decode_fixed_point(var)
+
+        if var.is_varint():
+            return self._decode_varint(var)
+
         return self._unpack(var.pack_type())
 
     def remaining(self) -> int:
         return len(self.encoded) - self.start
 
 
+def _physical_value(raw: int, var: LrpcVar) -> int | float:
+    if not var.is_fixed_point():
+        return raw
+
+    return (raw * var.scale()) + var.offset()
+
+
 def lrpc_decode(encoded: bytes, var: LrpcVar, lrpc_def: LrpcDef) -> Any:
     return LrpcDecoder(encoded, lrpc_def).lrpc_decode(var)
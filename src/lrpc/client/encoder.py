@@ -2,6 +2,7 @@ import struct
 from typing import Final
 
 from lrpc.core import LrpcDef, LrpcVar
+from lrpc.core.encoded_size import bit_field_size
 from lrpc.types import LrpcBasicType, LrpcType
 from lrpc.types.lrpc_type import LrpcBuffer
 
@@ -73,13 +74,59 @@ def _encode_struct(value: dict[str, LrpcType], var: LrpcVar, lrpc_def: LrpcDef)
     encoded = b""
     s = lrpc_def.struct(var.base_type())
 
-    for field in s.fields():
-        v = value[field.name()]
-        encoded += lrpc_encode(v, field, lrpc_def)
+    for group in s.field_groups():
+        if group[0].is_bit_field():
+            encoded += _encode_bit_fields(value, group, lrpc_def)
+        else:
+            field = group[0]
+            encoded += lrpc_encode(value[field.name()], field, lrpc_def)
 
     return encoded
 
 
+def _bit_field_value(value: LrpcType, field: LrpcVar, lrpc_def: LrpcDef) -> int:
+    width = field.bit_width()
+
+    if field.base_type_is_bool():
+        if not isinstance(value, bool):
+            raise TypeError(f"Type error for {field.name()}: expected bool, but got {type(value)}")
+        return int(value)
+
+    if field.base_type_is_enum():
+        value = _check_enum_field_id(value, field, lrpc_def)
+        field_id = lrpc_def.enum(field.base_type()).field_id(value)
+        if field_id is None:
+            raise ValueError(f"{value} is not a field in enum {field.name()}")
+        return field_id
+
+    if field.is_fixed_point():
+        value = _to_fixed_point(value, field)
+
+    if (not isinstance(value, int)) or isinstance(value, bool):
+        raise TypeError(f"Type error for {field.name()}: expected int, but got {type(value)}")
+
+    if field.base_type_is_signed():
+        minimum, maximum = -(1 << (width - 1)), (1 << (width - 1)) - 1
+    else:
+        minimum, maximum = 0, (1 << width) - 1
+
+    if not minimum <= value <= maximum:
+        raise ValueError(f"Value {value} for {field.name()} does not fit in {width} bits")
+
+    return value & ((1 << width) - 1)
+
+
+def _encode_bit_fields(value: dict[str, LrpcType], bit_fields: list[LrpcVar], lrpc_def: LrpcDef) -> bytes:
+    packed = 0
+    position = 0
+
+    for field in bit_fields:
+        packed |= _bit_field_value(value[field.name()], field, lrpc_def) << position
+        position += field.bit_width()
+
+    return packed.to_bytes(bit_field_size(bit_fields), "little")
+
+
 def _check_array(value: LrpcType, var: LrpcVar) -> list[LrpcType]:
     if not isinstance(value, (list, tuple)):
         raise TypeError(f"Type error for {var.name()}: expected list or tuple, but got {type(value)}")
@@ -115,6 +162,46 @@ def _encode_basic_type(pack_type: str, value: LrpcBasicType) -> bytes:
     return struct.pack(f"<{pack_type}", value)
 
 
+def _check_varint(value: LrpcType, var: LrpcVar) -> int:
+    if (not isinstance(value, int)) or isinstance(value, bool):
+        raise TypeError(f"Type error for {var.name()}: expected int, but got {type(value)}")
+
+    # Raises struct.error if the value is out of range for the type
+    struct.pack(f"<{var.pack_type()}", value)
+
+    return value
+
+
+def _to_fixed_point(value: LrpcType, var: LrpcVar) -> int:
+    if (not isinstance(value, (int, float))) or isinstance(value, bool):
+        raise TypeError(f"Type error for {var.name()}: expected int or float, but got {type(value)}")
+
+    return round((value - var.offset()) / var.scale())
+
+
+def _encode_enum(value: LrpcType, var: LrpcVar, lrpc_def: LrpcDef) -> bytes:
+    value = _check_enum_field_id(value, var, lrpc_def)
+    e = lrpc_def.enum(var.base_type())
+    field_id = e.field_id(value)
+    if field_id is None:
+        raise ValueError(f"{value} is not a field in enum {var.name()}")
+    return _encode_basic_type(var.pack_type(), field_id)
+
+
+def _encode_varint(value: int, var: LrpcVar) -> bytes:
+    if var.base_type_is_signed():
+        # zigzag encoding maps small negative numbers to small positive numbers
+        value = (value * 2) if value >= 0 else (-value * 2) - 1
+
+    encoded = bytearray()
+    while value >= 0x80:  # noqa: PLR2004
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
 # pylint: disable = too-many-return-statements
 def lrpc_encode(value: LrpcType, var: LrpcVar, lrpc_def: LrpcDef) -> bytes:  # noqa: PLR0911
     if var.is_array():
@@ -137,12 +224,14 @@ def lrpc_encode(value: LrpcType, var: LrpcVar, lrpc_def: LrpcDef) -> bytes:  # n
         return _encode_struct(value, var, lrpc_def)
 
     if var.base_type_is_enum():
-        value = _check_enum_field_id(value, var, lrpc_def)
-        e = lrpc_def.enum(var.base_type())
-        field_id = e.field_id(value)
-        if field_id is None:
-            raise ValueError(f"{value} is not a field in enum {var.name()}")
-        return _encode_basic_type(var.pack_type(), field_id)
+        return _encode_enum(value, var, lrpc_def)
+
+    if var.is_fixed_point():
+        value = _to_fixed_point(value, var)
+
+    if var.is_varint():
+        value = _check_varint(value, var)
+        return _encode_varint(value, var)
 
     if not isinstance(value, (bool, int, float, str)):
         raise TypeError(f"Type error for {var.name()}: expected bool, int, float or str, but got {type(value)}")
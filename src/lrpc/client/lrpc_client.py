@@ -1,24 +1,37 @@
 import logging
 import struct
+from collections import deque
 from collections.abc import Generator
 from dataclasses import dataclass
 from importlib.metadata import version
 from pathlib import Path
-from typing import cast
+from typing import Final, cast
 
 from lrpc.core import LrpcFun, LrpcService, LrpcStream, LrpcVar
 from lrpc.core.definition import LrpcDef
-from lrpc.core.meta import MetaVersionResponseDict, MetaVersionResponseValidator
+from lrpc.core.meta import (
+    MESSAGE_FORMAT_FEATURES,
+    LrpcMetaFeature,
+    MetaCapabilitiesResponseDict,
+    MetaCapabilitiesResponseValidator,
+    MetaVersionResponseDict,
+    MetaVersionResponseValidator,
+    stream_features,
+)
 from lrpc.types import LrpcType
 from lrpc.types.lrpc_type import LrpcResponseType
 from lrpc.utils import load_lrpc_def
 
 from .decoder import LrpcDecoder
 from .encoder import lrpc_encode
+from .stream_statistics import LrpcStreamStatistics
 from .transport import LrpcTransport
 
 LrpcResponsePayload = dict[str, LrpcResponseType]
 
+# Precedes the payload of every message of a stream with sequence numbers
+SEQUENCE_NUMBER: Final = LrpcVar({"name": "sequence", "type": "uint8_t"}, trusted=True)
+
 
 @dataclass
 class LrpcResponse:
@@ -29,6 +42,7 @@ class LrpcResponse:
     is_error_response: bool
     is_expected_response: bool
     payload: LrpcResponsePayload
+    sequence_number: int | None = None
 
 
 class LrpcClient:
@@ -43,8 +57,11 @@ class LrpcClient:
         self._transport = transport
         self._lrpc_def = lrpc_def
         self._receive_buffer = b""
+        self._pending_responses: deque[LrpcResponse] = deque()
         self._current_service: str = ""
         self._current_function_or_stream: str = ""
+        self._stream_statistics: dict[tuple[str, str], LrpcStreamStatistics] = {}
+        self._server_capabilities: MetaCapabilitiesResponseDict | None = None
         self._log = logging.getLogger(self.__class__.__name__)
 
     @staticmethod
@@ -64,6 +81,44 @@ class LrpcClient:
     def definition(self) -> LrpcDef:
         return self._lrpc_def
 
+    def stream_statistics(self, service_name: str, stream_name: str) -> LrpcStreamStatistics:
+        stream = self._lrpc_def.stream(service_name, stream_name)
+        if (stream is None) or (not stream.has_sequence_number()):
+            raise ValueError(f"{service_name}.{stream_name} is not a stream with sequence numbers")
+
+        return self._stream_statistics.setdefault((service_name, stream_name), LrpcStreamStatistics())
+
+    def server_capabilities(self) -> MetaCapabilitiesResponseDict:
+        # Retrieved from the server only once. Once known, requests
+        # that do not fit in the receive buffer of the server are rejected
+        if self._server_capabilities is None:
+            capabilities_response = self.communicate("LrpcMeta", "capabilities").payload
+            MetaCapabilitiesResponseValidator.validate_python(capabilities_response, strict=True, extra="forbid")
+            capabilities = cast(MetaCapabilitiesResponseDict, capabilities_response)
+            capabilities["features"] = LrpcMetaFeature(capabilities["features"])
+            self._server_capabilities = capabilities
+
+        return self._server_capabilities
+
+    def check_server_features(self) -> bool:
+        # Stream messages are decoded according to the definition of the client, which
+        # must therefore agree with the server about the features that change their format
+        server_features = LrpcMetaFeature(self.server_capabilities()["features"]) & MESSAGE_FORMAT_FEATURES
+        client_features = stream_features(self._lrpc_def) & MESSAGE_FORMAT_FEATURES
+
+        if server_features != client_features:
+            self._log.warning("Server feature mismatch detected. Details client vs server:")
+            for feature in (f for f in LrpcMetaFeature if f in MESSAGE_FORMAT_FEATURES):
+                self._log.warning(
+                    "%s: %s vs %s",
+                    feature.name,
+                    feature in client_features,
+                    feature in server_features,
+                )
+            return False
+
+        return True
+
     def check_server_version(self) -> bool:
         disabled = "[disabled]"
         client_side_lrpc_version = version("lotusrpc")
@@ -140,6 +195,13 @@ class LrpcClient:
         )
 
     def decode(self, encoded: bytes) -> LrpcResponse:
+        responses = self.decode_all(encoded)
+        if len(responses) != 1:
+            raise ValueError(f"Message contains {len(responses)} responses. Use decode_all to decode batched messages")
+
+        return responses[0]
+
+    def decode_all(self, encoded: bytes) -> list[LrpcResponse]:
         if len(encoded) < self.LRPC_MESSAGE_MIN_LENGTH:
             raise ValueError(f"Unable to decode message from {encoded!r}: an LRPC message has at least 3 bytes")
 
@@ -160,15 +222,45 @@ class LrpcClient:
         decoder = LrpcDecoder(encoded[3:], self._lrpc_def)
 
         if function:
-            payload = self._decode_variables(function.returns(), decoder, f"{service.name()}.{function.name()}")
-            return self._make_response(service, function, payload)
+            payload = self._decode_variables(function.returns(), decoder)
+            self._check_remaining(decoder, f"{service.name()}.{function.name()}")
+            return [self._make_response(service, function, payload)]
 
         if stream:
-            payload = self._decode_variables(stream.returns(), decoder, f"{service.name()}.{stream.name()}")
-            return self._make_response(service, stream, payload)
+            return self._decode_stream(service, stream, encoded)
 
         raise ValueError(f"No function or stream with ID {function_or_stream_id} found in service {service.name()}")
 
+    def _decode_stream(self, service: LrpcService, stream: LrpcStream, encoded: bytes) -> list[LrpcResponse]:
+        name = f"{service.name()}.{stream.name()}"
+
+        if not stream.is_batched():
+            decoder = LrpcDecoder(encoded[3:], self._lrpc_def)
+            responses = [self._decode_stream_message(service, stream, decoder)]
+        else:
+            if len(encoded) == self.LRPC_MESSAGE_MIN_LENGTH:
+                raise ValueError(f"Batched message for {name} does not contain the number of responses")
+
+            count = encoded[3]
+            decoder = LrpcDecoder(encoded[4:], self._lrpc_def)
+            responses = [self._decode_stream_message(service, stream, decoder) for _ in range(count)]
+
+        self._check_remaining(decoder, name)
+        return responses
+
+    def _decode_stream_message(self, service: LrpcService, stream: LrpcStream, decoder: LrpcDecoder) -> LrpcResponse:
+        sequence_number = None
+        if stream.has_sequence_number():
+            sequence_number = cast(int, decoder.lrpc_decode(SEQUENCE_NUMBER))
+            missing = self.stream_statistics(service.name(), stream.name()).update(sequence_number)
+            if missing != 0:
+                self._log.warning("%d message(s) missing in stream %s.%s", missing, service.name(), stream.name())
+
+        payload = self._decode_variables(stream.returns(), decoder)
+        response = self._make_response(service, stream, payload)
+        response.sequence_number = sequence_number
+        return response
+
     def encode(self, service_name: str, function_or_stream_name: str, **kwargs: LrpcType) -> bytes:
         service = self._lrpc_def.service_by_name(service_name)
         if not service:
@@ -194,9 +286,12 @@ class LrpcClient:
         self._current_function_or_stream = function_or_stream_name
 
         encoded = self.encode(service_name, function_or_stream_name, **kwargs)
+        self._check_request_size(encoded)
         self._transport.write(encoded)
 
         start_param = ("start" in kwargs) and (kwargs["start"] is True)
+        if start_param:
+            self._restart_stream_statistics(service_name, function_or_stream_name)
 
         receive_more = self._has_response(service_name, function_or_stream_name, start_param=start_param)
         while receive_more:
@@ -224,6 +319,22 @@ class LrpcClient:
     ) -> LrpcResponse:
         return next(self.communicate_all(service_name, function_or_stream_name, **kwargs))
 
+    def _check_request_size(self, encoded: bytes) -> None:
+        if self._server_capabilities is None:
+            return
+
+        rx_buffer_size = self._server_capabilities["rx_buffer_size"]
+        if len(encoded) > rx_buffer_size:
+            raise ValueError(
+                f"Request of {len(encoded)} bytes does not fit in the receive buffer"
+                f" of the server ({rx_buffer_size} bytes)",
+            )
+
+    def _restart_stream_statistics(self, service_name: str, stream_name: str) -> None:
+        stream = self._lrpc_def.stream(service_name, stream_name)
+        if (stream is not None) and stream.has_sequence_number():
+            self.stream_statistics(service_name, stream_name).restart()
+
     def _has_response(self, service_name: str, function_or_stream_name: str, *, start_param: bool) -> bool:
         function = self._lrpc_def.function(service_name, function_or_stream_name)
         stream = self._lrpc_def.stream(service_name, function_or_stream_name)
@@ -247,9 +358,10 @@ class LrpcClient:
         message_length = self._receive_buffer[0] + 1
 
         if received >= message_length:
-            result = self.decode(self._receive_buffer[0:message_length])
+            self._pending_responses.extend(self.decode_all(self._receive_buffer[0:message_length]))
             self._receive_buffer = self._receive_buffer[message_length:]
-            return result
+            if len(self._pending_responses) != 0:
+                return self._pending_responses.popleft()
 
         return LrpcClient.IncompleteResponse()
 
@@ -264,6 +376,9 @@ class LrpcClient:
         return self._add_message_length(encoded)
 
     def _receive_response(self) -> LrpcResponse:
+        if len(self._pending_responses) != 0:
+            return self._pending_responses.popleft()
+
         while True:
             received = self._transport.read(1)
             if len(received) == 0:
@@ -275,17 +390,19 @@ class LrpcClient:
                 return response
 
     @staticmethod
-    def _decode_variables(variables: list[LrpcVar], decoder: LrpcDecoder, name: str) -> LrpcResponsePayload:
+    def _decode_variables(variables: list[LrpcVar], decoder: LrpcDecoder) -> LrpcResponsePayload:
         ret = {}
 
         for r in variables:
             ret[r.name()] = decoder.lrpc_decode(r)
 
+        return ret
+
+    @staticmethod
+    def _check_remaining(decoder: LrpcDecoder, name: str) -> None:
         if decoder.remaining() != 0:
             raise ValueError(f"{decoder.remaining()} remaining bytes after decoding {name}")
 
-        return ret
-
     @staticmethod
     def _check_parameters(
         required_params: list[str],
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import Final
+
+# Sequence numbers are 8 bit and wrap around
+SEQUENCE_NUMBER_MODULUS: Final = 256
+
+
+@dataclass
+class LrpcStreamStatistics:
+    """Counters for the messages of a server stream with sequence numbers.
+    A message with a sequence number that is more than half the sequence
+    number range behind the expected sequence number is out of order"""
+
+    received: int = 0
+    missing: int = 0
+    out_of_order: int = 0
+    _expected: int | None = field(default=None, repr=False, compare=False)
+
+    def update(self, sequence_number: int) -> int:
+        self.received += 1
+
+        if self._expected is None:
+            self._expected = (sequence_number + 1) % SEQUENCE_NUMBER_MODULUS
+            return 0
+
+        gap = (sequence_number - self._expected) % SEQUENCE_NUMBER_MODULUS
+        if gap >= SEQUENCE_NUMBER_MODULUS // 2:
+            self.out_of_order += 1
+            return 0
+
+        self.missing += gap
+        self._expected = (sequence_number + 1) % SEQUENCE_NUMBER_MODULUS
+        return gap
+
+    def restart(self) -> None:
+        # The first message after a restart is accepted with any sequence number
+        self._expected = None
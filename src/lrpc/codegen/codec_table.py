@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from typing import Final, Literal
+
+from lrpc.core import LrpcDef, LrpcFun, LrpcStruct, LrpcVar
+
+LrpcCodec = Literal["inline", "table"]
+
+# Enums are encoded as uint8_t
+TABLE_FIELD_TYPES: Final = {
+    "uint8_t": "Uint8",
+    "int8_t": "Int8",
+    "uint16_t": "Uint16",
+    "int16_t": "Int16",
+    "uint32_t": "Uint32",
+    "int32_t": "Int32",
+    "uint64_t": "Uint64",
+    "int64_t": "Int64",
+    "float": "Float",
+    "double": "Double",
+    "bool": "Bool",
+}
+
+# Size of lrpc::FieldDescriptor without the pointer to the field table of a nested struct
+FIELD_DESCRIPTOR_DATA_SIZE: Final = 8
+# lrpc::FunctionDescriptor holds two field tables and a handler
+FUNCTION_DESCRIPTOR_POINTERS: Final = 3
+
+
+def table_field_type(var: LrpcVar) -> str | None:
+    """Name of the lrpc::FieldType of the field or None if the
+    field is not supported by the table codec"""
+    if var.is_optional() or var.is_varint() or var.is_bit_field():
+        return None
+
+    if var.base_type_is_enum():
+        return "Uint8"
+
+    if var.base_type_is_struct():
+        return "Struct"
+
+    return TABLE_FIELD_TYPES.get(var.base_type())
+
+
+def supports_table_var(var: LrpcVar, lrpc_def: LrpcDef) -> bool:
+    if table_field_type(var) is None:
+        return False
+
+    if var.base_type_is_struct():
+        return supports_table_codec(lrpc_def.struct(var.base_type()), lrpc_def)
+
+    return True
+
+
+def supports_table_codec(struct: LrpcStruct, lrpc_def: LrpcDef) -> bool:
+    if struct.is_external():
+        return False
+
+    return all(supports_table_var(f, lrpc_def) for f in struct.fields())
+
+
+def supports_function_table(function: LrpcFun, lrpc_def: LrpcDef) -> bool:
+    """True if the function can be invoked by the generic function shim. Arrays are
+    returned as a span that does not fit in the buffer for the return values"""
+    if any(r.is_array() for r in function.returns()):
+        return False
+
+    return all(supports_table_var(v, lrpc_def) for v in function.params() + function.returns())
+
+
+def field_descriptor(owner: str, var: LrpcVar, namespace: str | None) -> str:
+    """Initializer of the lrpc::FieldDescriptor of a field of the C++ type owner"""
+    offset = f"offsetof({owner}, {var.name()})"
+    field_type = f"lrpc::FieldType::{table_field_type(var)}"
+
+    if var.base_type_is_struct():
+        nested = f"{namespace}::{var.base_type()}" if namespace else var.base_type()
+        return f"{{{offset}, {field_type}, {var.array_size()}, sizeof({nested}), &lrpc::fieldTable<{nested}>}}"
+
+    return f"{{{offset}, {field_type}, {var.array_size()}, 0, nullptr}}"
+
+
+def enum_size_assertion(owner: str, var: LrpcVar) -> str:
+    return (
+        f"static_assert(sizeof({owner}::{var.name()}) == {var.array_size()}, "
+        f'"Table codec requires enum field {var.name()} to have size 1");'
+    )
+
+
+def function_table_size(functions: list[LrpcFun], lrpc_def: LrpcDef) -> int:
+    """Number of function descriptors of a service, up to the highest ID of a function in the table"""
+    ids = [f.id() for f in functions if supports_function_table(f, lrpc_def)]
+    return max(ids, default=-1) + 1
+
+
+@dataclass(frozen=True)
+class CodecFootprint:
+    """Generated code for the codec of a definition. Inline struct codecs and function
+    shims are specialized for every struct and function, tables are interpreted"""
+
+    inline_struct_codecs: int
+    inline_function_shims: int
+    field_descriptors: int
+    function_descriptors: int
+
+    def table_bytes(self, pointer_size: int = 4) -> int:
+        field_descriptor_size = -(-(FIELD_DESCRIPTOR_DATA_SIZE + pointer_size) // pointer_size) * pointer_size
+        function_descriptor_size = FUNCTION_DESCRIPTOR_POINTERS * pointer_size
+        return (self.field_descriptors * field_descriptor_size) + (self.function_descriptors * function_descriptor_size)
+
+
+def codec_footprint(lrpc_def: LrpcDef, codec: LrpcCodec) -> CodecFootprint:
+    structs = lrpc_def.structs()
+    services = [*lrpc_def.services(), lrpc_def.meta_service()]
+    functions = [f for s in services for f in s.functions()]
+
+    if codec == "inline":
+        return CodecFootprint(len(structs), len(functions), 0, 0)
+
+    table_structs = [s for s in structs if supports_table_codec(s, lrpc_def)]
+    table_functions = [f for f in functions if supports_function_table(f, lrpc_def)]
+    struct_fields = sum(len(s.fields()) for s in table_structs)
+    function_fields = sum(len(f.params()) + len(f.returns()) for f in table_functions)
+    # The function descriptors of a service are indexed by function ID
+    function_descriptors = sum(function_table_size(s.functions(), lrpc_def) for s in services)
+
+    return CodecFootprint(
+        inline_struct_codecs=len(structs) - len(table_structs),
+        inline_function_shims=len(functions) - len(table_functions),
+        field_descriptors=struct_fields + function_fields,
+        function_descriptors=function_descriptors,
+    )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from lrpc.codegen.output_files import write_if_changed
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
-    from typing import Self, TextIO
+    from typing import Self
 
 
 class CppFile:
@@ -17,8 +20,10 @@ class CppFile:
             raise ValueError(f"indent must be non-negative, got {indent}")
         self._indent = " " * indent
         self._level = 0
+        self._filename = filename
         if _writer is None:
-            self._file: TextIO | None = Path(filename).open("w", encoding="utf-8")  # noqa: SIM115  # pylint: disable=consider-using-with
+            # The file is written on close and only if the content changed
+            self._file: StringIO | None = StringIO()
             self._writer: Callable[[str], int] = self._file.write
         else:
             self._file = None
@@ -69,4 +74,5 @@ class CppFile:
 
     def __exit__(self, *_: object) -> None:
         if self._file is not None:
-            self._file.close()
+            write_if_changed(Path(self._filename), self._file.getvalue())
+            self._file = None
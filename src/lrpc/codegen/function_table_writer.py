@@ -0,0 +1,131 @@
+from lrpc.codegen.codec_table import enum_size_assertion, field_descriptor
+from lrpc.codegen.cppfile import CppFile
+from lrpc.core import LrpcFun, LrpcVar
+
+
+# pylint: disable = too-few-public-methods
+class FunctionTableWriter:
+    """Writes the function descriptors of the table codec and the generic function shim that interprets them.
+    Only the handler that invokes the function is written for every function"""
+
+    def __init__(self, file: CppFile, shim_name: str, namespace: str | None) -> None:
+        self._file = file
+        self._shim_name = shim_name
+        self._namespace = namespace
+
+    def write_function_table(self, functions: list[LrpcFun]) -> None:
+        """Write the function table for functions that all support the table codec"""
+        self._file.write("// Function descriptors for the generic function shim")
+        for function in functions:
+            self._write_buffer_layouts(function)
+            self._write_handler(function)
+
+        self._write_buffer_size(functions)
+        self._write_descriptors(functions)
+        self._write_generic_shim()
+
+    def _write_buffer_layouts(self, function: LrpcFun) -> None:
+        for kind, variables in (("params", function.params()), ("returns", function.returns())):
+            if len(variables) == 0:
+                continue
+
+            name = f"{function.name()}_{kind}"
+            with self._file.block(f"struct {name}", ";", trailing_newline=True):
+                for v in variables:
+                    self._file.write(f"{v.field_type()} {v.name()};")
+
+            self._write_field_table(name, variables)
+
+    def _write_field_table(self, name: str, variables: list[LrpcVar]) -> None:
+        with self._file.block(f"static lrpc::span<const lrpc::FieldDescriptor> {name}_fields()", trailing_newline=True):
+            self._file.write(
+                f"static_assert(std::is_standard_layout<{name}>::value, "
+                '"Table codec requires a standard layout struct");',
+            )
+            for v in variables:
+                if v.base_type_is_enum():
+                    self._file.write(enum_size_assertion(name, v))
+
+            with self._file.block("static constexpr lrpc::FieldDescriptor fields[]", ";"):
+                for v in variables:
+                    self._file.write(f"{field_descriptor(name, v, self._namespace)},")
+
+            self._file.write("return fields;")
+
+    def _write_handler(self, function: LrpcFun) -> None:
+        name = function.name()
+        params = " params" if len(function.params()) != 0 else " /*params*/"
+        returns = " returns" if len(function.returns()) != 0 else " /*returns*/"
+
+        with self._file.block(
+            f"static void {name}_handler(lrpc::Service& service, const uint8_t*{params}, uint8_t*{returns})",
+            trailing_newline=True,
+        ):
+            if len(function.params()) != 0:
+                self._file.write(f"{name}_params p{{}};")
+                self._file.write("(void)std::memcpy(&p, params, sizeof(p));")
+
+            param_list = ", ".join(f"p.{p}" for p in function.param_names())
+            invocation = f"static_cast<{self._shim_name}&>(service).{name}({param_list})"
+
+            if len(function.returns()) == 0:
+                self._file.write(f"{invocation};")
+                return
+
+            if len(function.returns()) == 1:
+                self._file.write(f"const {name}_returns r{{{invocation}}};")
+            else:
+                self._file.write(f"const auto result = {invocation};")
+                values = ", ".join(f"std::get<{i}>(result)" for i in range(len(function.returns())))
+                self._file.write(f"const {name}_returns r{{{values}}};")
+
+            self._file.write("(void)std::memcpy(returns, &r, sizeof(r));")
+
+    def _write_buffer_size(self, functions: list[LrpcFun]) -> None:
+        sizes = [
+            f"sizeof({f.name()}_{kind})"
+            for f in functions
+            for kind, variables in (("params", f.params()), ("returns", f.returns()))
+            if len(variables) != 0
+        ]
+
+        # The buffers are never empty, to avoid arrays of size 0
+        size = f"lrpc::table_codec::maxSize({', '.join(sizes)})" if len(sizes) != 0 else "1"
+        self._file.write(f"static constexpr size_t FunctionBufferSize{{{size}}};")
+        self._file.newline()
+
+    def _write_descriptors(self, functions: list[LrpcFun]) -> None:
+        descriptors = {f.id(): self._descriptor(f) for f in functions}
+
+        with self._file.block(
+            "static const lrpc::FunctionDescriptor& functionDescriptor(const size_t functionId)",
+            trailing_newline=True,
+        ):
+            with self._file.block("static constexpr lrpc::FunctionDescriptor descriptors[]", ";"):
+                for fid in range(max(descriptors) + 1):
+                    self._file.write(f"{descriptors.get(fid, '{nullptr, nullptr, nullptr}')},")
+
+            self._file.write("return descriptors[functionId];")
+
+    def _write_generic_shim(self) -> None:
+        with self._file.block("void function_table_shim(Reader& reader)"):
+            self._file.write("const auto functionId = static_cast<uint8_t>(reader.data().at(2));")
+            self._file.write("const auto& function = functionDescriptor(functionId);")
+            self._file.write("lrpc::array<uint8_t, FunctionBufferSize> params{};")
+            self._file.write("lrpc::array<uint8_t, FunctionBufferSize> returns{};")
+            self._file.write("lrpc::readFields(reader, params.data(), function.params());")
+            self._file.write("function.handler(*this, params.data(), returns.data());")
+            self._file.write("const auto returnFields = function.returns();")
+            with self._file.block(
+                "const auto _lrpc_paramWriter = [&returns, &returnFields](Writer& writer)",
+                ";",
+            ):
+                self._file.write("lrpc::writeFields(writer, returns.data(), returnFields);")
+            self._file.write("server().transmit(id(), functionId, _lrpc_paramWriter);")
+
+    @staticmethod
+    def _descriptor(function: LrpcFun) -> str:
+        name = function.name()
+        params = f"&{name}_params_fields" if len(function.params()) != 0 else "&lrpc::noFields"
+        returns = f"&{name}_returns_fields" if len(function.returns()) != 0 else "&lrpc::noFields"
+        return f"{{{params}, {returns}, &{name}_handler}}"
@@ -2,12 +2,14 @@ from importlib.metadata import version
 
 from lrpc.codegen.cppfile import CppFile
 from lrpc.codegen.utils import optionally_in_namespace
+from lrpc.core.meta import MetaCapabilitiesResponseDict
 
 
 # pylint: disable = too-few-public-methods
 class MetaConstantsWriter:
-    def __init__(self, file: CppFile) -> None:
+    def __init__(self, file: CppFile, capabilities: MetaCapabilitiesResponseDict) -> None:
         self._file = file
+        self._capabilities = capabilities
         self._definition_version: str | None = None
         self._definition_hash: str | None = None
         self._compressed_definition = b""
@@ -39,6 +41,8 @@ class MetaConstantsWriter:
         with self._file.block("namespace lrpc_meta"):
             self._write_version_constants()
             self._file.newline()
+            self._write_capabilities_constants()
+            self._file.newline()
             self._write_definition_constants()
 
     def _write_version_constants(self) -> None:
@@ -51,6 +55,14 @@ class MetaConstantsWriter:
         self._file.write(f"static constexpr lrpc::string_view DefinitionHash {{{def_version_hash_str}}};")
         self._file.write(f"static constexpr lrpc::string_view LrpcVersion {{{lrpc_version_str}}};")
 
+    def _write_capabilities_constants(self) -> None:
+        capabilities = self._capabilities
+
+        self._file.write(f"static constexpr uint16_t RxBufferSize {{{capabilities['rx_buffer_size']}}};")
+        self._file.write(f"static constexpr uint16_t TxBufferSize {{{capabilities['tx_buffer_size']}}};")
+        self._file.write(f"static constexpr uint8_t MaxServiceId {{{capabilities['max_service_id']}}};")
+        self._file.write(f"static constexpr uint32_t Features {{0x{capabilities['features']:08x}}};")
+
     def _write_definition_constants(self) -> None:
         chunk_size = self._definition_stream_chunk_size
         comp_def = self._compressed_definition
@@ -1,29 +1,37 @@
 from pathlib import Path
 
+from lrpc.codegen.codec_table import LrpcCodec
 from lrpc.codegen.common import write_file_banner
 from lrpc.codegen.cppfile import CppFile
 from lrpc.codegen.meta_constants_writer import MetaConstantsWriter
 from lrpc.codegen.meta_service_file_writer import MetaServiceFileWriter
 from lrpc.core import LrpcDef, RpcSettings
+from lrpc.core.meta import LrpcMetaFeature, MetaCapabilitiesResponseDict, stream_features
 from lrpc.visitors import LrpcVisitor
 
 
 class MetaServiceVisitor(LrpcVisitor):
-    def __init__(self, output: Path) -> None:
+    def __init__(self, output: Path, codec: LrpcCodec = "inline") -> None:
         self._namespace: str | None
         self._output = output
+        self._codec = codec
         self._service_file: CppFile
         self._constants_file: CppFile
         self._definition_version: str | None = None
         self._definition_hash: str | None
         self._compressed_definition = b""
         self._definition_stream_chunk_size: int
+        self._max_service_id: int
+        self._stream_features: LrpcMetaFeature
+        self._capabilities: MetaCapabilitiesResponseDict
 
     def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
         self._service_file = CppFile(f"{self._output}/LrpcMeta_service.hpp")
         self._constants_file = CppFile(f"{self._output}/LrpcMeta_constants.hpp")
         self._definition_hash = lrpc_def.definition_hash()
         self._compressed_definition = lrpc_def.compressed_definition()
+        self._max_service_id = lrpc_def.max_service_id()
+        self._stream_features = stream_features(lrpc_def)
 
     def visit_rpc_settings(self, settings: RpcSettings) -> None:
         self._namespace = settings.namespace()
@@ -40,6 +48,13 @@ class MetaServiceVisitor(LrpcVisitor):
         # - Stream final parameter
         self._definition_stream_chunk_size = settings.tx_buffer_size() - 5
 
+        self._capabilities = {
+            "rx_buffer_size": settings.rx_buffer_size(),
+            "tx_buffer_size": settings.tx_buffer_size(),
+            "max_service_id": self._max_service_id,
+            "features": self._features(settings),
+        }
+
         self._write_service_file()
         self._write_constants_file()
         self._service_file.close()
@@ -47,7 +62,7 @@ class MetaServiceVisitor(LrpcVisitor):
 
     def _write_constants_file(self) -> None:
         write_file_banner(self._constants_file)
-        writer = MetaConstantsWriter(self._constants_file)
+        writer = MetaConstantsWriter(self._constants_file, self._capabilities)
         writer.write_constants(
             self._definition_version,
             self._definition_hash,
@@ -56,6 +71,19 @@ class MetaServiceVisitor(LrpcVisitor):
             self._namespace,
         )
 
+    def _features(self, settings: RpcSettings) -> int:
+        features = self._stream_features
+        if self._codec == "table":
+            features |= LrpcMetaFeature.TABLE_CODEC
+        if settings.embed_definition():
+            features |= LrpcMetaFeature.EMBEDDED_DEFINITION
+        if self._definition_hash:
+            features |= LrpcMetaFeature.DEFINITION_HASH
+        if self._definition_version:
+            features |= LrpcMetaFeature.DEFINITION_VERSION
+
+        return int(features)
+
     def _write_service_file(self) -> None:
         write_file_banner(self._service_file)
         writer = MetaServiceFileWriter(self._service_file)
@@ -30,6 +30,15 @@ public:
             lrpc_meta::DefinitionHash,
             lrpc_meta::LrpcVersion};
     }
+
+    std::tuple<uint16_t, uint16_t, uint8_t, uint32_t> capabilities() override
+    {
+        return {
+            lrpc_meta::RxBufferSize,
+            lrpc_meta::TxBufferSize,
+            lrpc_meta::MaxServiceId,
+            lrpc_meta::Features};
+    }
 };"""
 
 
@@ -0,0 +1,141 @@
+import hashlib
+import json
+from collections.abc import Callable, Generator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, ParamSpec, TypeVar
+
+# List of files generated in the previous run for a definition. Used to remove files that are no
+# longer generated. The manifest is per definition, so that multiple definitions can share a directory
+MANIFEST_SUFFIX: Final = ".lrpcg_manifest.json"
+
+
+@dataclass
+class GeneratedFiles:
+    """Files of a single code generation run"""
+
+    written: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+
+    def all(self) -> list[Path]:
+        return sorted(self.written + self.unchanged)
+
+
+_generated_files: ContextVar[GeneratedFiles | None] = ContextVar("_generated_files", default=None)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write the content to the file, unless the file already has exactly this content. The modification
+    time of an unchanged file is preserved, so that build systems do not recompile anything that
+    depends on it. Returns True if the file was written"""
+    path = path.absolute()
+    changed = (not path.is_file()) or (path.read_text(encoding="utf-8") != content)
+    if changed:
+        path.write_text(content, encoding="utf-8")
+
+    generated = _generated_files.get()
+    if generated is not None:
+        (generated.written if changed else generated.unchanged).append(path)
+
+    return changed
+
+
+def manifest_file(output: Path, name: str) -> Path:
+    return output.joinpath(f".{name}{MANIFEST_SUFFIX}")
+
+
+@contextmanager
+def track_generated_files(output: Path, name: str, *, partial: bool = False) -> Generator[GeneratedFiles, None, None]:
+    """Track all files written with write_if_changed. On exit, the files in output that were generated
+    in the previous run for definition name but not in this one are removed and the manifest is updated.
+    A partial run only generates the files that may have changed. The other files of the previous run
+    are then kept and reported as unchanged"""
+    generated = GeneratedFiles()
+    token = _generated_files.set(generated)
+    try:
+        yield generated
+    finally:
+        _generated_files.reset(token)
+
+    # Files may have been generated concurrently
+    generated.written.sort()
+    generated.unchanged.sort()
+    manifest = manifest_file(output.absolute(), name)
+    if partial:
+        generated.unchanged.extend(_not_generated_again(manifest, generated.all()))
+        generated.unchanged.sort()
+    generated.removed = _remove_stale_files(manifest, generated.all())
+    _write_manifest(manifest, generated.all())
+
+
+def submit_tracked(executor: Executor, fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+    """Submit a job to the executor, such that files written by the job are tracked like the files
+    that are written by the caller. Worker threads do not inherit the context of the caller"""
+    context = copy_context()
+    return executor.submit(lambda: context.run(fn, *args, **kwargs))
+
+
+def _read_manifest(manifest: Path) -> list[Path]:
+    if not manifest.is_file():
+        return []
+
+    try:
+        files = json.loads(manifest.read_text(encoding="utf-8"))["files"]
+        return [manifest.parent.joinpath(f) for f in files]
+    except (ValueError, KeyError, TypeError):
+        # A broken manifest is not fatal. Stale files are then left alone
+        return []
+
+
+def _not_generated_again(manifest: Path, files: list[Path]) -> list[Path]:
+    return [f for f in _read_manifest(manifest) if (f not in files) and f.is_file()]
+
+
+def _remove_stale_files(manifest: Path, files: list[Path]) -> list[Path]:
+    output = manifest.parent.resolve()
+    removed = []
+    for stale in _read_manifest(manifest):
+        # Only remove files in the output directory, even if the manifest was modified
+        if (stale not in files) and stale.is_file() and stale.resolve().is_relative_to(output):
+            stale.unlink()
+            removed.append(stale)
+
+    return removed
+
+
+def _write_manifest(manifest: Path, files: list[Path]) -> None:
+    content = {"files": {f.relative_to(manifest.parent).as_posix(): content_hash(f) for f in files}}
+    write_if_changed(manifest, json.dumps(content, indent=2) + "\n")
+
+
+def _depfile_path(path: Path) -> str:
+    # Escaping as understood by Make and Ninja
+    return path.as_posix().replace("\\", "\\\\").replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
+
+
+def write_depfile(depfile: Path, outputs: list[Path], inputs: list[Path]) -> None:
+    """Write a Make/Ninja style depfile in which all outputs depend on all inputs"""
+    targets = " ".join(_depfile_path(o.absolute()) for o in outputs)
+    dependencies = " \\\n  ".join(_depfile_path(i.absolute()) for i in inputs)
+    write_if_changed(depfile, f"{targets}: \\\n  {dependencies}\n")
+
+
+def write_build_manifest(manifest: Path, outputs: list[Path], inputs: list[Path], lrpc_version: str) -> None:
+    """Write a JSON file with the content hash of all inputs and outputs of a code generation run"""
+    content = {
+        "lrpc_version": lrpc_version,
+        "inputs": {i.absolute().as_posix(): content_hash(i) for i in inputs},
+        "outputs": {o.absolute().as_posix(): content_hash(o) for o in outputs},
+    }
+    write_if_changed(manifest, json.dumps(content, indent=2) + "\n")
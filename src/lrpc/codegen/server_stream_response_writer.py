@@ -9,19 +9,102 @@ class ServerStreamResponseWriter:
         self._file = file
 
     def write_response(self, stream: LrpcStream) -> None:
+        if stream.is_batched():
+            self._write_batched_response(stream)
+            self._file.newline()
+            self._write_flush(stream)
+            return
+
         returns = stream.returns()
 
         with self._file.block(f"void {stream.name()}_response({self._response_params(returns)})"):
-            if len(returns) == 0:
+            self._write_rate_limit_check(stream)
+            if len(returns) == 0 and not stream.has_sequence_number():
                 self._file.write(f"server().transmit(id(), {stream.id()});")
             else:
-                response = self._response_captures(returns)
+                self._write_param_writer(stream)
+                self._file.write(f"server().transmit(id(), {stream.id()}, _lrpc_paramWriter);")
 
-                with self._file.block(f"const auto _lrpc_paramWriter = [{response}](Writer &writer)", ";"):
-                    for r in returns:
-                        self._file.write(f"lrpc::write_unchecked<{r.rw_type()}>({self._write_params(r)});")
+    def write_batch(self, stream: LrpcStream, sample_size: int) -> None:
+        buffer_size = stream.batch_size() * sample_size
+        self._file.write(f"lrpc::StreamBatch<{buffer_size}> {self._batch_name(stream)}{{{stream.batch_size()}}};")
 
-                self._file.write(f"server().transmit(id(), {stream.id()}, _lrpc_paramWriter);")
+    def write_sequence_number(self, stream: LrpcStream) -> None:
+        self._file.write(f"uint8_t {self._sequence_name(stream)}{{0}};")
+
+    def write_rate_limit(self, stream: LrpcStream) -> None:
+        max_rate = stream.max_rate()
+        if max_rate is None:
+            raise ValueError(f"Stream {stream.name()} is not rate limited")
+
+        # Round up, so that the rate never exceeds the maximum
+        interval_us = -(-1_000_000 // max_rate)
+        self._file.write(f"lrpc::RateLimit {self._rate_limit_name(stream)}{{{interval_us}}};")
+
+    def _write_batched_response(self, stream: LrpcStream) -> None:
+        returns = stream.returns()
+        batch = self._batch_name(stream)
+
+        with self._file.block(f"void {stream.name()}_response({self._response_params(returns)})"):
+            self._write_rate_limit_check(stream)
+            if len(returns) == 0 and not stream.has_sequence_number():
+                self._file.write("const auto _lrpc_paramWriter = [](Writer &) {};")
+            else:
+                self._write_param_writer(stream)
+
+            flush_condition = f"{batch}.append(_lrpc_paramWriter)"
+            if stream.is_finite():
+                flush_condition += " || final"
+
+            with self._file.block(f"if ({flush_condition})"):
+                self._file.write(f"{stream.name()}_flush();")
+
+    def _write_flush(self, stream: LrpcStream) -> None:
+        batch = self._batch_name(stream)
+
+        with self._file.block(f"void {stream.name()}_flush()"):
+            with self._file.block(f"if ({batch}.empty())", trailing_newline=True):
+                self._file.write("return;")
+
+            with self._file.block("const auto _lrpc_batchWriter = [this](Writer &writer)", ";"):
+                self._file.write(f"{batch}.writeTo(writer);")
+
+            self._file.write(f"server().transmit(id(), {stream.id()}, _lrpc_batchWriter);")
+
+    def _write_rate_limit_check(self, stream: LrpcStream) -> None:
+        if not stream.is_rate_limited():
+            return
+
+        with self._file.block(f"if (!{self._rate_limit_name(stream)}.allow(lrpcTimeUs()))", trailing_newline=True):
+            self._file.write("return;")
+
+    def _write_param_writer(self, stream: LrpcStream) -> None:
+        returns = stream.returns()
+        captures = [f"&{r.name()}" for r in returns]
+
+        if stream.has_sequence_number():
+            sequence = self._sequence_name(stream)
+            self._file.write(f"const auto _lrpc_sequence = {sequence};")
+            self._file.write(f"{sequence} = static_cast<uint8_t>({sequence} + 1U);")
+            captures.insert(0, "_lrpc_sequence")
+
+        with self._file.block(f"const auto _lrpc_paramWriter = [{', '.join(captures)}](Writer &writer)", ";"):
+            if stream.has_sequence_number():
+                self._file.write("lrpc::write_unchecked<uint8_t>(writer, _lrpc_sequence);")
+            for r in returns:
+                self._file.write(f"lrpc::write_unchecked<{r.rw_type()}>({self._write_params(r)});")
+
+    @staticmethod
+    def _batch_name(stream: LrpcStream) -> str:
+        return f"_lrpc_{stream.name()}_batch"
+
+    @staticmethod
+    def _sequence_name(stream: LrpcStream) -> str:
+        return f"_lrpc_{stream.name()}_sequence"
+
+    @staticmethod
+    def _rate_limit_name(stream: LrpcStream) -> str:
+        return f"_lrpc_{stream.name()}_rateLimit"
 
     @staticmethod
     def _write_params(var: LrpcVar) -> str:
@@ -30,7 +113,3 @@ class ServerStreamResponseWriter:
     @staticmethod
     def _response_params(params: list[LrpcVar]) -> str:
         return ", ".join([f"{p.param_type()} {p.name()}" for p in params])
-
-    @staticmethod
-    def _response_captures(params: list[LrpcVar]) -> str:
-        return ", ".join([f"&{p.name()}" for p in params])
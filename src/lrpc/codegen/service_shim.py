@@ -1,29 +1,56 @@
+import copy
+from concurrent.futures import Executor, Future
 from pathlib import Path
 
 from lrpc.codegen.client_stream_shim_writer import ClientStreamShimWriter
+from lrpc.codegen.codec_table import LrpcCodec, supports_function_table
 from lrpc.codegen.common import write_file_banner
 from lrpc.codegen.cppfile import CppFile
 from lrpc.codegen.function_shim_writer import FunctionShimWriter
+from lrpc.codegen.function_table_writer import FunctionTableWriter
+from lrpc.codegen.output_files import submit_tracked
 from lrpc.codegen.server_stream_response_writer import ServerStreamResponseWriter
 from lrpc.codegen.utils import optionally_in_namespace
-from lrpc.core import LrpcFun, LrpcService, LrpcStream, LrpcVar, RpcSettings
+from lrpc.core import LrpcDef, LrpcFun, LrpcService, LrpcStream, LrpcVar, RpcSettings
+from lrpc.core.buffer_size import MessageSize, request_sizes, required_service_buffer_size, response_sizes
+from lrpc.core.encoded_size import stream_message_size
 from lrpc.visitors import LrpcVisitor
 
 
 class ServiceShimVisitor(LrpcVisitor):
-    def __init__(self, output: Path) -> None:
+    def __init__(self, output: Path, executor: Executor | None = None, codec: LrpcCodec = "inline") -> None:
         self._file: CppFile
+        self._codec = codec
         self._namespace: str | None
         self._output = output
         self._service: LrpcService
+        self._lrpc_def: LrpcDef
+        self._executor = executor
+        self._jobs: list[Future[None]] = []
+        self._request_sizes: list[MessageSize]
+        self._response_sizes: list[MessageSize]
 
-    def visit_lrpc_service_end(self) -> None:
-        self._file.close()
+    def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
+        self._lrpc_def = lrpc_def
+        self._request_sizes = request_sizes(lrpc_def)
+        self._response_sizes = response_sizes(lrpc_def)
 
     def visit_rpc_settings(self, settings: RpcSettings) -> None:
         self._namespace = settings.namespace()
 
     def visit_lrpc_service(self, service: LrpcService) -> None:
+        if self._executor is None:
+            self.write_shim_file(service)
+        else:
+            # The service is written by a copy of the visitor, because the visitor has state per service
+            self._jobs.append(submit_tracked(self._executor, copy.copy(self).write_shim_file, service))
+
+    def visit_lrpc_def_end(self) -> None:
+        for job in self._jobs:
+            job.result()
+        self._jobs = []
+
+    def write_shim_file(self, service: LrpcService) -> None:
         self._file = CppFile(f"{self._output.absolute()}/{service.name()}_shim.hpp")
         self._service = service
 
@@ -31,6 +58,7 @@ class ServiceShimVisitor(LrpcVisitor):
         self._write_include_guard()
         self._write_includes()
         optionally_in_namespace(self._file, self._write_aliases_and_service_shim, self._namespace)
+        self._file.close()
 
     def _write_aliases_and_service_shim(self) -> None:
         self._write_service_id()
@@ -45,6 +73,7 @@ class ServiceShimVisitor(LrpcVisitor):
         with self._file.block(f"class {self._shim_name()} : public lrpc::Service", ";"):
             self._file.label("public")
             self._write_return_type_aliases(functions)
+            self._write_required_buffer_sizes()
             self._file(f"~{self._shim_name()}() override = default;")
             self._file.newline()
             self._file(f"uint8_t id() const override {{ return {self._id_name()}; }}")
@@ -60,16 +89,39 @@ class ServiceShimVisitor(LrpcVisitor):
             self._write_client_stream_stop_requests(client_streams)
 
             self._write_function_declarations(functions)
-            self._write_function_shims(functions)
+            self._write_function_shims([f for f in functions if not self._uses_function_table(f)])
 
             self._write_client_stream_declarations(client_streams)
             self._write_client_stream_shims(client_streams)
 
             self._write_server_stream_declarations(server_streams)
+            self._write_time_source_declaration(server_streams)
             self._write_server_stream_stop_request_shims(server_streams)
 
             self._file.label("private")
             self._write_shim_array(functions, client_streams, server_streams)
+            self._write_function_table([f for f in functions if self._uses_function_table(f)])
+            self._write_server_stream_batches(server_streams)
+            self._write_server_stream_sequence_numbers(server_streams)
+            self._write_server_stream_rate_limits(server_streams)
+
+    def _uses_function_table(self, function: LrpcFun) -> bool:
+        return (self._codec == "table") and supports_function_table(function, self._lrpc_def)
+
+    def _write_function_table(self, functions: list[LrpcFun]) -> None:
+        if len(functions) == 0:
+            return
+
+        self._file.newline()
+        FunctionTableWriter(self._file, self._shim_name(), self._namespace).write_function_table(functions)
+
+    def _write_required_buffer_sizes(self) -> None:
+        rx = required_service_buffer_size(self._request_sizes, self._service.name())
+        tx = required_service_buffer_size(self._response_sizes, self._service.name())
+        self._file.write("// Smallest server buffers that fit all messages. Auto strings and bytearrays count as empty")
+        self._file.write(f"static constexpr size_t RequiredRxBufferSize{{{rx}}};")
+        self._file.write(f"static constexpr size_t RequiredTxBufferSize{{{tx}}};")
+        self._file.newline()
 
     def _write_function_declarations(self, functions: list[LrpcFun]) -> None:
         if len(functions) != 0:
@@ -104,6 +156,14 @@ class ServiceShimVisitor(LrpcVisitor):
             self._file.write(f"virtual void {stream.name()}_stop() = 0;")
             self._file.newline()
 
+    def _write_time_source_declaration(self, server_streams: list[LrpcStream]) -> None:
+        if not any(s.is_rate_limited() for s in server_streams):
+            return
+
+        self._file.write("// Time source for rate limited server streams")
+        self._file.write("virtual uint32_t lrpcTimeUs() const = 0;")
+        self._file.newline()
+
     def _write_function_shims(self, functions: list[LrpcFun]) -> None:
         if len(functions) != 0:
             self._file.write("// Function shims")
@@ -133,6 +193,39 @@ class ServiceShimVisitor(LrpcVisitor):
             writer.write_response(stream)
             self._file.newline()
 
+    def _write_server_stream_batches(self, server_streams: list[LrpcStream]) -> None:
+        batched_streams = [s for s in server_streams if s.is_batched()]
+        if len(batched_streams) == 0:
+            return
+
+        self._file.newline()
+        writer = ServerStreamResponseWriter(self._file)
+        for stream in batched_streams:
+            sample_size = stream_message_size(stream, self._lrpc_def).maximum
+            if sample_size is None:
+                raise ValueError(f"Unable to determine the batch size of stream {stream.name()}")
+            writer.write_batch(stream, sample_size)
+
+    def _write_server_stream_sequence_numbers(self, server_streams: list[LrpcStream]) -> None:
+        sequenced_streams = [s for s in server_streams if s.has_sequence_number()]
+        if len(sequenced_streams) == 0:
+            return
+
+        self._file.newline()
+        writer = ServerStreamResponseWriter(self._file)
+        for stream in sequenced_streams:
+            writer.write_sequence_number(stream)
+
+    def _write_server_stream_rate_limits(self, server_streams: list[LrpcStream]) -> None:
+        rate_limited_streams = [s for s in server_streams if s.is_rate_limited()]
+        if len(rate_limited_streams) == 0:
+            return
+
+        self._file.newline()
+        writer = ServerStreamResponseWriter(self._file)
+        for stream in rate_limited_streams:
+            writer.write_rate_limit(stream)
+
     def _write_server_stream_stop_request_shims(self, server_streams: list[LrpcStream]) -> None:
         if len(server_streams) != 0:
             self._file.write("// Server stream start/stop shims")
@@ -176,7 +269,10 @@ class ServiceShimVisitor(LrpcVisitor):
                 ";",
                 trailing_newline=True,
             ):
-                function_info = {function.id(): function.name() for function in functions}
+                function_info = {
+                    function.id(): "function_table" if self._uses_function_table(function) else function.name()
+                    for function in functions
+                }
                 client_stream_info = {stream.id(): stream.name() for stream in client_streams}
                 server_stream_info = {stream.id(): stream.name() + "_start_stop" for stream in server_streams}
 
@@ -222,8 +318,15 @@ class ServiceShimVisitor(LrpcVisitor):
         self._file.pragma_once()
 
     def _write_includes(self) -> None:
+        uses_function_table = any(self._uses_function_table(f) for f in self._service.functions())
+        if uses_function_table:
+            self._file.include("<cstddef>")
+            self._file.include("<cstring>")
+            self._file.include("<type_traits>")
         self._file.include('"lrpccore/Service.hpp"')
         self._file.include('"lrpccore/EtlRwExtensions.hpp"')
+        if uses_function_table:
+            self._file.include('"lrpccore/TableCodec.hpp"')
         self._file.include(f'"{self._service.name()}_includes.hpp"')
 
         self._file.newline()
@@ -1,22 +1,28 @@
 from pathlib import Path
 
+from lrpc.codegen.codec_table import LrpcCodec, supports_table_codec
 from lrpc.codegen.common import lrpc_var_includes, write_file_banner
 from lrpc.codegen.cppfile import CppFile
 from lrpc.codegen.struct_codec_writer import StructCodecWriter
 from lrpc.codegen.utils import optionally_in_namespace
-from lrpc.core import LrpcStruct, LrpcVar, RpcSettings
+from lrpc.core import LrpcDef, LrpcStruct, LrpcVar, RpcSettings
 from lrpc.visitors import LrpcVisitor
 
 
 class StructFileVisitor(LrpcVisitor):
-    def __init__(self, output: Path) -> None:
+    def __init__(self, output: Path, codec: LrpcCodec = "inline") -> None:
         self._output = output
+        self._codec = codec
         self._namespace: str | None
+        self._lrpc_def: LrpcDef
         self._file: CppFile
         self._descriptor: LrpcStruct
         self._alias: str = ""
         self._includes: set[tuple[str, bool]] = set()
 
+    def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
+        self._lrpc_def = lrpc_def
+
     def visit_rpc_settings(self, settings: RpcSettings) -> None:
         self._namespace = settings.namespace()
 
@@ -102,6 +108,10 @@ class StructFileVisitor(LrpcVisitor):
         self._includes.add(('"lrpccore/EtlRwExtensions.hpp"', False))
         if self._descriptor.is_external():
             self._includes.add((f'"{self._descriptor.external_file()}"', False))
+        if self._uses_table_codec():
+            self._includes.add(("<cstddef>", False))
+            self._includes.add(("<type_traits>", False))
+            self._includes.add(('"lrpccore/TableCodec.hpp"', False))
         for path, _ in sorted(self._includes):
             self._file.include(path)
 
@@ -123,12 +133,22 @@ class StructFileVisitor(LrpcVisitor):
         ):
             self._file("return !(first == second);")
 
+    def _uses_table_codec(self) -> bool:
+        return (self._codec == "table") and supports_table_codec(self._descriptor, self._lrpc_def)
+
     def _write_codec(self) -> None:
         codec_writer = StructCodecWriter(self._file, self._descriptor, self._namespace)
         with self._file.block("namespace lrpc"):
-            codec_writer.write_decoder()
-            self._file.newline()
-            codec_writer.write_encoder()
+            if self._uses_table_codec():
+                codec_writer.write_field_table()
+                self._file.newline()
+                codec_writer.write_table_decoder()
+                self._file.newline()
+                codec_writer.write_table_encoder()
+            else:
+                codec_writer.write_decoder()
+                self._file.newline()
+                codec_writer.write_encoder()
 
     def _write_struct_field(self, f: LrpcVar) -> None:
         self._file(f"{f.field_type()} {f.name()};")
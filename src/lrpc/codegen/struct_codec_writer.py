@@ -1,3 +1,4 @@
+from lrpc.codegen.codec_table import enum_size_assertion, field_descriptor
 from lrpc.codegen.common import rw_read_params, rw_write_params
 from lrpc.codegen.cppfile import CppFile
 from lrpc.core import LrpcStruct, LrpcVar
@@ -15,10 +16,14 @@ class StructCodecWriter:
         with self._file.block(
             f"inline void write_unchecked<{name}>(etl::byte_stream_writer& writer, const {name}& value)",
         ):
-            for f in self._descriptor.fields():
-                t = f.rw_type(self._namespace)
-                p = StructCodecWriter._write_params(f)
-                self._file.write(f"lrpc::write_unchecked<{t}>({p});")
+            for index, group in enumerate(self._descriptor.field_groups()):
+                if group[0].is_bit_field():
+                    self._write_bit_fields(group, f"bitWriter{index}")
+                else:
+                    f = group[0]
+                    t = f.rw_type(self._namespace)
+                    p = StructCodecWriter._write_params(f)
+                    self._file.write(f"lrpc::write_unchecked<{t}>({p});")
 
     def write_decoder(self) -> None:
         self._file("template<>")
@@ -26,14 +31,65 @@ class StructCodecWriter:
         with self._file.block(f"inline {name} read_unchecked<{name}>(etl::byte_stream_reader& reader)"):
             self._file(f"{name} value {{}};")
 
+            for index, group in enumerate(self._descriptor.field_groups()):
+                if group[0].is_bit_field():
+                    self._read_bit_fields(group, f"bitReader{index}")
+                else:
+                    f = group[0]
+                    assignment = StructCodecWriter._read_assignment(f)
+                    t = f.rw_type(self._namespace)
+                    p = StructCodecWriter._read_params(f)
+                    self._file.write(f"{assignment}lrpc::read_unchecked<{t}>({p});")
+
+            self._file("return value;")
+
+    def write_field_table(self) -> None:
+        name = self._name()
+        self._file("template<>")
+        with self._file.block(f"inline lrpc::span<const lrpc::FieldDescriptor> fieldTable<{name}>()"):
+            self._file.write(
+                f"static_assert(std::is_standard_layout<{name}>::value, "
+                '"Table codec requires a standard layout struct");',
+            )
             for f in self._descriptor.fields():
-                assignment = StructCodecWriter._read_assignment(f)
-                t = f.rw_type(self._namespace)
-                p = StructCodecWriter._read_params(f)
-                self._file.write(f"{assignment}lrpc::read_unchecked<{t}>({p});")
+                if f.base_type_is_enum():
+                    self._file.write(enum_size_assertion(name, f))
+
+            with self._file.block("static constexpr lrpc::FieldDescriptor fields[]", ";"):
+                for f in self._descriptor.fields():
+                    self._file.write(f"{field_descriptor(name, f, self._namespace)},")
+
+            self._file("return fields;")
+
+    def write_table_encoder(self) -> None:
+        name = self._name()
+        self._file("template<>")
+        with self._file.block(
+            f"inline void write_unchecked<{name}>(etl::byte_stream_writer& writer, const {name}& value)",
+        ):
+            self._file.write(f"lrpc::writeFields(writer, &value, fieldTable<{name}>());")
 
+    def write_table_decoder(self) -> None:
+        name = self._name()
+        self._file("template<>")
+        with self._file.block(f"inline {name} read_unchecked<{name}>(etl::byte_stream_reader& reader)"):
+            self._file(f"{name} value {{}};")
+            self._file.write(f"lrpc::readFields(reader, &value, fieldTable<{name}>());")
             self._file("return value;")
 
+    def _write_bit_fields(self, bit_fields: list[LrpcVar], bit_writer: str) -> None:
+        self._file(f"lrpc::BitWriter {bit_writer}{{writer}};")
+        for f in bit_fields:
+            self._file(f"{bit_writer}.write(static_cast<uint64_t>(value.{f.name()}), {f.bit_width()});")
+        self._file(f"{bit_writer}.flush();")
+
+    def _read_bit_fields(self, bit_fields: list[LrpcVar], bit_reader: str) -> None:
+        self._file(f"lrpc::BitReader {bit_reader}{{reader}};")
+        for f in bit_fields:
+            t = f.rw_type(self._namespace)
+            read = "readSigned" if f.base_type_is_signed() else "read"
+            self._file(f"value.{f.name()} = static_cast<{t}>({bit_reader}.{read}({f.bit_width()}));")
+
     def _name(self) -> str:
         return f"{self._namespace}::{self._descriptor.name()}" if self._namespace else self._descriptor.name()
 
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Final
+
+from .encoded_size import (
+    MESSAGE_HEADER_SIZE,
+    EncodedSize,
+    function_request_size,
+    function_response_size,
+    stream_request_size,
+    stream_response_size,
+)
+
+if TYPE_CHECKING:
+    from .definition import LrpcDef
+    from .service import LrpcService
+
+# Largest receive and transmit buffer supported by the C++ server
+MAX_BUFFER_SIZE: Final = 256
+
+
+@dataclass(frozen=True)
+class MessageSize:
+    """Encoded size of a complete message, including the message header"""
+
+    kind: str
+    service: str
+    name: str
+    size: EncodedSize
+
+    def is_bounded(self) -> bool:
+        # A message can never be larger than the largest buffer. A larger maximum therefore means
+        # that the message contains auto strings or bytearrays that are limited by the buffer size
+        return (self.size.maximum is not None) and (self.size.maximum <= MAX_BUFFER_SIZE)
+
+    def required_buffer_size(self) -> int:
+        # Variable size data occupies whatever space is left in the buffer, so only the minimum size is required
+        return self.size.maximum if (self.is_bounded() and self.size.maximum is not None) else self.size.minimum
+
+    def description(self) -> str:
+        return f"{self.kind} {self.service}.{self.name}"
+
+
+def request_sizes(lrpc_def: "LrpcDef") -> list[MessageSize]:
+    """Sizes of all messages from client to server, i.e. the messages in the receive buffer of the server"""
+    sizes: list[MessageSize] = []
+    for service in [*lrpc_def.services(), lrpc_def.meta_service()]:
+        sizes.extend(
+            MessageSize("Function", service.name(), f.name(), function_request_size(f, lrpc_def))
+            for f in service.functions()
+        )
+        sizes.extend(
+            MessageSize("Stream", service.name(), s.name(), stream_request_size(s, lrpc_def)) for s in service.streams()
+        )
+
+    return sizes
+
+
+def response_sizes(lrpc_def: "LrpcDef") -> list[MessageSize]:
+    """Sizes of all messages from server to client, i.e. the messages in the transmit buffer of the server"""
+    sizes: list[MessageSize] = []
+    for service in lrpc_def.services():
+        sizes.extend(
+            MessageSize("Function", service.name(), f.name(), function_response_size(f, lrpc_def))
+            for f in service.functions()
+        )
+        # Client streams have no response
+        stream_sizes = [(s, stream_response_size(s, lrpc_def)) for s in service.streams()]
+        sizes.extend(
+            MessageSize("Batched stream" if s.is_batched() else "Stream", service.name(), s.name(), size)
+            for s, size in stream_sizes
+            if size is not None
+        )
+
+    sizes.extend(_meta_response_sizes(lrpc_def.meta_service(), lrpc_def))
+    return sizes
+
+
+def _meta_response_sizes(meta: "LrpcService", lrpc_def: "LrpcDef") -> list[MessageSize]:
+    # The content of the strings in the version response is known at generation time. The
+    # server does not add a message to errors and the definition stream chunks adapt to the
+    # transmit buffer. Therefore all meta messages have a known size
+    sizes = []
+    for f in meta.functions():
+        size = function_response_size(f, lrpc_def)
+        if f.name() == "version":
+            strings = [lrpc_def.settings().version() or "", lrpc_def.definition_hash() or "", version("lotusrpc")]
+            known = MESSAGE_HEADER_SIZE + sum(len(s) + 1 for s in strings)
+            size = EncodedSize(known, known)
+        sizes.append(MessageSize("Function", meta.name(), f.name(), EncodedSize(size.minimum, size.minimum)))
+
+    for s in meta.streams():
+        stream_size = stream_response_size(s, lrpc_def)
+        if stream_size is not None:
+            minimum = stream_size.minimum
+            sizes.append(MessageSize("Stream", meta.name(), s.name(), EncodedSize(minimum, minimum)))
+
+    return sizes
+
+
+def required_buffer_size(sizes: list[MessageSize]) -> int:
+    return max(s.required_buffer_size() for s in sizes)
+
+
+def required_service_buffer_size(sizes: list[MessageSize], service: str) -> int:
+    """Smallest buffer that fits all messages of a single service. 0 if the service has no messages in the buffer"""
+    return max((s.required_buffer_size() for s in sizes if s.service == service), default=0)
+
+
+def auto_buffer_size(sizes: list[MessageSize]) -> int:
+    """Smallest buffer size that fits all messages. Messages with auto strings or
+    bytearrays can be as large as the buffer, so they get the largest buffer possible"""
+    if not all(s.is_bounded() for s in sizes):
+        return MAX_BUFFER_SIZE
+
+    return min(required_buffer_size(sizes), MAX_BUFFER_SIZE)
@@ -33,8 +33,9 @@ LrpcConstantType = int | float | bool | str | bytes
 
 
 class LrpcConstant:
-    def __init__(self, raw: LrpcConstantDict) -> None:
-        LrpcConstantValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcConstantDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcConstantValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._name: str = raw["name"]
         self._value = self._init_value(raw)
@@ -2,7 +2,7 @@ import hashlib
 import lzma
 
 # pylint: disable = unused-import
-from collections.abc import Iterable  # noqa: TC003
+from collections.abc import Collection, Iterable
 from copy import deepcopy
 from pathlib import Path
 from typing import cast
@@ -13,6 +13,7 @@ from typing_extensions import NotRequired, TypeAliasType, TypedDict
 
 from lrpc.visitors import LrpcVisitor
 
+from .buffer_size import auto_buffer_size, request_sizes, response_sizes
 from .constant import LrpcConstant, LrpcConstantDict, LrpcConstantType
 from .enum import LrpcEnum, LrpcEnumDict
 from .function import LrpcFun
@@ -61,13 +62,18 @@ class LrpcDef:
         with destination.open("wt+") as dest:
             dest.write(LrpcDef._decompressed(compressed))
 
-    def __init__(self, raw_: LrpcDefDict) -> None:
+    def __init__(self, raw_: LrpcDefDict, *, trusted: bool = False) -> None:
+        """Validates the raw definition as a whole. The objects that make up the definition are
+        constructed as trusted, i.e. without validating their part of the definition again.
+        Only use trusted=True for a definition that has already been validated, e.g. one that
+        is loaded from a cache of definitions that were validated before"""
         raw = deepcopy(raw_)
-        LrpcDefValidator.validate_python(raw, strict=True, extra="forbid")
+        if not trusted:
+            LrpcDefValidator.validate_python(raw, strict=True, extra="forbid")
         self._definition_yaml = yaml.dump(raw, sort_keys=False)
 
         self._name = raw["name"]
-        self._settings = RpcSettings(raw.get("settings", {}))
+        self._settings = RpcSettings(raw.get("settings", {}), trusted=True)
 
         struct_names = []
         if "structs" in raw:
@@ -82,22 +88,24 @@ class LrpcDef:
         self._init_service_ids(raw)
         self._init_definition_hash()
 
-        self._services = [LrpcService(cast(LrpcServiceDict, s)) for s in raw["services"]]
+        self._services = [LrpcService(cast(LrpcServiceDict, s), trusted=True) for s in raw["services"]]
 
         self._structs = []
         if "structs" in raw:
-            self._structs.extend([LrpcStruct(s) for s in raw["structs"]])
+            self._structs.extend([LrpcStruct(s, trusted=True) for s in raw["structs"]])
 
         self._enums = []
         if "enums" in raw:
-            self._enums.extend([LrpcEnum(s) for s in raw["enums"]])
+            self._enums.extend([LrpcEnum(s, trusted=True) for s in raw["enums"]])
 
         self._constants = []
         if "constants" in raw:
-            self._constants.extend([LrpcConstant(c) for c in raw["constants"]])
+            self._constants.extend([LrpcConstant(c, trusted=True) for c in raw["constants"]])
 
         self._user_settings = raw.get("user_settings", None)
 
+        self._init_auto_buffer_sizes()
+
     def _init_all_vars(self, raw: LrpcDefDict, struct_names: list[str], enum_names: list[str]) -> None:
         for service in raw["services"]:
             for function in service.get("functions", []):
@@ -119,7 +127,7 @@ class LrpcDef:
         for s in raw["services"]:
             if s["name"] == "LrpcMeta":
                 s["id"] = self.META_SERVICE_ID
-                self._meta_service = LrpcService(cast(LrpcServiceDict, s))
+                self._meta_service = LrpcService(cast(LrpcServiceDict, s), trusted=True)
                 raw["services"].remove(s)
                 meta_service_found = True
 
@@ -145,13 +153,36 @@ class LrpcDef:
                 last_service_id = last_service_id + 1
                 s["id"] = last_service_id
 
+    def _init_auto_buffer_sizes(self) -> None:
+        rx_is_auto = self._settings.rx_buffer_size_is_auto()
+        tx_is_auto = self._settings.tx_buffer_size_is_auto()
+        if not (rx_is_auto or tx_is_auto):
+            return
+
+        try:
+            rx = auto_buffer_size(request_sizes(self)) if rx_is_auto else self._settings.rx_buffer_size()
+            tx = auto_buffer_size(response_sizes(self)) if tx_is_auto else self._settings.tx_buffer_size()
+        except (KeyError, ValueError):
+            # Undeclared custom types are reported by the semantic analyzer
+            return
+
+        self._settings.resolve_auto_buffer_sizes(rx, tx)
+
     def _init_definition_hash(self) -> None:
         definition_hash = hashlib.sha3_256(self._definition_yaml.encode(encoding="utf-8")).hexdigest()
         definition_hash_length = self._settings.definition_hash_length()
         definition_hash_length = min(definition_hash_length, len(definition_hash))
         self._definition_hash = None if definition_hash_length == 0 else definition_hash[:definition_hash_length]
 
-    def accept(self, visitor: LrpcVisitor, *, visit_meta_service: bool = True) -> None:
+    def accept(
+        self,
+        visitor: LrpcVisitor,
+        *,
+        visit_meta_service: bool = True,
+        services: Collection[str] | None = None,
+    ) -> None:
+        """Visit the definition. With services, only the services with these names are visited, e.g.
+        to validate or generate only the services that changed. All other parts are always visited"""
         visitor.visit_lrpc_def(self)
 
         visitor.visit_rpc_settings(self._settings)
@@ -169,9 +200,10 @@ class LrpcDef:
             struct.accept(visitor)
 
         for service in self.services():
-            service.accept(visitor)
+            if (services is None) or (service.name() in services):
+                service.accept(visitor)
 
-        if visit_meta_service:
+        if visit_meta_service and ((services is None) or (self._meta_service.name() in services)):
             self._meta_service.accept(visitor)
 
         visitor.visit_lrpc_user_settings(self.user_settings())
@@ -0,0 +1,137 @@
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from .stream import LrpcStream
+
+if TYPE_CHECKING:
+    from .definition import LrpcDef
+    from .function import LrpcFun
+    from .struct import LrpcStruct
+    from .var import LrpcVar
+
+# Bytearray size is encoded in a single byte
+BYTEARRAY_MAX_SIZE: Final = 255
+# Stream sequence number is encoded in a single byte
+SEQUENCE_NUMBER_SIZE: Final = 1
+# Message size, service ID and function or stream ID
+MESSAGE_HEADER_SIZE: Final = 3
+# Message header and number of messages in the batch
+BATCH_HEADER_SIZE: Final = MESSAGE_HEADER_SIZE + 1
+
+
+@dataclass(frozen=True)
+class EncodedSize:
+    """Number of bytes that a value occupies on the wire. A maximum of
+    None means that the size is only limited by the size of the message"""
+
+    minimum: int
+    maximum: int | None
+
+    def is_bounded(self) -> bool:
+        return self.maximum is not None
+
+    def __add__(self, other: "EncodedSize") -> "EncodedSize":
+        maximum = None if (self.maximum is None or other.maximum is None) else self.maximum + other.maximum
+        return EncodedSize(self.minimum + other.minimum, maximum)
+
+    def __mul__(self, factor: int) -> "EncodedSize":
+        maximum = None if self.maximum is None else self.maximum * factor
+        return EncodedSize(self.minimum * factor, maximum)
+
+
+def _fixed(size: int) -> EncodedSize:
+    return EncodedSize(size, size)
+
+
+def encoded_size(var: "LrpcVar", lrpc_def: "LrpcDef") -> EncodedSize:
+    if var.is_array():
+        return encoded_size(var.contained(), lrpc_def) * var.array_size()
+
+    if var.is_optional():
+        contained = encoded_size(var.contained(), lrpc_def)
+        maximum = None if contained.maximum is None else contained.maximum + 1
+        return EncodedSize(1, maximum)
+
+    if var.base_type_is_struct():
+        return _struct_size(lrpc_def.struct(var.base_type()), lrpc_def)
+
+    return _scalar_size(var)
+
+
+def _scalar_size(var: "LrpcVar") -> EncodedSize:
+    if var.base_type_is_bytearray():
+        return EncodedSize(1, BYTEARRAY_MAX_SIZE + 1)
+
+    if var.is_auto_string():
+        return EncodedSize(1, None)
+
+    if var.is_fixed_size_string():
+        return _fixed(var.string_size() + 1)
+
+    if var.is_varint():
+        return EncodedSize(1, varint_max_size(var))
+
+    return _fixed(struct.calcsize("<" + var.pack_type()))
+
+
+def bit_field_size(bit_fields: list["LrpcVar"]) -> int:
+    bits = sum(f.bit_width() for f in bit_fields)
+    return (bits + 7) // 8
+
+
+def _struct_size(s: "LrpcStruct", lrpc_def: "LrpcDef") -> EncodedSize:
+    total = _fixed(0)
+    for group in s.field_groups():
+        if group[0].is_bit_field():
+            total += _fixed(bit_field_size(group))
+        else:
+            total += encoded_size(group[0], lrpc_def)
+
+    return total
+
+
+def varint_max_size(var: "LrpcVar") -> int:
+    # Every byte of a varint holds 7 bits of the value
+    bits = struct.calcsize("<" + var.pack_type()) * 8
+    return (bits + 6) // 7
+
+
+def encoded_size_of(lrpc_vars: list["LrpcVar"], lrpc_def: "LrpcDef") -> EncodedSize:
+    total = _fixed(0)
+    for v in lrpc_vars:
+        total += encoded_size(v, lrpc_def)
+
+    return total
+
+
+def stream_message_size(stream: LrpcStream, lrpc_def: "LrpcDef") -> EncodedSize:
+    size = encoded_size_of(stream.returns(), lrpc_def)
+    if stream.has_sequence_number():
+        size += _fixed(SEQUENCE_NUMBER_SIZE)
+
+    return size
+
+
+def function_request_size(function: "LrpcFun", lrpc_def: "LrpcDef") -> EncodedSize:
+    return _fixed(MESSAGE_HEADER_SIZE) + encoded_size_of(function.params(), lrpc_def)
+
+
+def function_response_size(function: "LrpcFun", lrpc_def: "LrpcDef") -> EncodedSize:
+    return _fixed(MESSAGE_HEADER_SIZE) + encoded_size_of(function.returns(), lrpc_def)
+
+
+def stream_request_size(stream: LrpcStream, lrpc_def: "LrpcDef") -> EncodedSize:
+    # For a server stream, this is the message that starts or stops the stream
+    return _fixed(MESSAGE_HEADER_SIZE) + encoded_size_of(stream.params(), lrpc_def)
+
+
+def stream_response_size(stream: LrpcStream, lrpc_def: "LrpcDef") -> EncodedSize | None:
+    if stream.origin() == LrpcStream.Origin.CLIENT:
+        return None
+
+    message = stream_message_size(stream, lrpc_def)
+    if stream.is_batched():
+        return _fixed(BATCH_HEADER_SIZE) + (message * stream.batch_size())
+
+    return _fixed(MESSAGE_HEADER_SIZE) + message
@@ -14,8 +14,9 @@ LrpcEnumFieldValidator = TypeAdapter(LrpcEnumFieldDict)
 
 
 class LrpcEnumField:
-    def __init__(self, raw: LrpcEnumFieldDict) -> None:
-        LrpcEnumFieldValidator.validate_python(raw)
+    def __init__(self, raw: LrpcEnumFieldDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcEnumFieldValidator.validate_python(raw)
 
         self._name = raw["name"]
         self._id = raw["id"]
@@ -48,8 +49,9 @@ LrpcEnumValidator = TypeAdapter(LrpcEnumDict)
 
 
 class LrpcEnum:
-    def __init__(self, raw: LrpcEnumDict) -> None:
-        LrpcEnumValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcEnumDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcEnumValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._name = raw["name"]
         self._fields = raw["fields"]
@@ -81,7 +83,7 @@ class LrpcEnum:
                 f = field["name"]
                 i = field["id"]
 
-            all_fields.append(LrpcEnumField({"name": f, "id": i}))
+            all_fields.append(LrpcEnumField({"name": f, "id": i}, trusted=True))
 
             index = all_fields[-1].id() + 1
 
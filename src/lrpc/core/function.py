@@ -27,17 +27,18 @@ LrpcFunValidator = TypeAdapter(LrpcFunDict)
 
 
 class LrpcFun:
-    def __init__(self, raw: LrpcFunDict) -> None:
-        LrpcFunValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcFunDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcFunValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._params = []
         self._returns = []
 
         if "params" in raw:
-            self._params.extend([LrpcVar(p) for p in raw["params"]])
+            self._params.extend([LrpcVar(p, trusted=True) for p in raw["params"]])
 
         if "returns" in raw:
-            self._returns.extend([LrpcVar(p) for p in raw["returns"]])
+            self._returns.extend([LrpcVar(p, trusted=True) for p in raw["returns"]])
 
         self._returns_alias = raw.get("returns_alias", None)
 
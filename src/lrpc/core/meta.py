@@ -1,6 +1,12 @@
+from enum import IntFlag
+from typing import TYPE_CHECKING, Final
+
 from pydantic import TypeAdapter
 from typing_extensions import TypedDict
 
+if TYPE_CHECKING:
+    from .definition import LrpcDef
+
 
 class MetaVersionResponseDict(TypedDict):
     definition: str
@@ -16,5 +22,44 @@ class MetaErrorResponseDict(TypedDict):
     message: str
 
 
+class MetaCapabilitiesResponseDict(TypedDict):
+    rx_buffer_size: int
+    tx_buffer_size: int
+    max_service_id: int
+    features: int
+
+
+class LrpcMetaFeature(IntFlag):
+    # Bits of the features field of the capabilities response
+    EMBEDDED_DEFINITION = 0x01
+    DEFINITION_HASH = 0x02
+    DEFINITION_VERSION = 0x04
+    BATCHED_STREAMS = 0x08
+    SEQUENCE_NUMBERS = 0x10
+    RATE_LIMITED_STREAMS = 0x20
+    TABLE_CODEC = 0x40
+
+
+# Features that change the format of the messages. A client that disagrees
+# with the server about these features decodes the stream messages incorrectly
+MESSAGE_FORMAT_FEATURES: Final = LrpcMetaFeature.BATCHED_STREAMS | LrpcMetaFeature.SEQUENCE_NUMBERS
+
+
+def stream_features(lrpc_def: "LrpcDef") -> LrpcMetaFeature:
+    """Features of the server that follow from the streams in the definition"""
+    features = LrpcMetaFeature(0)
+    for service in lrpc_def.services():
+        for stream in service.streams():
+            if stream.is_batched():
+                features |= LrpcMetaFeature.BATCHED_STREAMS
+            if stream.has_sequence_number():
+                features |= LrpcMetaFeature.SEQUENCE_NUMBERS
+            if stream.is_rate_limited():
+                features |= LrpcMetaFeature.RATE_LIMITED_STREAMS
+
+    return features
+
+
 # pylint: disable=invalid-name
 MetaVersionResponseValidator = TypeAdapter(MetaVersionResponseDict)
+MetaCapabilitiesResponseValidator = TypeAdapter(MetaCapabilitiesResponseDict)
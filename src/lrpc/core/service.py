@@ -30,8 +30,9 @@ LrpcServiceValidator = TypeAdapter(LrpcServiceDict)
 
 
 class LrpcService:
-    def __init__(self, raw: LrpcServiceDict) -> None:
-        LrpcServiceValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcServiceDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcServiceValidator.validate_python(raw, strict=True, extra="forbid")
 
         functions, streams = self._assign_function_and_stream_ids(
             raw.get("functions", []),
@@ -41,8 +42,8 @@ class LrpcService:
 
         self._name = raw["name"]
         self._id = raw["id"]
-        self._functions = [LrpcFun(f) for f in functions]
-        self._streams = [LrpcStream(s) for s in streams]
+        self._functions = [LrpcFun(f, trusted=True) for f in functions]
+        self._streams = [LrpcStream(s, trusted=True) for s in streams]
 
     @staticmethod
     def _assign_function_and_stream_ids(
@@ -3,6 +3,7 @@ from typing import Literal
 from pydantic import TypeAdapter
 from typing_extensions import NotRequired, TypedDict
 
+LrpcBufferSize = int | Literal["auto"]
 LrpcByteType = Literal["uint8_t", "int8_t", "char", "char8_t", "unsigned char", "signed char", "etl::byte", "std::byte"]
 
 
@@ -11,8 +12,8 @@ class RpcSettingsDict(TypedDict):
     definition_hash_length: NotRequired[int]
     embed_definition: NotRequired[bool]
     namespace: NotRequired[str]
-    rx_buffer_size: NotRequired[int]
-    tx_buffer_size: NotRequired[int]
+    rx_buffer_size: NotRequired[LrpcBufferSize]
+    tx_buffer_size: NotRequired[LrpcBufferSize]
     byte_type: NotRequired[LrpcByteType]
 
 
@@ -21,15 +22,21 @@ RpcSettingsValidator = TypeAdapter(RpcSettingsDict)
 
 
 class RpcSettings:
-    def __init__(self, raw: RpcSettingsDict) -> None:
-        RpcSettingsValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: RpcSettingsDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            RpcSettingsValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._version = raw.get("version", None)
         self._definition_hash_length = raw.get("definition_hash_length", 64)
         self._embed_definition = raw.get("embed_definition", False)
         self._namespace = raw.get("namespace", None)
-        self._rx_buffer_size = raw.get("rx_buffer_size", 256)
-        self._tx_buffer_size = raw.get("tx_buffer_size", 256)
+        rx_buffer_size = raw.get("rx_buffer_size", 256)
+        tx_buffer_size = raw.get("tx_buffer_size", 256)
+        # Automatic buffer sizes are resolved by the definition. Until then the maximum size is used
+        self._rx_buffer_size_is_auto = rx_buffer_size == "auto"
+        self._tx_buffer_size_is_auto = tx_buffer_size == "auto"
+        self._rx_buffer_size = 256 if rx_buffer_size == "auto" else rx_buffer_size
+        self._tx_buffer_size = 256 if tx_buffer_size == "auto" else tx_buffer_size
         self._byte_type: LrpcByteType = raw.get("byte_type", "uint8_t")
 
     def version(self) -> str | None:
@@ -50,5 +57,18 @@ class RpcSettings:
     def tx_buffer_size(self) -> int:
         return self._tx_buffer_size
 
+    def rx_buffer_size_is_auto(self) -> bool:
+        return self._rx_buffer_size_is_auto
+
+    def tx_buffer_size_is_auto(self) -> bool:
+        return self._tx_buffer_size_is_auto
+
+    def resolve_auto_buffer_sizes(self, rx_buffer_size: int, tx_buffer_size: int) -> None:
+        if self._rx_buffer_size_is_auto:
+            self._rx_buffer_size = rx_buffer_size
+
+        if self._tx_buffer_size_is_auto:
+            self._tx_buffer_size = tx_buffer_size
+
     def byte_type(self) -> LrpcByteType:
         return self._byte_type
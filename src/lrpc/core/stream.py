@@ -13,6 +13,9 @@ class LrpcStreamDict(TypedDict):
     id: int
     origin: str
     finite: NotRequired[bool]
+    batch: NotRequired[int]
+    sequence: NotRequired[bool]
+    max_rate: NotRequired[int]
     params: NotRequired[list[LrpcVarDict]]
 
 
@@ -21,6 +24,9 @@ class LrpcStreamOptionalIdDict(TypedDict):
     id: NotRequired[int]
     origin: str
     finite: NotRequired[bool]
+    batch: NotRequired[int]
+    sequence: NotRequired[bool]
+    max_rate: NotRequired[int]
     params: NotRequired[list[LrpcVarDict]]
 
 
@@ -33,27 +39,31 @@ class LrpcStream:
         CLIENT = "client"
         SERVER = "server"
 
-    def __init__(self, raw: LrpcStreamDict) -> None:
-        LrpcStreamValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcStreamDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcStreamValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._name = raw["name"]
         self._id = raw["id"]
         self._origin = LrpcStream.Origin(raw["origin"])
         self._is_finite = raw.get("finite", False)
+        self._batch_size = raw.get("batch", 1)
+        self._has_sequence_number = raw.get("sequence", False)
+        self._max_rate = raw.get("max_rate")
         self._params = []
         self._returns = []
 
         params = []
         if "params" in raw:
-            params.extend([LrpcVar(p) for p in raw["params"]])
+            params.extend([LrpcVar(p, trusted=True) for p in raw["params"]])
 
         if self.is_finite():
-            params.append(LrpcVar({"name": "final", "type": "bool"}))
+            params.append(LrpcVar({"name": "final", "type": "bool"}, trusted=True))
 
         if self.origin() == LrpcStream.Origin.CLIENT:
             self._params = params
         else:
-            self._params.append(LrpcVar({"name": "start", "type": "bool"}))
+            self._params.append(LrpcVar({"name": "start", "type": "bool"}, trusted=True))
             self._returns = params
 
     def accept(self, visitor: LrpcVisitor) -> None:
@@ -102,3 +112,18 @@ class LrpcStream:
 
     def is_finite(self) -> bool:
         return self._is_finite
+
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def is_batched(self) -> bool:
+        return self._batch_size > 1
+
+    def has_sequence_number(self) -> bool:
+        return self._has_sequence_number
+
+    def max_rate(self) -> int | None:
+        return self._max_rate
+
+    def is_rate_limited(self) -> bool:
+        return self._max_rate is not None
@@ -11,6 +11,7 @@ class LrpcStructDict(TypedDict):
     fields: list[LrpcVarDict]
     external: NotRequired[str]
     external_namespace: NotRequired[str]
+    packed: NotRequired[bool]
 
 
 # pylint: disable=invalid-name
@@ -18,14 +19,24 @@ LrpcStructValidator = TypeAdapter(LrpcStructDict)
 
 
 class LrpcStruct:
-    def __init__(self, raw: LrpcStructDict) -> None:
-        LrpcStructValidator.validate_python(raw, strict=True, extra="forbid")
+    def __init__(self, raw: LrpcStructDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcStructValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._name = raw["name"]
-        self._fields = [LrpcVar(f) for f in raw["fields"]]
+        self._is_packed = raw.get("packed", False)
+        self._fields = [LrpcVar(self._field(f), trusted=True) for f in raw["fields"]]
         self._external = raw.get("external", None)
         self._external_namespace = raw.get("external_namespace", None)
 
+    def _field(self, raw: LrpcVarDict) -> LrpcVarDict:
+        # In a packed struct, every bool without explicit bit width occupies a single bit
+        is_plain_bool = (raw["type"] == "bool") and ("count" not in raw)
+        if self._is_packed and is_plain_bool and ("bits" not in raw):
+            return {**raw, "bits": 1}
+
+        return raw
+
     def accept(self, visitor: LrpcVisitor) -> None:
         visitor.visit_lrpc_struct(self)
 
@@ -40,6 +51,21 @@ class LrpcStruct:
     def fields(self) -> list[LrpcVar]:
         return self._fields
 
+    def is_packed(self) -> bool:
+        return self._is_packed
+
+    def field_groups(self) -> list[list[LrpcVar]]:
+        # Fields in the order of encoding. Adjacent bit fields are grouped
+        # together, every other field is in a group of its own
+        groups: list[list[LrpcVar]] = []
+        for f in self.fields():
+            if f.is_bit_field() and (len(groups) != 0) and groups[-1][0].is_bit_field():
+                groups[-1].append(f)
+            else:
+                groups.append([f])
+
+        return groups
+
     def is_external(self) -> bool:
         return self._external is not None
 
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from enum import Enum
 from typing import Final, Literal
 
 from pydantic import TypeAdapter
@@ -13,6 +14,7 @@ PACK_TYPES: dict[str, str] = {
     "int32_t": "i",
     "uint64_t": "Q",
     "int64_t": "q",
+    "float16": "e",
     "float": "f",
     "double": "d",
     "bool": "?",
@@ -23,6 +25,10 @@ class LrpcVarDict(TypedDict):
     name: str
     type: str
     count: NotRequired[int | Literal["?"]]
+    encoding: NotRequired[str]
+    bits: NotRequired[int]
+    scale: NotRequired[float]
+    offset: NotRequired[float]
 
 
 # pylint: disable=invalid-name
@@ -33,15 +39,26 @@ LrpcVarValidator = TypeAdapter(LrpcVarDict)
 class LrpcVar:
     ETL_STRING_VIEW: Final = "lrpc::string_view"
     LRPC_BYTEARRAY: Final = "lrpc::bytearray"
+    LRPC_FLOAT16: Final = "lrpc::tags::float16"
 
-    def __init__(self, raw: LrpcVarDict) -> None:
-        LrpcVarValidator.validate_python(raw, strict=True, extra="forbid")
+    class Encoding(str, Enum):
+        FIXED = "fixed"
+        VARINT = "varint"
+
+    def __init__(self, raw: LrpcVarDict, *, trusted: bool = False) -> None:
+        if not trusted:
+            LrpcVarValidator.validate_python(raw, strict=True, extra="forbid")
 
         self._name = raw["name"]
         self._type = raw["type"].replace("struct@", "").replace("enum@", "").strip("@")
         self._base_type_is_struct = raw["type"].startswith("struct@")
         self._base_type_is_enum = raw["type"].startswith("enum@")
         self._base_type_is_custom = "@" in raw["type"]
+        self._encoding = LrpcVar.Encoding(raw.get("encoding", LrpcVar.Encoding.FIXED))
+        self._bit_width = raw.get("bits", 0)
+        self._is_fixed_point = ("scale" in raw) or ("offset" in raw)
+        self._scale = float(raw.get("scale", 1.0))
+        self._offset = float(raw.get("offset", 0.0))
 
         c = raw.get("count", 1)
         if isinstance(c, int):
@@ -64,6 +81,9 @@ class LrpcVar:
         if self.base_type_is_bytearray():
             return LrpcVar.LRPC_BYTEARRAY
 
+        if self.base_type_is_float16():
+            return "float"
+
         return self.base_type()
 
     def field_type(self) -> str:
@@ -109,6 +129,10 @@ class LrpcVar:
             t = "lrpc::tags::bytearray_auto"
         elif self.base_type_is_custom() and namespace is not None:
             t = f"{namespace}::{self.base_type()}"
+        elif self.is_varint():
+            t = f"lrpc::tags::varint<{self.base_type()}>"
+        elif self.base_type_is_float16():
+            t = LrpcVar.LRPC_FLOAT16
         else:
             t = self.base_type()
 
@@ -120,6 +144,30 @@ class LrpcVar:
 
         return t
 
+    def encoding(self) -> Encoding:
+        return self._encoding
+
+    def is_varint(self) -> bool:
+        return self._encoding == LrpcVar.Encoding.VARINT
+
+    def bit_width(self) -> int:
+        return self._bit_width
+
+    def is_bit_field(self) -> bool:
+        return self._bit_width != 0
+
+    def is_fixed_point(self) -> bool:
+        return self._is_fixed_point
+
+    def scale(self) -> float:
+        return self._scale
+
+    def offset(self) -> float:
+        return self._offset
+
+    def base_type_is_signed(self) -> bool:
+        return self.base_type() in ["int8_t", "int16_t", "int32_t", "int64_t"]
+
     def base_type_is_custom(self) -> bool:
         return self._base_type_is_custom
 
@@ -142,7 +190,10 @@ class LrpcVar:
         ]
 
     def base_type_is_float(self) -> bool:
-        return self.base_type() in ["float", "double"]
+        return self.base_type() in ["float16", "float", "double"]
+
+    def base_type_is_float16(self) -> bool:
+        return self.base_type() == "float16"
 
     def base_type_is_bool(self) -> bool:
         return self.base_type() == "bool"
@@ -1,5 +1,6 @@
 #pragma once
 #include <algorithm>
+#include <cstring>
 #include <limits>
 #include <type_traits>
 
@@ -17,9 +18,13 @@ namespace lrpc
         struct string_auto;
         struct string_n;
         struct bytearray_auto;
+        struct float16;
 
         template <typename T>
         struct array_n;
+
+        template <typename T>
+        struct varint;
     }
 
     template <typename T>
@@ -52,6 +57,27 @@ namespace lrpc
     {
     };
 
+    template <typename T>
+    struct is_varint : public std::false_type
+    {
+    };
+
+    template <typename T>
+    struct is_varint<tags::varint<T>> : public std::true_type
+    {
+    };
+
+    template <typename T>
+    struct varint_type
+    {
+    };
+
+    template <typename T>
+    struct varint_type<tags::varint<T>>
+    {
+        using type = T;
+    };
+
     template <typename T>
     struct optional_type
     {
@@ -93,6 +119,18 @@ namespace lrpc
         using type = lrpc::optional<bytearray>;
     };
 
+    template <typename T>
+    struct optional_pr_type<lrpc::optional<tags::varint<T>>>
+    {
+        using type = lrpc::optional<T>;
+    };
+
+    template <>
+    struct optional_pr_type<lrpc::optional<tags::float16>>
+    {
+        using type = lrpc::optional<float>;
+    };
+
     template <typename T>
     struct array_n_type
     {
@@ -133,6 +171,18 @@ namespace lrpc
         using type = lrpc::span<const bytearray>;
     };
 
+    template <typename T>
+    struct array_param_type<tags::array_n<tags::varint<T>>>
+    {
+        using type = lrpc::span<const T>;
+    };
+
+    template <>
+    struct array_param_type<tags::array_n<tags::float16>>
+    {
+        using type = lrpc::span<const float>;
+    };
+
     template <typename T>
     struct array_outparam_type
     {
@@ -162,6 +212,18 @@ namespace lrpc
         using type = lrpc::span<bytearray>;
     };
 
+    template <typename T>
+    struct array_outparam_type<tags::array_n<tags::varint<T>>>
+    {
+        using type = lrpc::span<T>;
+    };
+
+    template <>
+    struct array_outparam_type<tags::array_n<tags::float16>>
+    {
+        using type = lrpc::span<float>;
+    };
+
     template <typename T>
     using array_n_type_is_string_n = std::is_same<typename array_n_type<T>::type, tags::string_n>;
 
@@ -172,8 +234,9 @@ namespace lrpc
     template <typename T>
     typename std::enable_if_t<
         (!std::is_arithmetic<T>::value) && (!std::is_enum<T>::value) && (!is_optional<T>::value) &&
-            (!is_array_n<T>::value) && (!std::is_same<T, tags::string_auto>::value) &&
-            (!std::is_same<T, tags::string_n>::value) && (!std::is_same<T, tags::bytearray_auto>::value),
+            (!is_array_n<T>::value) && (!is_varint<T>::value) && (!std::is_same<T, tags::string_auto>::value) &&
+            (!std::is_same<T, tags::string_n>::value) && (!std::is_same<T, tags::bytearray_auto>::value) &&
+            (!std::is_same<T, tags::float16>::value),
         T>
     read_unchecked(etl::byte_stream_reader& reader) = delete;
 
@@ -197,6 +260,156 @@ namespace lrpc
         return static_cast<T>(reader.read_unchecked<uint8_t>());
     }
 
+    // Varint. Signed types are zigzag encoded
+    template <typename T>
+    using enable_for_varint = std::enable_if_t<is_varint<T>::value, typename varint_type<T>::type>;
+
+    template <typename T>
+    std::enable_if_t<std::is_unsigned<T>::value, T> zigzag_encode(const T value)
+    {
+        return value;
+    }
+
+    template <typename T>
+    std::enable_if_t<std::is_signed<T>::value, typename std::make_unsigned<T>::type> zigzag_encode(const T value)
+    {
+        using U = typename std::make_unsigned<T>::type;
+        const auto shifted = static_cast<U>(static_cast<U>(value) << 1U);
+        return (value < 0) ? static_cast<U>(~shifted) : shifted;
+    }
+
+    template <typename T>
+    std::enable_if_t<std::is_unsigned<T>::value, T> zigzag_decode(const T encoded)
+    {
+        return encoded;
+    }
+
+    template <typename T>
+    std::enable_if_t<std::is_signed<T>::value, T> zigzag_decode(const typename std::make_unsigned<T>::type encoded)
+    {
+        using U = typename std::make_unsigned<T>::type;
+        const auto magnitude = static_cast<U>(encoded >> 1U);
+        return ((encoded & 1U) != 0) ? static_cast<T>(~magnitude) : static_cast<T>(magnitude);
+    }
+
+    template <typename T>
+    enable_for_varint<T> read_unchecked(etl::byte_stream_reader& reader)
+    {
+        using V = typename varint_type<T>::type;
+        using U = typename std::make_unsigned<V>::type;
+        constexpr size_t maxBytes{(std::numeric_limits<U>::digits + 6) / 7};
+
+        U encoded{0};
+        for (size_t i{0}; (i < maxBytes) && (reader.available_bytes() != 0); ++i)
+        {
+            const auto byte = reader.read_unchecked<uint8_t>();
+            encoded = static_cast<U>(encoded | static_cast<U>(static_cast<U>(byte & 0x7FU) << (7U * i)));
+            if ((byte & 0x80U) == 0)
+            {
+                break;
+            }
+        }
+
+        return zigzag_decode<V>(encoded);
+    }
+
+    // IEEE 754 half precision. Conversion from float rounds to nearest even
+    inline uint16_t float_to_half(const float value)
+    {
+        uint32_t bits{0};
+        std::memcpy(&bits, &value, sizeof(bits));
+
+        const auto sign = static_cast<uint16_t>((bits >> 16U) & 0x8000U);
+        const uint32_t floatExponent = (bits >> 23U) & 0xFFU;
+        uint32_t mantissa = bits & 0x7FFFFFU;
+
+        if (floatExponent == 0xFFU)
+        {
+            // infinity or NaN
+            return static_cast<uint16_t>(sign | 0x7C00U | ((mantissa != 0U) ? 0x200U : 0U));
+        }
+
+        const auto exponent = static_cast<int32_t>(floatExponent) - 127 + 15;
+        if (exponent >= 0x1F)
+        {
+            // too large, infinity
+            return static_cast<uint16_t>(sign | 0x7C00U);
+        }
+
+        uint32_t shift{13};
+        uint32_t half{0};
+        if (exponent > 0)
+        {
+            half = static_cast<uint32_t>(exponent) << 10U;
+        }
+        else if (exponent >= -10)
+        {
+            // subnormal
+            mantissa |= 0x800000U;
+            shift = static_cast<uint32_t>(14 - exponent);
+        }
+        else
+        {
+            // too small, zero
+            return sign;
+        }
+
+        half |= mantissa >> shift;
+        const uint32_t rest = mantissa & ((1U << shift) - 1U);
+        const uint32_t halfway = 1U << (shift - 1U);
+        if ((rest > halfway) || ((rest == halfway) && ((half & 1U) != 0U)))
+        {
+            // a carry into the exponent is intended
+            ++half;
+        }
+
+        return static_cast<uint16_t>(sign | half);
+    }
+
+    inline float half_to_float(const uint16_t half)
+    {
+        const uint32_t sign = static_cast<uint32_t>(half & 0x8000U) << 16U;
+        const uint32_t exponent = static_cast<uint32_t>(half >> 10U) & 0x1FU;
+        uint32_t mantissa = half & 0x3FFU;
+        uint32_t bits{sign};
+
+        if (exponent == 0x1FU)
+        {
+            // infinity or NaN
+            bits |= 0x7F800000U | (mantissa << 13U);
+        }
+        else if (exponent != 0U)
+        {
+            bits |= ((exponent + 112U) << 23U) | (mantissa << 13U);
+        }
+        else if (mantissa != 0U)
+        {
+            // subnormal, normalize for float
+            uint32_t floatExponent{113};
+            while ((mantissa & 0x400U) == 0U)
+            {
+                mantissa <<= 1U;
+                --floatExponent;
+            }
+
+            bits |= (floatExponent << 23U) | ((mantissa & 0x3FFU) << 13U);
+        }
+
+        float value{0};
+        std::memcpy(&value, &bits, sizeof(value));
+        return value;
+    }
+
+    // Half precision float, read as float
+    template <typename T>
+    using enable_for_float16 = std::enable_if_t<std::is_same<T, tags::float16>::value, float>;
+
+    template <typename T>
+    enable_for_float16<T> read_unchecked(etl::byte_stream_reader& reader)
+    {
+        return half_to_float(reader.read_unchecked<uint16_t>());
+    }
+
     // Auto string
     template <typename T>
     using enable_for_auto_string = std::enable_if_t<std::is_same<T, tags::string_auto>::value, lrpc::string_view>;
@@ -370,8 +583,9 @@ namespace lrpc
     template <typename T,
               typename std::enable_if_t<
                   (!std::is_arithmetic<T>::value) && (!std::is_enum<T>::value) && (!is_optional<T>::value) &&
-                      (!is_array_n<T>::value) && (!std::is_same<T, tags::string_auto>::value) &&
-                      (!std::is_same<T, tags::string_n>::value) && (!std::is_same<T, tags::bytearray_auto>::value),
+                      (!is_array_n<T>::value) && (!is_varint<T>::value) &&
+                      (!std::is_same<T, tags::string_auto>::value) && (!std::is_same<T, tags::string_n>::value) &&
+                      (!std::is_same<T, tags::bytearray_auto>::value) && (!std::is_same<T, tags::float16>::value),
                   bool> = true>
     void write_unchecked(etl::byte_stream_writer& writer, const T& value) = delete;
 
@@ -389,6 +603,30 @@ namespace lrpc
         writer.write_unchecked<uint8_t>(static_cast<uint8_t>(value));
     }
 
+    // Varint. Signed types are zigzag encoded
+    template <typename VAR, typename std::enable_if_t<is_varint<VAR>::value, bool> = true>
+    void write_unchecked(etl::byte_stream_writer& writer, const typename varint_type<VAR>::type& value)
+    {
+        using V = typename varint_type<VAR>::type;
+        using U = typename std::make_unsigned<V>::type;
+
+        auto encoded = static_cast<U>(zigzag_encode<V>(value));
+        while (encoded >= 0x80U)
+        {
+            writer.write_unchecked<uint8_t>(static_cast<uint8_t>(encoded | 0x80U));
+            encoded = static_cast<U>(encoded >> 7U);
+        }
+
+        writer.write_unchecked<uint8_t>(static_cast<uint8_t>(encoded));
+    }
+
+    // Half precision float, written from float
+    template <typename T, typename std::enable_if_t<std::is_same<T, tags::float16>::value, bool> = true>
+    void write_unchecked(etl::byte_stream_writer& writer, const float& value)
+    {
+        writer.write_unchecked<uint16_t>(float_to_half(value));
+    }
+
     // auto string
     template <typename T, typename std::enable_if_t<std::is_same<T, tags::string_auto>::value, bool> = true>
     void write_unchecked(etl::byte_stream_writer& writer, const lrpc::string_view& value)
@@ -511,4 +749,92 @@ namespace lrpc
             lrpc::write_unchecked<tags::string_n>(writer, {}, definitionStringSize);
         }
     }
+
+    // Writes the fields of a packed struct as consecutive bits,
+    // starting at the least significant bit of the first byte
+    class BitWriter
+    {
+    public:
+        explicit BitWriter(etl::byte_stream_writer& byteWriter) : writer{byteWriter} {}
+
+        void write(const uint64_t value, const uint8_t width)
+        {
+            for (uint8_t i{0}; i < width; ++i)
+            {
+                if (((value >> i) & 1U) != 0U)
+                {
+                    current = static_cast<uint8_t>(current | (1U << used));
+                }
+
+                ++used;
+                if (used == 8U)
+                {
+                    flush();
+                }
+            }
+        }
+
+        // Writes the remaining bits, if any
+        void flush()
+        {
+            if (used != 0U)
+            {
+                writer.write_unchecked<uint8_t>(current);
+                current = 0;
+                used = 0;
+            }
+        }
+
+    private:
+        etl::byte_stream_writer& writer;
+        uint8_t current{0};
+        uint8_t used{0};
+    };
+
+    // Reads the fields of a packed struct that were written with a BitWriter
+    class BitReader
+    {
+    public:
+        explicit BitReader(etl::byte_stream_reader& byteReader) : reader{byteReader} {}
+
+        uint64_t read(const uint8_t width)
+        {
+            uint64_t value{0};
+            for (uint8_t i{0}; i < width; ++i)
+            {
+                if (available == 0U)
+                {
+                    current = reader.read_unchecked<uint8_t>();
+                    available = 8U;
+                }
+
+                if ((current & 1U) != 0U)
+                {
+                    value |= (uint64_t{1} << i);
+                }
+
+                current = static_cast<uint8_t>(current >> 1U);
+                --available;
+            }
+
+            return value;
+        }
+
+        int64_t readSigned(const uint8_t width)
+        {
+            auto value = read(width);
+            if ((width < 64U) && (((value >> (width - 1U)) & 1U) != 0U))
+            {
+                // sign extend
+                value |= ~((uint64_t{1} << width) - 1U);
+            }
+
+            return static_cast<int64_t>(value);
+        }
+
+    private:
+        etl::byte_stream_reader& reader;
+        uint8_t current{0};
+        uint8_t available{0};
+    };
 }
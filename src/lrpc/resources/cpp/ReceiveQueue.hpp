@@ -0,0 +1,85 @@
+#pragma once
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+
+#include "LrpcTypes.hpp"
+
+namespace lrpc
+{
+    // Single producer, single consumer byte queue in front of a server. The producer
+    // (typically a receive interrupt) pushes bytes with pushFromIsr. The consumer (typically
+    // the main loop) calls poll to pass the queued bytes to the server, which dispatches
+    // complete messages. Service code is therefore never executed in interrupt context.
+    template <typename TServer, size_t QueueSize>
+    class ReceiveQueue
+    {
+        static_assert((QueueSize != 0) && ((QueueSize & (QueueSize - 1U)) == 0),
+                      "Receive queue size must be a power of two");
+
+    public:
+        explicit ReceiveQueue(TServer& server_) : server{&server_} {}
+
+        // Safe to call from an interrupt, while the main loop calls poll. Bytes are
+        // either queued completely or, when there is not enough space, not at all
+        bool pushFromIsr(lrpc::span<const uint8_t> bytes)
+        {
+            const auto write = writeIndex.load(std::memory_order_relaxed);
+            const auto read = readIndex.load(std::memory_order_acquire);
+
+            if (bytes.size() > (QueueSize - (write - read)))
+            {
+                droppedBytes.store(droppedBytes.load(std::memory_order_relaxed) + bytes.size(),
+                                   std::memory_order_relaxed);
+                return false;
+            }
+
+            const auto offset = write & Mask;
+            const auto head = bytes.first(std::min(bytes.size(), QueueSize - offset));
+            const auto tail = bytes.subspan(head.size());
+            const lrpc::span<uint8_t> storage{buffer};
+
+            (void)std::copy(head.begin(), head.end(), storage.subspan(offset).begin());
+            (void)std::copy(tail.begin(), tail.end(), storage.begin());
+
+            writeIndex.store(write + bytes.size(), std::memory_order_release);
+            return true;
+        }
+
+        bool pushFromIsr(const uint8_t byte_) { return pushFromIsr(lrpc::span<const uint8_t>{&byte_, 1}); }
+
+        // Passes all bytes that were queued before the call to the server. Returns the number of bytes
+        size_t poll()
+        {
+            const auto read = readIndex.load(std::memory_order_relaxed);
+            const auto write = writeIndex.load(std::memory_order_acquire);
+            const auto count = write - read;
+
+            const auto offset = read & Mask;
+            const auto first = std::min(count, QueueSize - offset);
+            const lrpc::span<const uint8_t> storage{buffer};
+
+            server->lrpcReceive(storage.subspan(offset, first));
+            server->lrpcReceive(storage.first(count - first));
+
+            // Only now the space can be reused by the producer
+            readIndex.store(write, std::memory_order_release);
+            return count;
+        }
+
+        // Number of bytes that could not be queued because the queue was full
+        size_t dropped() const { return droppedBytes.load(std::memory_order_relaxed); }
+
+    private:
+        static constexpr size_t Mask{QueueSize - 1U};
+
+        TServer* server;
+        lrpc::array<uint8_t, QueueSize> buffer{};
+        // Free running indices. Only the producer writes writeIndex and droppedBytes,
+        // only the consumer writes readIndex
+        std::atomic<size_t> writeIndex{0};
+        std::atomic<size_t> readIndex{0};
+        std::atomic<size_t> droppedBytes{0};
+    };
+}
@@ -1,4 +1,5 @@
 #pragma once
+#include <algorithm>
 #include <cstdint>
 #include <utility>
 
@@ -31,6 +32,11 @@ namespace lrpc
         };
 
     public:
+        using TransmitBuffer = lrpc::array<uint8_t, TX_SIZE>;
+
+        static constexpr size_t RxBufferSize{RX_SIZE};
+        static constexpr size_t TxBufferSize{TX_SIZE};
+
         Server()
         {
             services.fill(&serviceNotFound);
@@ -48,7 +54,7 @@ namespace lrpc
 
         void transmit(const uint8_t serviceId, const uint8_t functionOrStreamId, const ParamWriter writeParams) override
         {
-            auto writer = Writer{sendBuffer, etl::endian::little};
+            auto writer = Writer{lrpcTransmitBuffer(), etl::endian::little};
 
             createHeader(writer, serviceId, functionOrStreamId);
             writeParams(writer);
@@ -62,6 +68,22 @@ namespace lrpc
             lrpcTransmit({begin, end});
         }
 
+        // Buffer that the next message is serialized into before it is passed to lrpcTransmit.
+        // Override to serialize directly into an application owned (e.g. DMA) buffer. The buffer
+        // must not be modified by the application until lrpcTransmit has finished using it
+        virtual TransmitBuffer& lrpcTransmitBuffer() { return sendBuffer; }
+
+        // Checks at compile time that the buffers of the server fit all messages of the service
+        template <typename TService>
+        void registerService(TService& service)
+        {
+            static_assert(TService::RequiredRxBufferSize <= RX_SIZE,
+                          "Receive buffer is too small for the largest request of the service");
+            static_assert(TService::RequiredTxBufferSize <= TX_SIZE,
+                          "Transmit buffer is too small for the largest response of the service");
+            registerService(static_cast<Service&>(service));
+        }
+
         void registerService(Service& service)
         {
             // TODO: check for out of bounds service
@@ -73,9 +95,26 @@ namespace lrpc
 
         void lrpcReceive(lrpc::span<const uint8_t> bytes)
         {
-            for (const auto _byte : bytes)
+            while (!bytes.empty())
             {
-                lrpcReceive(_byte);
+                if (receiveBuffer.empty())
+                {
+                    // message size field
+                    receiveBuffer.push_back(bytes.front());
+                    bytes = bytes.subspan(1);
+                }
+
+                // copy as much of the remainder of the message as available in one go
+                const auto count = std::min(messageSize() - receiveBuffer.size(), bytes.size());
+                const auto chunk = bytes.first(count);
+                (void)receiveBuffer.insert(receiveBuffer.end(), chunk.begin(), chunk.end());
+                bytes = bytes.subspan(count);
+
+                if (messageIsComplete())
+                {
+                    invokeService();
+                    receiveBuffer.clear();
+                }
             }
         }
 
@@ -105,14 +144,15 @@ namespace lrpc
 
     private:
         etl::vector<uint8_t, RX_SIZE> receiveBuffer;
-        lrpc::array<uint8_t, TX_SIZE> sendBuffer;
+        TransmitBuffer sendBuffer;
 
         // +2 to allocate space for all regular services and the meta service
         lrpc::array<Service*, MAX_SERVICE_ID + 2U> services;
         META_SERVICE metaService;
         ServiceNotFoundService serviceNotFound;
 
-        bool messageIsComplete() const { return receiveBuffer.size() == static_cast<size_t>(receiveBuffer.at(0) + 1); }
+        size_t messageSize() const { return static_cast<size_t>(receiveBuffer.front()) + 1U; }
+        bool messageIsComplete() const { return receiveBuffer.size() == messageSize(); }
 
         Service* service(const uint8_t serviceId)
         {
@@ -1,4 +1,5 @@
 #pragma once
+#include <cstddef>
 #include <cstdint>
 #include <utility>
 
@@ -70,6 +71,10 @@ namespace lrpc
         using Reader = IServer::Reader;
         using Writer = IServer::Writer;
 
+        // Smallest server buffers that fit all messages of the service. Hidden by the generated shims
+        static constexpr size_t RequiredRxBufferSize{0};
+        static constexpr size_t RequiredTxBufferSize{0};
+
         virtual uint8_t id() const = 0;
         virtual void invoke(Reader& reader) = 0;
 
@@ -85,6 +90,82 @@ namespace lrpc
         IServer* linkedServer{&nullServer};
     };
 
+    // Collects the messages of a batched server stream until the
+    // batch is full and can be transmitted in a single frame
+    template <size_t BufferSize>
+    class StreamBatch
+    {
+    public:
+        using Writer = IServer::Writer;
+
+        explicit StreamBatch(const uint8_t batchSize) : maxCount{batchSize} {}
+
+        // Returns true if the batch is full after appending the message
+        template <typename MessageWriter>
+        bool append(const MessageWriter& writeMessage)
+        {
+            Writer writer{buffer.data() + used, BufferSize - used, etl::endian::little};
+            writeMessage(writer);
+            used += writer.size_bytes();
+            ++count;
+            return count >= maxCount;
+        }
+
+        bool empty() const { return count == 0; }
+
+        void writeTo(Writer& writer)
+        {
+            writer.write_unchecked<uint8_t>(count);
+            for (size_t i = 0; i < used; ++i)
+            {
+                writer.write_unchecked<uint8_t>(buffer[i]);
+            }
+            used = 0;
+            count = 0;
+        }
+
+    private:
+        lrpc::array<uint8_t, BufferSize> buffer{};
+        size_t used{0};
+        uint8_t count{0};
+        uint8_t maxCount;
+    };
+
+    // Limits the rate of a server stream by dropping messages that follow
+    // the previous message within the minimum interval
+    class RateLimit
+    {
+    public:
+        explicit RateLimit(const uint32_t minimumIntervalUs) : interval{minimumIntervalUs} {}
+
+        bool allow(const uint32_t nowUs)
+        {
+            if (!started)
+            {
+                started = true;
+                last = nowUs;
+                return true;
+            }
+
+            // unsigned arithmetic handles wrapping of the time source
+            const auto elapsed = static_cast<uint32_t>(nowUs - last);
+            if (elapsed < interval)
+            {
+                return false;
+            }
+
+            // A message that is slightly late does not lower the average rate,
+            // but a long pause does not allow a burst of messages afterwards
+            last = ((elapsed - interval) < interval) ? static_cast<uint32_t>(last + interval) : nowUs;
+            return true;
+        }
+
+    private:
+        uint32_t interval;
+        uint32_t last{0};
+        bool started{false};
+    };
+
     template <uint8_t ServiceId>
     class ServiceForwarder : public Service
     {
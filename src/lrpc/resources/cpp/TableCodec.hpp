@@ -0,0 +1,203 @@
+#pragma once
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#include <etl/byte_stream.h>
+
+#include "LrpcTypes.hpp"
+#include "Service.hpp"
+
+namespace lrpc
+{
+    // Type of a struct field in a codec table. Enums are encoded as Uint8,
+    // Struct is a nested struct with a field table of its own
+    enum class FieldType : uint8_t
+    {
+        Uint8,
+        Int8,
+        Uint16,
+        Int16,
+        Uint32,
+        Int32,
+        Uint64,
+        Int64,
+        Float,
+        Double,
+        Bool,
+        Struct
+    };
+
+    struct FieldDescriptor;
+
+    using FieldTable = lrpc::span<const FieldDescriptor> (*)();
+
+    struct FieldDescriptor
+    {
+        uint16_t offset;
+        FieldType type;
+        uint16_t count;
+        // Size and field table of a nested struct. Only used for FieldType::Struct
+        uint16_t size;
+        FieldTable fields;
+    };
+
+    // Specialized by lrpcg for every struct that is encoded with the table codec
+    template <typename T>
+    lrpc::span<const FieldDescriptor> fieldTable();
+
+    // Field table of a function without parameters or return values
+    inline lrpc::span<const FieldDescriptor> noFields() { return {}; }
+
+    // Describes a function that is invoked by the generic function shim of a service. The handler
+    // copies the parameters from the params buffer, invokes the function of the service and copies
+    // the return values to the returns buffer. Both buffers are laid out as described by the field tables
+    struct FunctionDescriptor
+    {
+        FieldTable params;
+        FieldTable returns;
+        void (*handler)(Service& service, const uint8_t* params, uint8_t* returns);
+    };
+
+    namespace table_codec
+    {
+        template <typename T>
+        void write(etl::byte_stream_writer& writer, const uint8_t* field, const size_t count)
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                T value;
+                (void)std::memcpy(&value, field + (i * sizeof(T)), sizeof(T));
+                writer.write_unchecked<T>(value);
+            }
+        }
+
+        template <typename T>
+        void read(etl::byte_stream_reader& reader, uint8_t* field, const size_t count)
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                const T value = reader.read_unchecked<T>();
+                (void)std::memcpy(field + (i * sizeof(T)), &value, sizeof(T));
+            }
+        }
+
+        // Size of the buffers of the generic function shim
+        constexpr size_t maxSize(const size_t size) { return size; }
+
+        template <typename... Sizes>
+        constexpr size_t maxSize(const size_t first, const size_t second, const Sizes... rest)
+        {
+            return maxSize((first > second) ? first : second, rest...);
+        }
+    }
+
+    // Generic encoder for all structs with a field table. Trades some CPU time
+    // for code size, because the code is shared by all structs
+    inline void writeFields(etl::byte_stream_writer& writer, const void* value, lrpc::span<const FieldDescriptor> fields)
+    {
+        const auto* base = static_cast<const uint8_t*>(value);
+
+        for (const auto& f : fields)
+        {
+            const auto* field = base + f.offset;
+
+            switch (f.type)
+            {
+            case FieldType::Uint8:
+                table_codec::write<uint8_t>(writer, field, f.count);
+                break;
+            case FieldType::Int8:
+                table_codec::write<int8_t>(writer, field, f.count);
+                break;
+            case FieldType::Uint16:
+                table_codec::write<uint16_t>(writer, field, f.count);
+                break;
+            case FieldType::Int16:
+                table_codec::write<int16_t>(writer, field, f.count);
+                break;
+            case FieldType::Uint32:
+                table_codec::write<uint32_t>(writer, field, f.count);
+                break;
+            case FieldType::Int32:
+                table_codec::write<int32_t>(writer, field, f.count);
+                break;
+            case FieldType::Uint64:
+                table_codec::write<uint64_t>(writer, field, f.count);
+                break;
+            case FieldType::Int64:
+                table_codec::write<int64_t>(writer, field, f.count);
+                break;
+            case FieldType::Float:
+                table_codec::write<float>(writer, field, f.count);
+                break;
+            case FieldType::Double:
+                table_codec::write<double>(writer, field, f.count);
+                break;
+            case FieldType::Bool:
+                table_codec::write<bool>(writer, field, f.count);
+                break;
+            case FieldType::Struct:
+                for (size_t i = 0; i < f.count; ++i)
+                {
+                    writeFields(writer, field + (i * f.size), f.fields());
+                }
+                break;
+            }
+        }
+    }
+
+    // Generic decoder for all structs with a field table
+    inline void readFields(etl::byte_stream_reader& reader, void* value, lrpc::span<const FieldDescriptor> fields)
+    {
+        auto* base = static_cast<uint8_t*>(value);
+
+        for (const auto& f : fields)
+        {
+            auto* field = base + f.offset;
+
+            switch (f.type)
+            {
+            case FieldType::Uint8:
+                table_codec::read<uint8_t>(reader, field, f.count);
+                break;
+            case FieldType::Int8:
+                table_codec::read<int8_t>(reader, field, f.count);
+                break;
+            case FieldType::Uint16:
+                table_codec::read<uint16_t>(reader, field, f.count);
+                break;
+            case FieldType::Int16:
+                table_codec::read<int16_t>(reader, field, f.count);
+                break;
+            case FieldType::Uint32:
+                table_codec::read<uint32_t>(reader, field, f.count);
+                break;
+            case FieldType::Int32:
+                table_codec::read<int32_t>(reader, field, f.count);
+                break;
+            case FieldType::Uint64:
+                table_codec::read<uint64_t>(reader, field, f.count);
+                break;
+            case FieldType::Int64:
+                table_codec::read<int64_t>(reader, field, f.count);
+                break;
+            case FieldType::Float:
+                table_codec::read<float>(reader, field, f.count);
+                break;
+            case FieldType::Double:
+                table_codec::read<double>(reader, field, f.count);
+                break;
+            case FieldType::Bool:
+                table_codec::read<bool>(reader, field, f.count);
+                break;
+            case FieldType::Struct:
+                for (size_t i = 0; i < f.count; ++i)
+                {
+                    readFields(reader, field + (i * f.size), f.fields());
+                }
+                break;
+            }
+        }
+    }
+}
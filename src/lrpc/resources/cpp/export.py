@@ -2,6 +2,8 @@ from importlib import resources
 from importlib.metadata import version
 from pathlib import Path
 
+from lrpc.codegen.output_files import write_if_changed
+
 
 def _create_dir_if_not_exists(target_dir: Path) -> None:
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -10,14 +12,10 @@ def _create_dir_if_not_exists(target_dir: Path) -> None:
 def _export(resource: str, output: Path) -> None:
     resource_path = resources.files(__package__).joinpath(resource)
 
-    with (
-        resources.as_file(resource_path) as resource_file,
-        resource_file.open(encoding="utf8") as source,
-        output.joinpath(resource_file.name).open(mode="w", encoding="utf-8") as dest,
-    ):
+    with resources.as_file(resource_path) as resource_file, resource_file.open(encoding="utf8") as source:
         v = version("lotusrpc")
-        dest.write(f"// This file has been generated with LRPC version {v}\n")
-        dest.write(source.read())
+        content = f"// This file has been generated with LRPC version {v}\n" + source.read()
+        write_if_changed(output.joinpath(resource_file.name), content)
 
 
 def export_resources_to(output: Path) -> None:
@@ -26,6 +24,8 @@ def export_resources_to(output: Path) -> None:
 
     _export("EtlRwExtensions.hpp", core_dir)
     _export("Server.hpp", core_dir)
+    _export("ReceiveQueue.hpp", core_dir)
+    _export("TableCodec.hpp", core_dir)
     _export("Service.hpp", core_dir)
     _export("MetaError.hpp", core_dir)
     _export("LrpcTypes.hpp", core_dir)
@@ -1,2 +1,3 @@
 from .load import export_lrpc_schema as export_lrpc_schema
 from .load import load_lrpc_schema as load_lrpc_schema
+from .load import lrpc_schema_validator as lrpc_schema_validator
@@ -1,9 +1,12 @@
+import json
 import shutil
+from functools import cache
 from importlib import resources
 from pathlib import Path
 from typing import Any
 
-import yaml
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 
 def export_lrpc_schema(output: Path) -> None:
@@ -16,9 +19,19 @@ def export_lrpc_schema(output: Path) -> None:
 def load_lrpc_schema() -> dict[str, Any]:
     schema_file = resources.files(__package__).joinpath("lotusrpc-schema.json")
     schema_text = schema_file.read_text(encoding="utf-8")
-    schema = yaml.safe_load(schema_text)
+    schema = json.loads(schema_text)
 
     if not isinstance(schema, dict):
-        raise TypeError(f"Invalid YAML input for {schema_file.name}")
+        raise TypeError(f"Invalid JSON input for {schema_file.name}")
 
     return schema
+
+
+@cache
+def lrpc_schema_validator() -> Validator:
+    """Validator for LRPC definitions. Checking the schema and creating the validator is done
+    only once per process, because it takes much longer than validating a definition"""
+    schema = load_lrpc_schema()
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
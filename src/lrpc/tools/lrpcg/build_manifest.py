@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+import yaml
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+from lrpc.codegen.codec_table import LrpcCodec
+from lrpc.core.settings import LrpcByteType
+
+CORE: Final = "core"
+DEFINITIONS: Final = "definitions"
+
+
+class BuildCoreDict(TypedDict):
+    output: str
+    byte_type: NotRequired[LrpcByteType]
+
+
+class BuildDefinitionDict(TypedDict):
+    definition: str
+    output: str
+    overlays: NotRequired[list[str]]
+    codec: NotRequired[LrpcCodec]
+
+
+class BuildManifestDict(TypedDict):
+    core: NotRequired[BuildCoreDict]
+    definitions: list[BuildDefinitionDict]
+
+
+# pylint: disable=invalid-name
+BuildManifestValidator = TypeAdapter(BuildManifestDict)
+
+
+@dataclass(frozen=True)
+class BuildDefinition:
+    definition: Path
+    output: Path
+    overlays: list[Path] = field(default_factory=list)
+    codec: LrpcCodec = "inline"
+
+
+class BuildManifest:
+    """List of LRPC definitions that are generated with a single lrpcg invocation. All
+    relative paths in the manifest are relative to the directory of the manifest file"""
+
+    def __init__(self, raw: BuildManifestDict, base_dir: Path) -> None:
+        BuildManifestValidator.validate_python(raw, strict=True, extra="forbid")
+
+        core = raw.get(CORE)
+        self._core_output = None if core is None else base_dir.joinpath(core["output"])
+        self._core_byte_type: LrpcByteType = "uint8_t" if core is None else core.get("byte_type", "uint8_t")
+
+        self._definitions = [
+            BuildDefinition(
+                base_dir.joinpath(d["definition"]),
+                base_dir.joinpath(d["output"]),
+                [base_dir.joinpath(o) for o in d.get("overlays", [])],
+                d.get("codec", "inline"),
+            )
+            for d in raw[DEFINITIONS]
+        ]
+
+        if len(self._definitions) == 0:
+            raise ValueError("Build manifest must contain at least one definition")
+
+    @staticmethod
+    def load(path: Path) -> "BuildManifest":
+        with path.open(encoding="utf-8") as manifest_file:
+            manifest: BuildManifestDict = yaml.safe_load(manifest_file)
+            if manifest is None:
+                raise ValueError(f"Build manifest {path} is empty")
+            return BuildManifest(manifest, path.parent)
+
+    def core_output(self) -> Path | None:
+        """Output directory of the core files that are shared by all definitions. If None,
+        the core files are generated in the output directory of every definition"""
+        return self._core_output
+
+    def core_byte_type(self) -> LrpcByteType:
+        return self._core_byte_type
+
+    def definitions(self) -> list[BuildDefinition]:
+        return self._definitions
@@ -0,0 +1,42 @@
+from lrpc.utils import YamlValues
+
+
+def changed_services(previous: YamlValues, current: YamlValues) -> set[str] | None:
+    """Names of the services that differ between two merged definitions. Returns None if anything
+    else differs, including the names and the order of the services. Such a change affects
+    the definition as a whole, e.g. the IDs of services or the types of parameters"""
+    if not (isinstance(previous, dict) and isinstance(current, dict)):
+        return None
+
+    previous_services = _services_by_name(previous)
+    current_services = _services_by_name(current)
+    if (previous_services is None) or (current_services is None):
+        return None
+
+    if list(previous_services) != list(current_services):
+        return None
+
+    if _without_services(previous) != _without_services(current):
+        return None
+
+    return {name for name, service in current_services.items() if service != previous_services[name]}
+
+
+def _services_by_name(definition: dict[str, YamlValues]) -> dict[str, YamlValues] | None:
+    services = definition.get("services")
+    if not isinstance(services, list):
+        return None
+
+    by_name: dict[str, YamlValues] = {}
+    for service in services:
+        name = service.get("name") if isinstance(service, dict) else None
+        # Services without a name or with a duplicate name are reported when validating the whole definition
+        if (not isinstance(name, str)) or (name in by_name):
+            return None
+        by_name[name] = service
+
+    return by_name
+
+
+def _without_services(definition: dict[str, YamlValues]) -> dict[str, YamlValues]:
+    return {key: value for key, value in definition.items() if key != "services"}
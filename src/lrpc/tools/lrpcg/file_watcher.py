@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from lrpc.codegen.output_files import content_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from watchfiles import Change
+
+# Optional dependency for watching files with notifications of the operating system, e.g. inotify on Linux
+try:
+    from watchfiles import watch
+
+    WATCHFILES_AVAILABLE = True
+    # lrpcg logs the result of every change itself
+    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+except ModuleNotFoundError as e:  # pragma: no cover
+    if e.name != "watchfiles":
+        raise
+    WATCHFILES_AVAILABLE = False
+
+POLL_INTERVAL: Final = 0.5
+# Editors may write a file in several steps. Notifications within this time are handled as one change
+NOTIFY_DEBOUNCE_MS: Final = 50
+# The files are also checked after this time without notifications, in case a notification was missed
+NOTIFY_TIMEOUT_MS: Final = 5000
+
+
+class FileWatcher:
+    """Detects changes to the content of a set of files by polling. Polling works on
+    every platform and file system and is fast enough for a handful of definition files"""
+
+    def __init__(self, files: list[Path], interval: float = POLL_INTERVAL) -> None:
+        self._files = files
+        self._interval = interval
+        self._hashes = self._snapshot()
+
+    def method(self) -> str:
+        return "polling"
+
+    def changed(self) -> bool:
+        """True if the content of any of the files changed since the previous call"""
+        hashes = self._snapshot()
+        changed = hashes != self._hashes
+        self._hashes = hashes
+        return changed
+
+    def wait_for_change(self) -> None:
+        while not self.changed():
+            time.sleep(self._interval)
+
+    def _snapshot(self) -> list[str | None]:
+        # Editors may replace a file by deleting and recreating it, so a missing file is not an error
+        return [content_hash(f) if f.is_file() else None for f in self._files]
+
+
+class NotifyFileWatcher(FileWatcher):
+    """Waits for notifications of the operating system instead of polling. The directories of the files are
+    watched, because editors often replace a file instead of writing to it. A notification only triggers a
+    check of the content of the files, so that e.g. saving a file without modifying it is not a change"""
+
+    def __init__(self, files: list[Path]) -> None:
+        super().__init__(files)
+        self._paths = {f.absolute() for f in files}
+        self._events: Iterator[set[tuple[Change, str]]] = watch(
+            *sorted({p.parent for p in self._paths}),
+            watch_filter=self._is_watched,
+            debounce=NOTIFY_DEBOUNCE_MS,
+            rust_timeout=NOTIFY_TIMEOUT_MS,
+            yield_on_timeout=True,
+            recursive=False,
+        )
+
+    def method(self) -> str:
+        return "file system notifications"
+
+    def wait_for_change(self) -> None:
+        # The generator keeps watching between calls, so no notification is lost while the code is generated
+        while not self.changed():
+            next(self._events)
+
+    def _is_watched(self, _: Change, path: str) -> bool:
+        return Path(path).absolute() in self._paths
+
+
+def create_file_watcher(files: list[Path]) -> FileWatcher:
+    """Watcher that uses notifications of the operating system if the optional
+    watchfiles package is installed. Otherwise, a watcher that polls the files"""
+    if not WATCHFILES_AVAILABLE:
+        return FileWatcher(files)
+
+    return NotifyFileWatcher(files)
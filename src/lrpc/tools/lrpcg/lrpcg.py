@@ -1,7 +1,10 @@
 import logging
 import os
 import sys
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib.metadata import version
 from pathlib import Path
 from typing import TextIO, get_args
 
@@ -18,12 +21,26 @@ from lrpc.codegen import (
     StructFileVisitor,
 )
 from lrpc.codegen.byte_types_file_writer import write_byte_types_file
+from lrpc.codegen.codec_table import LrpcCodec, codec_footprint
+from lrpc.codegen.output_files import (
+    GeneratedFiles,
+    submit_tracked,
+    track_generated_files,
+    write_build_manifest,
+    write_depfile,
+)
 from lrpc.core import LrpcDef
 from lrpc.core.settings import LrpcByteType
 from lrpc.resources.cpp import export_resources_to
+from lrpc.resources.meta import meta_def_file
 from lrpc.schema import export_lrpc_schema
-from lrpc.utils import DefinitionLoader
-from lrpc.visitors import PlantUmlVisitor
+from lrpc.utils import DefinitionLoader, YamlValues
+from lrpc.visitors import LrpcVisitor, PlantUmlVisitor
+from lrpc.visitors.size_report_visitor import DEFAULT_BITS_PER_BYTE, SizeReportVisitor
+
+from .build_manifest import BuildDefinition, BuildManifest
+from .definition_diff import changed_services
+from .file_watcher import create_file_watcher
 
 logging.basicConfig(format="[LRPCG] %(levelname)-8s: %(message)s", level=logging.INFO)
 log = logging.getLogger("LRPCG")
@@ -33,20 +50,322 @@ def create_dir_if_not_exists(target_dir: Path) -> None:
     target_dir.mkdir(parents=True, exist_ok=True)
 
 
-def generate_rpc(lrpc_def: LrpcDef, output: Path, *, generate_core: bool) -> None:
+def generate_core_files(output: Path, byte_type: LrpcByteType) -> None:
+    export_resources_to(output)
+    write_byte_types_file(output.joinpath("lrpccore"), byte_type)
+
+
+def code_visitors(output: Path, codec: LrpcCodec, executor: Executor | None) -> list[LrpcVisitor]:
+    return [
+        ServerIncludeVisitor(output),
+        ServiceIncludeVisitor(output),
+        StructFileVisitor(output, codec),
+        EnumFileVisitor(output),
+        ServiceShimVisitor(output, executor, codec),
+        ConstantsFileVisitor(output),
+        MetaServiceVisitor(output, codec),
+    ]
+
+
+def changed_service_visitors(output: Path, codec: LrpcCodec, executor: Executor | None) -> list[LrpcVisitor]:
+    """Visitors for the files that change if only the content of some services changes: the files of those
+    services and the meta service files with the definition hash. All other files do not depend on the
+    content of services, as long as the names, the IDs and the order of the services are the same"""
+    return [
+        ServiceIncludeVisitor(output),
+        ServiceShimVisitor(output, executor, codec),
+        MetaServiceVisitor(output, codec),
+    ]
+
+
+def generate_rpc(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    lrpc_def: LrpcDef,
+    output: Path,
+    *,
+    generate_core: bool,
+    codec: LrpcCodec = "inline",
+    jobs: int = 1,
+    services: Collection[str] | None = None,
+) -> GeneratedFiles:
+    """Generate all server files. With more than one job, the files are generated concurrently
+    by a thread pool. The generated files are the same in both cases. With services, only the
+    files of the services with these names and of the meta service are generated. Use this if
+    only the content of these services changed since the code was last generated"""
     create_dir_if_not_exists(output)
 
-    if generate_core:
-        export_resources_to(output)
-        write_byte_types_file(output.joinpath("lrpccore"), lrpc_def.settings().byte_type())
+    def visitors(executor: Executor | None) -> list[LrpcVisitor]:
+        if services is None:
+            return code_visitors(output, codec, executor)
+        return changed_service_visitors(output, codec, executor)
+
+    def visit(visitor: LrpcVisitor) -> None:
+        lrpc_def.accept(visitor, services=services)
+
+    with track_generated_files(output, lrpc_def.name(), partial=services is not None) as generated:
+        if jobs == 1:
+            if generate_core:
+                generate_core_files(output, lrpc_def.settings().byte_type())
+            for visitor in visitors(None):
+                visit(visitor)
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = [submit_tracked(executor, visit, v) for v in visitors(executor)]
+                if generate_core:
+                    byte_type = lrpc_def.settings().byte_type()
+                    futures.append(submit_tracked(executor, generate_core_files, output, byte_type))
+                for future in futures:
+                    future.result()
+
+    return generated
+
+
+def log_codec_footprint(lrpc_def: LrpcDef, codec: LrpcCodec) -> None:
+    footprint = codec_footprint(lrpc_def, codec)
+    log.info(
+        "Codec %s: %d struct codecs and %d function shims inline, "
+        "%d field and %d function descriptors in %d table bytes on a 32 bit target",
+        codec,
+        footprint.inline_struct_codecs,
+        footprint.inline_function_shims,
+        footprint.field_descriptors,
+        footprint.function_descriptors,
+        footprint.table_bytes(),
+    )
+
+
+def is_stdin(file: TextIO) -> bool:
+    return file.name in ("-", "<stdin>")
+
+
+def definition_inputs(definition_file: TextIO, overlays: Iterable[TextIO]) -> list[Path]:
+    """All files that are read to create the LRPC definition, with the meta
+    service definition as the last file. Input from stdin is not a file"""
+    files = [Path(f.name) for f in [definition_file, *overlays] if not is_stdin(f)]
+    with meta_def_file() as meta_def:
+        files.append(meta_def)
+
+    return files
+
+
+def build_definition(definition: BuildDefinition, *, generate_core: bool, warnings_as_errors: bool) -> GeneratedFiles:
+    loader = DefinitionLoader(definition.definition, warnings_as_errors=warnings_as_errors)
+    for overlay in definition.overlays:
+        loader.add_overlay(overlay)
+
+    return generate_rpc(loader.lrpc_def(), definition.output, generate_core=generate_core, codec=definition.codec)
+
+
+@dataclass(frozen=True)
+class CppOptions:
+    output: Path
+    generate_core: bool
+    codec: LrpcCodec
+    jobs: int
+    depfile: Path | None
+    manifest: Path | None
+    warnings_as_errors: bool
+
+
+def source_name(source: TextIO | Path) -> str:
+    return str(source) if isinstance(source, Path) else source.name
+
+
+def report_generated_cpp(lrpc_def: LrpcDef, generated: GeneratedFiles, inputs: list[Path], options: CppOptions) -> None:
+    log.info(
+        "%d files written, %d files unchanged, %d stale files removed",
+        len(generated.written),
+        len(generated.unchanged),
+        len(generated.removed),
+    )
+    log_codec_footprint(lrpc_def, options.codec)
+
+    if options.depfile is not None:
+        write_depfile(options.depfile, generated.all(), inputs)
+    if options.manifest is not None:
+        write_build_manifest(options.manifest, generated.all(), inputs, version("lotusrpc"))
+
+
+def generate_cpp(
+    definition: TextIO | Path,
+    overlays: list[TextIO] | list[Path],
+    inputs: list[Path],
+    options: CppOptions,
+) -> bool:
+    """Generate C++ server code and log the result. Returns False if code generation failed"""
+    try:
+        loader = DefinitionLoader(definition, warnings_as_errors=options.warnings_as_errors)
+        for overlay in overlays:
+            loader.add_overlay(overlay)
+
+        lrpc_def = loader.lrpc_def()
+        generated = generate_rpc(
+            lrpc_def,
+            options.output,
+            generate_core=options.generate_core,
+            codec=options.codec,
+            jobs=options.jobs,
+        )
+        log.info("Generated LRPC code for %s in %s", source_name(definition), options.output)
+        report_generated_cpp(lrpc_def, generated, inputs, options)
+
+        for overlay in overlays:
+            log.info("Applied overlay %s", source_name(overlay))
+
+    # catching general exception here is considered ok, because application will terminate
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        level_is_debug = log.isEnabledFor(logging.DEBUG)
+        more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
+        log.exception(
+            "Error while generating code for %s%s",
+            source_name(definition),
+            more_info,
+            exc_info=level_is_debug,
+        )
+        return False
+
+    return True
+
+
+@dataclass(frozen=True)
+class GeneratedDefinition:
+    """Merged definition for which code was generated successfully"""
+
+    definition: YamlValues
+    lrpc_def: LrpcDef
+
+
+# pylint: disable = too-few-public-methods
+class IncrementalCppGenerator:
+    """Generates C++ server code for a definition that changes while it is watched. The merged definition
+    and the LrpcDef of the last successful run are kept. If only the content of some services changed since
+    then, only those services are validated and generated again. Any other change generates all files"""
+
+    def __init__(self, inputs: list[Path], options: CppOptions) -> None:
+        """The inputs are the definition, the overlays and the meta service definition, in that order"""
+        self._inputs = inputs
+        self._options = options
+        self._previous: GeneratedDefinition | None = None
+
+    def generate(self) -> bool:
+        """Generate the code and log the result. Returns False if code generation failed"""
+        definition, overlays = self._inputs[0], self._inputs[1:-1]
+        try:
+            loader = DefinitionLoader(definition, warnings_as_errors=self._options.warnings_as_errors)
+            for overlay in overlays:
+                loader.add_overlay(overlay)
+
+            merged = loader.definition()
+            services = None if self._previous is None else changed_services(self._previous.definition, merged)
+            lrpc_def = loader.lrpc_def(services=services)
+            services = self._services_to_generate(lrpc_def, services)
+
+            # Generated files are inconsistent if generation fails halfway, so the next run generates all files
+            self._previous = None
+            generated = generate_rpc(
+                lrpc_def,
+                self._options.output,
+                generate_core=self._options.generate_core and (services is None),
+                codec=self._options.codec,
+                jobs=self._options.jobs,
+                services=services,
+            )
+
+        # catching general exception here is considered ok, because the next change of the definition is awaited
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            level_is_debug = log.isEnabledFor(logging.DEBUG)
+            more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
+            log.exception(
+                "Error while generating code for %s%s",
+                definition.name,
+                more_info,
+                exc_info=level_is_debug,
+            )
+            return False
+
+        self._previous = GeneratedDefinition(merged, lrpc_def)
+        if services is None:
+            log.info("Generated LRPC code for %s in %s", definition.name, self._options.output)
+            for overlay in overlays:
+                log.info("Applied overlay %s", overlay.name)
+        else:
+            changed = ", ".join(sorted(services)) if len(services) != 0 else "none"
+            log.info(
+                "Generated LRPC code for changed services of %s in %s: %s",
+                definition.name,
+                self._options.output,
+                changed,
+            )
+        report_generated_cpp(lrpc_def, generated, self._inputs, self._options)
+        return True
+
+    def _services_to_generate(self, lrpc_def: LrpcDef, services: set[str] | None) -> set[str] | None:
+        """The changed services, or None if all files must be generated. Changes to a service may change the
+        ID of the services after it or the buffer sizes that are derived from all services"""
+        if (services is None) or (self._previous is None):
+            return None
+
+        previous = self._previous.lrpc_def
+        previous_ids = [(s.name(), s.id()) for s in previous.services()]
+        if [(s.name(), s.id()) for s in lrpc_def.services()] != previous_ids:
+            return None
+
+        previous_sizes = (previous.settings().rx_buffer_size(), previous.settings().tx_buffer_size())
+        if (lrpc_def.settings().rx_buffer_size(), lrpc_def.settings().tx_buffer_size()) != previous_sizes:
+            return None
+
+        return services
+
+
+def watch_and_generate_cpp(inputs: list[Path], options: CppOptions) -> None:
+    """Generate C++ server code and generate it again whenever one of the inputs changes, until interrupted.
+    The inputs are the definition, the overlays and the meta service definition, in that order"""
+    generator = IncrementalCppGenerator(inputs, options)
+    watcher = create_file_watcher(inputs)
+    generator.generate()
+    log.info(
+        "Watching %s for changes with %s. Press Ctrl+C to stop",
+        ", ".join(i.name for i in inputs[:-1]),
+        watcher.method(),
+    )
+    try:
+        while True:
+            watcher.wait_for_change()
+            # Files are read again. Unchanged generated files are not written
+            generator.generate()
+    except KeyboardInterrupt:
+        log.info("Stopped watching")
+
+
+def report_build_result(definition: BuildDefinition, future: Future[GeneratedFiles]) -> bool:
+    """Wait for the code generation of a definition in a build and log the result.
+    Returns False if code generation failed"""
+    try:
+        generated = future.result()
+        log.info(
+            "Generated LRPC code for %s in %s. %d files written, %d files unchanged, %d stale files removed",
+            definition.definition.name,
+            definition.output,
+            len(generated.written),
+            len(generated.unchanged),
+            len(generated.removed),
+        )
+
+    # catching general exception here is considered ok, because the other definitions are still generated
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        level_is_debug = log.isEnabledFor(logging.DEBUG)
+        more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
+        log.exception(
+            "Error while generating code for %s%s",
+            definition.definition.name,
+            more_info,
+            exc_info=level_is_debug,
+        )
+        return False
 
-    lrpc_def.accept(ServerIncludeVisitor(output))
-    lrpc_def.accept(ServiceIncludeVisitor(output))
-    lrpc_def.accept(StructFileVisitor(output))
-    lrpc_def.accept(EnumFileVisitor(output))
-    lrpc_def.accept(ServiceShimVisitor(output))
-    lrpc_def.accept(ConstantsFileVisitor(output))
-    lrpc_def.accept(MetaServiceVisitor(output))
+    return True
 
 
 def generate_puml(lrpc_def: LrpcDef, output: Path) -> None:
@@ -85,6 +404,46 @@ def run_cli() -> None:
     type=click.File("r"),
 )
 @click.option("--core/--no-core", help="Generate LRPC core files", required=False, default=True, type=bool)
+@click.option(
+    "--codec",
+    help="Struct and function codec. 'table' uses generic interpreters with field and function tables for smaller code",
+    required=False,
+    default="inline",
+    show_default=True,
+    type=click.Choice(get_args(LrpcCodec)),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    help="Number of files to generate concurrently",
+    required=False,
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--depfile",
+    help="Write a Make/Ninja depfile with all inputs and outputs",
+    required=False,
+    default=None,
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--manifest",
+    help="Write a JSON file with the content hashes of all inputs and outputs",
+    required=False,
+    default=None,
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--watch",
+    help="Keep running and generate the code again when the definition or an overlay changes. "
+    "If only some services changed, only those services are generated again",
+    required=False,
+    default=False,
+    is_flag=True,
+    type=bool,
+)
 @click.option(
     "-w",
     "--warnings_as_errors",
@@ -94,38 +453,38 @@ def run_cli() -> None:
     is_flag=True,
     type=bool,
 )
-def cpp(
+def cpp(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     definition_file: TextIO,
     output: str,
     overlays: Iterable[TextIO],
     *,
     core: bool,
+    codec: LrpcCodec,
+    jobs: int,
+    depfile: str | None,
+    manifest: str | None,
+    watch: bool,
     warnings_as_errors: bool,
 ) -> None:
     """Generate C++ server code for the specified LRPC definition file"""
+    if watch and any(is_stdin(f) for f in [definition_file, *overlays]):
+        log.error("Watching is not possible for input from stdin")
+        sys.exit(1)
 
-    try:
-        loader = DefinitionLoader(definition_file, warnings_as_errors=warnings_as_errors)
-        for overlay in overlays:
-            loader.add_overlay(overlay)
-
-        generate_rpc(loader.lrpc_def(), Path(output), generate_core=core)
-        log.info("Generated LRPC code for %s in %s", definition_file.name, output)
-
-        for overlay in overlays:
-            log.info("Applied overlay %s", overlay.name)
-
-    # catching general exception here is considered ok, because application will terminate
-    # pylint: disable=broad-exception-caught
-    except Exception as e:
-        level_is_debug = log.isEnabledFor(logging.DEBUG)
-        more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
-        log.exception(
-            "Error while generating code for %s%s",
-            definition_file.name,
-            more_info,
-            exc_info=level_is_debug,
-        )
+    inputs = definition_inputs(definition_file, overlays)
+    options = CppOptions(
+        output=Path(output),
+        generate_core=core,
+        codec=codec,
+        jobs=jobs,
+        depfile=None if depfile is None else Path(depfile),
+        manifest=None if manifest is None else Path(manifest),
+        warnings_as_errors=warnings_as_errors,
+    )
+
+    if watch:
+        watch_and_generate_cpp(inputs, options)
+    elif not generate_cpp(definition_file, list(overlays), inputs, options):
         sys.exit(1)
 
 
@@ -143,8 +502,7 @@ def cppcore(output: os.PathLike[str], byte_type: LrpcByteType) -> None:
     """Generate C++ server core files. Generating these files separately from the rest of the server
     allows for having multiple servers in a single project without conflicting and/or duplicate files.
     Use in combination with the 'cpp' command and the '--no-core' option"""
-    export_resources_to(Path(output))
-    write_byte_types_file(Path(output).joinpath("lrpccore"), byte_type)
+    generate_core_files(Path(output), byte_type)
     log.info("Generated LRPC core code in %s", output)
 
 
@@ -217,5 +575,149 @@ def puml(definition_file: TextIO, warnings_as_errors: bool, output: os.PathLike[
     log.info("Generated PlantUML diagram for %s in %s", definition_file.name, output)
 
 
+def parse_rates(rates: Iterable[str]) -> dict[str, float]:
+    parsed = {}
+    for rate in rates:
+        name, separator, value = rate.partition("=")
+        if not separator:
+            raise click.BadParameter(f"Expected SERVICE.NAME=RATE, got {rate}", param_hint="'--rate'")
+        try:
+            parsed[name.strip()] = float(value)
+        except ValueError as e:
+            raise click.BadParameter(f"Invalid rate in {rate}", param_hint="'--rate'") from e
+
+    return parsed
+
+
+@run_cli.command()
+@click.option("-d", "--definition_file", help="LRPC definition file", required=True, type=click.File("r"))
+@click.option(
+    "-ov",
+    "--overlay",
+    "overlays",
+    help="Path to overlay file (multiple possible)",
+    required=False,
+    multiple=True,
+    type=click.File("r"),
+)
+@click.option("-b", "--baudrate", help="Baudrate of the link for the link budget", required=False, type=int)
+@click.option(
+    "-r",
+    "--rate",
+    "rates",
+    help="Target rate of a function or stream in calls or messages per second, e.g. srv0.f0=10 (multiple possible)",
+    required=False,
+    multiple=True,
+)
+@click.option(
+    "--bits_per_byte",
+    help="Number of bits on the link for every byte",
+    required=False,
+    default=DEFAULT_BITS_PER_BYTE,
+    show_default=True,
+    type=click.IntRange(min=8),
+)
+@click.option(
+    "-w",
+    "--warnings_as_errors",
+    help="Treat LRPC definition warnings as errors",
+    required=False,
+    default=False,
+    is_flag=True,
+    type=bool,
+)
+def sizes(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    definition_file: TextIO,
+    overlays: Iterable[TextIO],
+    baudrate: int | None,
+    rates: Iterable[str],
+    bits_per_byte: int,
+    *,
+    warnings_as_errors: bool,
+) -> None:
+    """Report the minimum and maximum size of every message in the LRPC definition file and,
+    when a baudrate is specified, the link budget"""
+
+    parsed_rates = parse_rates(rates)
+    if parsed_rates and baudrate is None:
+        raise click.BadParameter("Rates require a baudrate", param_hint="'--rate'")
+
+    try:
+        loader = DefinitionLoader(definition_file, warnings_as_errors=warnings_as_errors)
+        for overlay in overlays:
+            loader.add_overlay(overlay)
+
+        visitor = SizeReportVisitor(baudrate, parsed_rates, bits_per_byte)
+        loader.lrpc_def().accept(visitor, visit_meta_service=False)
+        click.echo(visitor.report(), nl=False)
+
+    # catching general exception here is considered ok, because application will terminate
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        level_is_debug = log.isEnabledFor(logging.DEBUG)
+        more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
+        log.exception(
+            "Error while reporting message sizes for %s%s",
+            definition_file.name,
+            more_info,
+            exc_info=level_is_debug,
+        )
+        sys.exit(1)
+
+
+@run_cli.command()
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "-j",
+    "--jobs",
+    help="Number of definitions to generate concurrently",
+    required=False,
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "-w",
+    "--warnings_as_errors",
+    help="Treat LRPC definition warnings as errors",
+    required=False,
+    default=False,
+    is_flag=True,
+    type=bool,
+)
+def build(manifest: Path, jobs: int, *, warnings_as_errors: bool) -> None:
+    """Generate C++ server code for all LRPC definitions in the build MANIFEST. The core
+    files are generated only once when the manifest specifies an output directory for them"""
+
+    level_is_debug = log.isEnabledFor(logging.DEBUG)
+
+    try:
+        build_manifest = BuildManifest.load(manifest)
+        core_output = build_manifest.core_output()
+        if core_output is not None:
+            generate_core_files(core_output, build_manifest.core_byte_type())
+            log.info("Generated LRPC core code in %s", core_output)
+
+    # catching general exception here is considered ok, because application will terminate
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        more_info = "" if level_is_debug else f". {e}. Use the DEBUG verbosity level to show more information"
+        log.exception("Error while loading build manifest %s%s", manifest, more_info, exc_info=level_is_debug)
+        sys.exit(1)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        generate_core = core_output is None
+        futures = []
+        for d in build_manifest.definitions():
+            build_options = {"generate_core": generate_core, "warnings_as_errors": warnings_as_errors}
+            futures.append((d, executor.submit(build_definition, d, **build_options)))
+
+        failures = sum(1 for d, f in futures if not report_build_result(d, f))
+
+    if failures != 0:
+        log.error("Code generation failed for %d of %d definitions", failures, len(futures))
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     run_cli()
@@ -1,4 +1,6 @@
 from .load_definition import DefinitionLoader as DefinitionLoader
 from .load_definition import load_lrpc_def as load_lrpc_def
+from .overlay_merge import OverlayMerger as OverlayMerger
 from .overlay_merge import YamlValues as YamlValues
 from .overlay_merge import merge_definition as merge_definition
+from .overlay_merge import merge_definitions as merge_definitions
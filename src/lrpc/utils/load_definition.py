@@ -1,7 +1,9 @@
-from collections.abc import Hashable
+import json
+from collections.abc import Collection
+from functools import cache
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, TextIO, cast
+from typing import TextIO, cast
 
 import jsonschema
 import yaml
@@ -9,41 +11,66 @@ import yaml
 from lrpc.core import LrpcDef, LrpcDefDict
 from lrpc.errors import LrpcDefinitionError
 from lrpc.resources.meta import meta_def_file
-from lrpc.schema import load_lrpc_schema
+from lrpc.schema import lrpc_schema_validator
 from lrpc.validation import SemanticAnalyzer
 
-from .overlay_merge import YamlValues, merge_definition
+from .overlay_merge import OverlayMerger, YamlValues
 
+# The C implementation of the YAML parser is much faster, but it is not available on every platform
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
-# pylint: disable = too-many-ancestors
-class LrpcLoader(yaml.SafeLoader):
-    """Purpose of this class is to determine if functions are specified
-    first or if streams are specified first in the definition file. The
-    result is stored in `functions_before_streams`, unless that field
-    has already been specified in the definition file"""
 
-    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[Hashable, Any]:  # noqa: FBT001, FBT002
-        mapping = super().construct_mapping(node, deep=deep)
+def load_yaml(stream: str | TextIO) -> YamlValues:
+    """Load a single YAML document with the fastest safe loader that is available"""
+    return cast(YamlValues, yaml.load(stream, Loader=YamlLoader))
 
-        if ("streams" not in mapping) and ("functions" not in mapping):
-            return mapping
 
-        if "functions_before_streams" in mapping:
-            return mapping
+def parse_definition(definition: str | TextIO) -> YamlValues:
+    """Parse an LRPC definition in YAML or in JSON. For every service, it is determined if functions
+    are specified first or if streams are specified first. The result is stored in `functions_before_streams`,
+    unless that field has already been specified in the definition"""
+    text = definition if isinstance(definition, str) else definition.read()
 
-        functions_index = float("inf")
-        streams_index = float("inf")
+    def_dict: YamlValues = _parse_json(text)
+    if def_dict is None:
+        def_dict = load_yaml(text)
+    if not isinstance(def_dict, dict):
+        raise TypeError("Invalid YAML input")
 
-        for sub_node in node.value:
-            for sub_sub_node in sub_node:
-                if sub_sub_node.value == "streams":
-                    streams_index = sub_sub_node.start_mark.index
-                if sub_sub_node.value == "functions":
-                    functions_index = sub_sub_node.start_mark.index
+    _add_functions_before_streams(def_dict)
+    return def_dict
 
-        mapping["functions_before_streams"] = functions_index < streams_index
 
-        return mapping
+def _parse_json(text: str) -> YamlValues:
+    # JSON is also valid YAML, but the JSON parser is much faster
+    if not text.lstrip().startswith("{"):
+        return None
+
+    try:
+        return cast(YamlValues, json.loads(text))
+    except json.JSONDecodeError:
+        # E.g. a YAML flow mapping
+        return None
+
+
+def _add_functions_before_streams(definition: dict[str, YamlValues]) -> None:
+    services = definition.get("services")
+    if not isinstance(services, list):
+        return
+
+    for service in services:
+        if (not isinstance(service, dict)) or ("functions_before_streams" in service):
+            continue
+
+        # Parsed mappings have the same order as the definition
+        keys = list(service)
+        if ("functions" in keys) or ("streams" in keys):
+            functions_index = keys.index("functions") if "functions" in keys else len(keys)
+            streams_index = keys.index("streams") if "streams" in keys else len(keys)
+            service["functions_before_streams"] = functions_index < streams_index
 
 
 LrpcDefDefSourceType = str | TextIO | Path
@@ -57,14 +84,16 @@ class DefinitionLoader:
         warnings_as_errors: bool = True,
         include_meta_def: bool = True,
     ) -> None:
-        self._definition = self._base_yaml_documents(definition_base)
+        # All overlays are merged into the same merger, so that parts of the definition that are
+        # modified by multiple overlays are copied from the base only once
+        self._merger = OverlayMerger(self._base_yaml_documents(definition_base))
         self._warnings_as_errors = warnings_as_errors
 
         if include_meta_def:
-            self._definition = merge_definition(self._definition, self._load_meta_def_dict())
+            self._merger.merge(self._load_meta_def_dict())
 
     def save_to(self, file: TextIO) -> None:
-        yaml.dump(self._definition, file, sort_keys=False)
+        yaml.dump(self._merger.result(), file, sort_keys=False)
 
     def add_overlay(self, overlay_source: LrpcDefDefSourceType) -> None:
         if isinstance(overlay_source, Path):
@@ -74,11 +103,18 @@ class DefinitionLoader:
 
         self._overlay_yaml_documents(overlay_source)
 
-    def lrpc_def(self) -> LrpcDef:
-        self._validate(self._definition)
-        lrpc_def = LrpcDef(cast(LrpcDefDict, self._definition))
+    def definition(self) -> YamlValues:
+        """The definition with all overlays merged, before it is validated"""
+        return self._merger.result()
+
+    def lrpc_def(self, *, services: Collection[str] | None = None) -> LrpcDef:
+        """Validate the merged definition. With services, the semantic checks of single services
+        are limited to the services with these names, see SemanticAnalyzer.analyze"""
+        definition = self._merger.result()
+        self._validate(definition)
+        lrpc_def = LrpcDef(cast(LrpcDefDict, definition))
         sa = SemanticAnalyzer(lrpc_def)
-        sa.analyze(warnings_as_errors=self._warnings_as_errors)
+        sa.analyze(warnings_as_errors=self._warnings_as_errors, services=services)
 
         return lrpc_def
 
@@ -86,38 +122,34 @@ class DefinitionLoader:
         if not isinstance(overlays, (str, TextIOWrapper)):
             raise TypeError(f"Unsupported overlay type: {type(overlays)}")
 
-        for overlay in yaml.safe_load_all(overlays):
-            self._definition = merge_definition(self._definition, overlay)
+        for overlay in yaml.load_all(overlays, Loader=YamlLoader):
+            self._merger.merge(overlay)
 
     @staticmethod
     def _base_yaml_documents(base: LrpcDefDefSourceType) -> YamlValues:
         if isinstance(base, (str, TextIOWrapper)):
-            return DefinitionLoader._safe_load_base(base)
+            return parse_definition(base)
         if isinstance(base, Path):
             with base.open(encoding="utf-8") as def_file:
-                return DefinitionLoader._safe_load_base(def_file)
+                return parse_definition(def_file)
 
         raise TypeError(f"Unsupported definition base type: {type(base)}")
 
+    # Loaded only once, so that generating code for many definitions in a single process is faster.
+    # The result must not be modified. The merged definition shares unmodified parts with it, but
+    # the merger never modifies its inputs and LrpcDef works on a copy
     @staticmethod
+    @cache
     def _load_meta_def_dict() -> YamlValues:
         with meta_def_file() as mdf, mdf.open(encoding="utf-8") as meta_def:
-            return cast(YamlValues, yaml.safe_load(meta_def))
+            return load_yaml(meta_def)
 
     @staticmethod
     def _validate(definition: YamlValues) -> None:
-        try:
-            jsonschema.validate(definition, load_lrpc_schema())
-        except jsonschema.ValidationError as e:
-            raise LrpcDefinitionError(e.message) from e
-
-    @staticmethod
-    def _safe_load_base(base: str | TextIO) -> YamlValues:
-        def_dict: YamlValues = yaml.load(base, Loader=LrpcLoader)  # noqa: S506
-        if not isinstance(def_dict, dict):
-            raise TypeError("Invalid YAML input")
-
-        return def_dict
+        # Same error as reported by jsonschema.validate
+        error = jsonschema.exceptions.best_match(lrpc_schema_validator().iter_errors(definition))
+        if error is not None:
+            raise LrpcDefinitionError(error.message) from error
 
 
 def load_lrpc_def(
@@ -1,99 +1,229 @@
+from collections.abc import Iterable
 from copy import deepcopy
-from typing import Literal, cast, get_args
+from typing import Final, Literal, cast, get_args
 
 YamlValue = bool | int | float | str | None
 YamlValues = YamlValue | list["YamlValues"] | dict[str, "YamlValues"]
 
 MergeStrategy = Literal["add", "remove", "replace", "unspecified"]
 
+MERGE_STRATEGY: Final = "merge_strategy"
+
 
 def merge_definition(
     base: YamlValues,
     overlay: YamlValues,
 ) -> YamlValues:
-    if not isinstance(base, dict):
-        raise TypeError("base must be a dict")
-    if not isinstance(overlay, dict):
-        raise TypeError("overlay must be a dict")
-
-    base_copy = deepcopy(base)
-    overlay_copy = deepcopy(overlay)
-
-    return _strip_nulls(_merge_dicts(base_copy, overlay_copy, "unspecified"))
-
-
-def _merge_values(base: YamlValues, overlay: YamlValues, strategy: MergeStrategy) -> YamlValues:
-    if isinstance(base, dict) and isinstance(overlay, dict):
-        return _merge_dicts(base, overlay, strategy)
-
-    if isinstance(base, list) and isinstance(overlay, list):
-        return _merge_lists(base, overlay, strategy)
-
-    raise TypeError(f"Unable to merge type '{type(base).__name__}' and type '{type(overlay).__name__}'")
-
-
-def _merge_dicts(
-    base: dict[str, YamlValues],
-    overlay: dict[str, YamlValues],
-    strategy: MergeStrategy,
-) -> dict[str, YamlValues]:
-    if strategy == "replace":
-        return overlay
-
-    new_strategy = _pop_strategy(overlay, strategy)
-    for key, overlay_value in overlay.items():
-        if isinstance(overlay_value, (dict, list)):
-            base_value = base.get(key, type(overlay_value)())
-            base[key] = _merge_values(base_value, overlay_value, new_strategy)
-        else:
-            base_value = base.get(key)
-            base[key] = _merge_basic_item(key, base_value, overlay_value, new_strategy)
-    return base
-
-
-def _merge_lists(base: list[YamlValues], overlay: list[YamlValues], strategy: MergeStrategy) -> list[YamlValues]:
-    if strategy == "replace":
-        return overlay
+    return merge_definitions(base, [overlay])
+
+
+def merge_definitions(base: YamlValues, overlays: Iterable[YamlValues]) -> YamlValues:
+    """Merge all overlays into the base, in the specified order. The result does not share
+    any parts with the base or the overlays"""
+    merger = OverlayMerger(base)
+    for overlay in overlays:
+        merger.merge(overlay)
+
+    return deepcopy(merger.result())
+
+
+class OverlayMerger:
+    """Merges a sequence of overlays into a base definition without modifying the base or the overlays.
+    Only the parts of the definition that are modified by an overlay are copied. The result shares all
+    other parts with the base and the overlays and must therefore not be modified. An overlay that
+    cannot be merged leaves the definition unchanged"""
+
+    def __init__(self, base: YamlValues) -> None:
+        if not isinstance(base, dict):
+            raise TypeError("base must be a dict")
+
+        self._definition: YamlValues = base
+        # Containers created by the merger, by id. Only these can be modified in place. The
+        # containers are kept alive by this dict, so that their id is not reused during the merge
+        self._owned: dict[int, dict[str, YamlValues] | list[YamlValues]] = {}
+        # Name to index map of the named items in owned lists, created on first use
+        self._named_items: dict[int, dict[str, int]] = {}
+        # Contents of the owned containers that are modified by the current merge, as they were before
+        # the merge. None for the containers that are created by the current merge
+        self._previous: dict[int, dict[str, YamlValues] | list[YamlValues] | None] = {}
+
+    def merge(self, overlay: YamlValues) -> None:
+        if not isinstance(overlay, dict):
+            raise TypeError("overlay must be a dict")
+
+        try:
+            self._definition = self._merge_dicts(
+                cast(dict[str, YamlValues], self._definition),
+                overlay,
+                "unspecified",
+            )
+        except Exception:
+            self._rollback()
+            raise
+        finally:
+            self._previous.clear()
+
+    def result(self) -> YamlValues:
+        # The result is shared with the caller, so the next merge must copy again
+        self._owned.clear()
+        self._named_items.clear()
+        return _strip_nulls(self._definition)
+
+    def _rollback(self) -> None:
+        for key, previous in self._previous.items():
+            owned = self._owned[key]
+            self._named_items.pop(key, None)
+            if previous is None:
+                del self._owned[key]
+            elif isinstance(owned, dict) and isinstance(previous, dict):
+                owned.clear()
+                owned.update(previous)
+            elif isinstance(owned, list) and isinstance(previous, list):
+                owned[:] = previous
+
+    def _own_dict(self, value: dict[str, YamlValues]) -> dict[str, YamlValues]:
+        if id(value) in self._owned:
+            if id(value) not in self._previous:
+                self._previous[id(value)] = dict(value)
+            return value
+
+        owned = dict(value)
+        self._owned[id(owned)] = owned
+        self._previous[id(owned)] = None
+        return owned
+
+    def _own_list(self, value: list[YamlValues]) -> list[YamlValues]:
+        if id(value) in self._owned:
+            if id(value) not in self._previous:
+                self._previous[id(value)] = list(value)
+            return value
+
+        owned = list(value)
+        self._owned[id(owned)] = owned
+        self._previous[id(owned)] = None
+        return owned
+
+    def _merge_values(self, base: YamlValues, overlay: YamlValues, strategy: MergeStrategy) -> YamlValues:
+        if isinstance(base, dict) and isinstance(overlay, dict):
+            return self._merge_dicts(base, overlay, strategy)
+
+        if isinstance(base, list) and isinstance(overlay, list):
+            return self._merge_lists(base, overlay, strategy)
+
+        raise TypeError(f"Unable to merge type '{type(base).__name__}' and type '{type(overlay).__name__}'")
+
+    def _merge_dicts(
+        self,
+        base: dict[str, YamlValues],
+        overlay: dict[str, YamlValues],
+        strategy: MergeStrategy,
+    ) -> dict[str, YamlValues]:
+        if strategy == "replace":
+            return overlay
+
+        new_strategy = _get_strategy(overlay, strategy)
+        merged = base
+        for key, overlay_value in overlay.items():
+            if key == MERGE_STRATEGY:
+                continue
+
+            merged = self._own_dict(merged)
+            # A property that was removed by a previous overlay is None until the nulls are stripped
+            base_value = merged.get(key)
+            if isinstance(overlay_value, (dict, list)):
+                if base_value is None:
+                    base_value = type(overlay_value)()
+                merged[key] = self._merge_values(base_value, overlay_value, new_strategy)
+            else:
+                merged[key] = _merge_basic_item(key, base_value, overlay_value, new_strategy)
+        return merged
+
+    def _merge_lists(
+        self,
+        base: list[YamlValues],
+        overlay: list[YamlValues],
+        strategy: MergeStrategy,
+    ) -> list[YamlValues]:
+        if strategy == "replace":
+            return overlay
+
+        for overlay_item in overlay:
+            if isinstance(overlay_item, list):
+                raise NotImplementedError("Cannot merge list of list")
+            if isinstance(overlay_item, dict):
+                item_name = _get_name(overlay_item)
+                item_strategy = _get_strategy(overlay_item, strategy)
+                base = self._merge_list_of_named_composites(
+                    base,
+                    _without_strategy(overlay_item),
+                    item_name,
+                    item_strategy,
+                )
+            else:
+                base = self._merge_list_of_basic_items(base, overlay_item, strategy)
+        return base
 
-    for overlay_item in overlay:
-        if isinstance(overlay_item, list):
-            raise NotImplementedError("Cannot merge list of list")
-        if isinstance(overlay_item, dict):
-            item_name = _get_name(overlay_item)
-            item_strategy = _pop_strategy(overlay_item, strategy)
-            base = _merge_list_of_named_composites(base, overlay_item, item_name, item_strategy)
+    def _merge_list_of_named_composites(
+        self,
+        base: list[YamlValues],
+        overlay_item: dict[str, YamlValues],
+        overlay_item_name: str,
+        strategy: MergeStrategy,
+    ) -> list[YamlValues]:
+        merged = self._own_list(base)
+        index = self._named_item_index(merged).get(overlay_item_name)
+
+        if strategy in {"unspecified", "replace"}:
+            if index is not None:
+                merged[index] = self._merge_values(merged[index], overlay_item, strategy)
+            else:
+                raise ValueError(f"Item {overlay_item_name} not found in base. Strategy is '{strategy}'")
+
+        elif strategy == "remove":
+            if index is not None:
+                merged.pop(index)
+                del self._named_items[id(merged)]
+            else:
+                raise ValueError(f"Item {overlay_item_name} not found in base. Strategy is '{strategy}'")
+
+        # Strategy is add
+        elif index is not None:
+            merged[index] = self._merge_values(merged[index], overlay_item, strategy)
         else:
-            base = _merge_list_of_basic_items(base, overlay_item, strategy)
-    return base
-
-
-def _merge_list_of_named_composites(
-    base: list[YamlValues],
-    overlay_item: YamlValues,
-    overlay_item_name: str,
-    strategy: MergeStrategy,
-) -> list[YamlValues]:
-    base_item, index = _named_composite_from_list(base, overlay_item_name)
-
-    if strategy in {"unspecified", "replace"}:
-        if base_item is not None:
-            base[index] = _merge_values(base_item, overlay_item, strategy)
+            merged.append(overlay_item)
+            self._named_items[id(merged)][overlay_item_name] = len(merged) - 1
+
+        return merged
+
+    def _merge_list_of_basic_items(
+        self,
+        base: list[YamlValues],
+        overlay_item: YamlValues,
+        strategy: MergeStrategy,
+    ) -> list[YamlValues]:
+        if strategy == "unspecified":
+            raise ValueError("Merge strategy not specified")
+
+        merged = self._own_list(base)
+        if strategy == "remove":
+            merged[:] = [base_item for base_item in merged if base_item != overlay_item]
+            self._named_items.pop(id(merged), None)
         else:
-            raise ValueError(f"Item {overlay_item_name} not found in base. Strategy is '{strategy}'")
+            merged.append(overlay_item)
 
-    elif strategy == "remove":
-        if base_item is not None:
-            base.pop(index)
-        else:
-            raise ValueError(f"Item {overlay_item_name} not found in base. Strategy is '{strategy}'")
+        return merged
 
-    # Strategy is add
-    elif base_item is not None:
-        base[index] = _merge_values(base_item, overlay_item, strategy)
-    else:
-        base.append(overlay_item)
+    def _named_item_index(self, items: list[YamlValues]) -> dict[str, int]:
+        # The first item with a name is the one that is merged
+        index = self._named_items.get(id(items))
+        if index is None:
+            index = {}
+            for i, item in enumerate(items):
+                if isinstance(item, dict):
+                    index.setdefault(_get_name(item), i)
+            self._named_items[id(items)] = index
 
-    return base
+        return index
 
 
 def _merge_basic_item(key: str, base: YamlValues, overlay: YamlValues, strategy: MergeStrategy) -> YamlValues:
@@ -122,31 +252,26 @@ def _merge_basic_item(key: str, base: YamlValues, overlay: YamlValues, strategy:
     return overlay
 
 
-def _merge_list_of_basic_items(
-    base: list[YamlValues],
-    overlay_item: YamlValues,
-    strategy: MergeStrategy,
-) -> list[YamlValues]:
-    if strategy == "unspecified":
-        raise ValueError("Merge strategy not specified")
-
-    if strategy == "remove":
-        return [base_item for base_item in base if base_item != overlay_item]
-
-    base.append(overlay_item)
-    return base
-
-
 def _strip_nulls(value: YamlValues) -> YamlValues:
+    # Parts without nulls are not copied
     if isinstance(value, dict):
-        return {k: _strip_nulls(v) for k, v in value.items() if v is not None}
+        stripped_dict = {k: _strip_nulls(v) for k, v in value.items() if v is not None}
+        if (len(stripped_dict) == len(value)) and all(v is value[k] for k, v in stripped_dict.items()):
+            return value
+        return stripped_dict
     if isinstance(value, (list, tuple)):
-        return [_strip_nulls(v) for v in value if v is not None]
+        stripped_list = [_strip_nulls(v) for v in value if v is not None]
+        unchanged = (len(stripped_list) == len(value)) and all(
+            s is v for s, v in zip(stripped_list, value, strict=True)
+        )
+        if isinstance(value, list) and unchanged:
+            return value
+        return stripped_list
     return value
 
 
-def _pop_strategy(item: dict[str, YamlValues], default: MergeStrategy = "unspecified") -> MergeStrategy:
-    strategy = item.pop("merge_strategy", default)
+def _get_strategy(item: dict[str, YamlValues], default: MergeStrategy = "unspecified") -> MergeStrategy:
+    strategy = item.get(MERGE_STRATEGY, default)
     if not isinstance(strategy, str):
         raise TypeError(f"Invalid merge_strategy type. Expected 'str' but got '{type(strategy).__name__}'")
 
@@ -156,6 +281,13 @@ def _pop_strategy(item: dict[str, YamlValues], default: MergeStrategy = "unspeci
     return cast(MergeStrategy, strategy)
 
 
+def _without_strategy(item: dict[str, YamlValues]) -> dict[str, YamlValues]:
+    if MERGE_STRATEGY not in item:
+        return item
+
+    return {k: v for k, v in item.items() if k != MERGE_STRATEGY}
+
+
 def _get_name(item: dict[str, YamlValues]) -> str:
     if "name" not in item:
         raise ValueError("Property 'name' not found")
@@ -166,15 +298,3 @@ def _get_name(item: dict[str, YamlValues]) -> str:
         raise TypeError(f"Property 'name' is '{type(name).__name__}' instead of 'str'")
 
     return name
-
-
-def _composite_has_name(item: YamlValues, name: str) -> bool:
-    return isinstance(item, dict) and (_get_name(item) == name)
-
-
-def _named_composite_from_list(subject: list[YamlValues], name: str) -> tuple[YamlValues, int]:
-    for i, s in enumerate(subject):
-        if _composite_has_name(s, name):
-            return s, i
-
-    return None, 0
@@ -1,4 +1,6 @@
+from .buffer_size import BufferSizeValidator as BufferSizeValidator
 from .custom_types import CustomTypesValidator as CustomTypesValidator
+from .encoding import EncodingValidator as EncodingValidator
 from .enum import EnumValidator as EnumValidator
 from .function_and_stream import (
     FunctionAndStreamIdValidator as FunctionAndStreamIdValidator,
@@ -9,6 +11,9 @@ from .function_and_stream import (
 from .names import NamesValidator as NamesValidator
 from .param_and_return import ParamAndReturnValidator as ParamAndReturnValidator
 from .semantic_analyzer import SemanticAnalyzer as SemanticAnalyzer
+from .semantic_analyzer import register_validator as register_validator
+from .semantic_analyzer import unregister_validator as unregister_validator
 from .service import ServiceValidator as ServiceValidator
+from .stream import StreamValidator as StreamValidator
 from .struct import StructValidator as StructValidator
 from .validator import LrpcValidator as LrpcValidator
@@ -0,0 +1,52 @@
+from lrpc.core import LrpcDef, LrpcService, RpcSettings
+from lrpc.core.buffer_size import MessageSize, request_sizes, response_sizes
+
+from .validator import LrpcValidator
+
+
+class BufferSizeValidator(LrpcValidator):
+    PER_SERVICE = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lrpc_def: LrpcDef
+        self._settings: RpcSettings
+        self._services: set[str] = set()
+
+    def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
+        self.reset()
+        self._lrpc_def = lrpc_def
+        self._services.clear()
+
+    def visit_rpc_settings(self, settings: RpcSettings) -> None:
+        self._settings = settings
+
+    def visit_lrpc_service(self, service: LrpcService) -> None:
+        self._services.add(service.name())
+
+    def visit_lrpc_def_end(self) -> None:
+        try:
+            requests = request_sizes(self._lrpc_def)
+            responses = response_sizes(self._lrpc_def)
+        except (KeyError, ValueError):
+            # Undeclared custom types are reported by the CustomTypesValidator
+            return
+
+        self._check(requests, "receive", "rx_buffer_size", self._settings.rx_buffer_size())
+        self._check(responses, "transmit", "tx_buffer_size", self._settings.tx_buffer_size())
+
+    def _check(self, sizes: list[MessageSize], buffer: str, setting: str, buffer_size: int) -> None:
+        # Only the messages of the visited services
+        for s in (s for s in sizes if s.service in self._services):
+            required = s.required_buffer_size()
+            if required <= buffer_size:
+                continue
+
+            message = (
+                f"{s.description()} requires a {buffer} buffer of {required} bytes, but {setting} is {buffer_size}"
+            )
+            # The meta service is not part of the user definition, so its messages only give a warning
+            if s.service == "LrpcMeta":
+                self.add_warning(message)
+            else:
+                self.add_error(message)
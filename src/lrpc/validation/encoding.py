@@ -0,0 +1,100 @@
+from struct import calcsize
+
+from lrpc.core import LrpcDef, LrpcFun, LrpcService, LrpcStream, LrpcStruct, LrpcVar
+
+from .validator import LrpcValidator
+
+
+class EncodingValidator(LrpcValidator):
+    PER_SERVICE = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._current_service: str = ""
+        self._current_function_or_stream: str = ""
+        self._lrpc_def: LrpcDef
+
+    def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
+        self.reset()
+        self._lrpc_def = lrpc_def
+        self._current_service = ""
+        self._current_function_or_stream = ""
+
+    def visit_lrpc_service(self, service: LrpcService) -> None:
+        self._current_service = service.name()
+
+    def visit_lrpc_function(self, function: LrpcFun) -> None:
+        self._current_function_or_stream = function.name()
+
+    def visit_lrpc_stream(self, stream: LrpcStream) -> None:
+        self._current_function_or_stream = stream.name()
+
+    def visit_lrpc_function_param(self, param: LrpcVar) -> None:
+        self._check_var(param)
+
+    def visit_lrpc_function_return(self, ret: LrpcVar) -> None:
+        self._check_var(ret)
+
+    def visit_lrpc_stream_param(self, param: LrpcVar) -> None:
+        self._check_var(param)
+
+    def visit_lrpc_stream_return(self, ret: LrpcVar) -> None:
+        self._check_var(ret)
+
+    def visit_lrpc_struct_field(self, struct: LrpcStruct, field: LrpcVar) -> None:
+        self._check_encoding(field, struct.name())
+        if not field.is_bit_field():
+            return
+
+        if not struct.is_packed():
+            self.add_error(
+                f"Bit width is only supported for fields of packed structs: {struct.name()}.{field.name()}",
+            )
+        else:
+            self._check_bit_width(field, struct.name())
+
+    def _check_var(self, var: LrpcVar) -> None:
+        scope = self._function_or_stream_name()
+        self._check_encoding(var, scope)
+        if var.is_bit_field():
+            self.add_error(f"Bit width is only supported for fields of packed structs: {scope}.{var.name()}")
+
+    def _function_or_stream_name(self) -> str:
+        return f"{self._current_service}.{self._current_function_or_stream}"
+
+    def _check_encoding(self, var: LrpcVar, scope: str) -> None:
+        if var.is_varint() and not var.base_type_is_integral():
+            self.add_error(f"Varint encoding is only supported for integer types: {scope}.{var.name()}")
+
+        if var.is_fixed_point() and not var.base_type_is_integral():
+            self.add_error(f"Scale and offset are only supported for integer types: {scope}.{var.name()}")
+
+    def _check_bit_width(self, var: LrpcVar, scope: str) -> None:
+        name = f"{scope}.{var.name()}"
+        if var.is_array() or var.is_optional() or var.is_varint():
+            self.add_error(f"Bit width is only supported for bool, integer and enum fields: {name}")
+        elif var.base_type_is_bool():
+            self._check_bit_width_fits(var, 1, name)
+        elif var.base_type_is_integral():
+            self._check_bit_width_fits(var, calcsize("<" + var.pack_type()) * 8, name)
+        elif var.base_type_is_enum():
+            self._check_enum_bit_width(var, name)
+        else:
+            self.add_error(f"Bit width is only supported for bool, integer and enum fields: {name}")
+
+    def _check_bit_width_fits(self, var: LrpcVar, type_width: int, name: str) -> None:
+        if var.bit_width() > type_width:
+            self.add_error(f"Bit width {var.bit_width()} of {name} exceeds the size of {var.base_type()}")
+
+    def _check_enum_bit_width(self, var: LrpcVar, name: str) -> None:
+        self._check_bit_width_fits(var, 8, name)
+
+        try:
+            enum = self._lrpc_def.enum(var.base_type())
+        except ValueError:
+            # Undeclared custom types are reported by the CustomTypesValidator
+            return
+
+        max_id = max(f.id() for f in enum.fields())
+        if max_id >= (1 << var.bit_width()):
+            self.add_error(f"Bit width {var.bit_width()} of {name} is too small for the IDs of {enum.name()}")
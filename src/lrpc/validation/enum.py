@@ -4,6 +4,8 @@ from .validator import LrpcValidator
 
 
 class EnumValidator(LrpcValidator):
+    PER_SERVICE = True
+
     def __init__(self) -> None:
         super().__init__()
         self._enum_ids: set[int] = set()
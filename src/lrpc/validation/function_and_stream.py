@@ -6,6 +6,8 @@ from .validator import LrpcValidator
 
 
 class FunctionAndStreamIdValidator(LrpcValidator):
+    PER_SERVICE = True
+
     def __init__(self) -> None:
         super().__init__()
         self._ids: set[int] = set()
@@ -38,6 +40,8 @@ class FunctionAndStreamIdValidator(LrpcValidator):
 
 
 class FunctionAndStreamNameValidator(LrpcValidator):
+    PER_SERVICE = True
+
     def __init__(self) -> None:
         super().__init__()
         self._function_and_stream_names: set[str] = set()
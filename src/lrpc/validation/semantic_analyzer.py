@@ -1,19 +1,53 @@
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Collection
+from concurrent.futures import ProcessPoolExecutor
 
 from lrpc.core import LrpcDef
 from lrpc.errors import LrpcDefinitionError
+from lrpc.visitors.multi_visitor import LrpcMultiVisitor
 
+from .buffer_size import BufferSizeValidator
 from .custom_types import CustomTypesValidator
+from .encoding import EncodingValidator
 from .enum import EnumValidator
 from .function_and_stream import FunctionAndStreamIdValidator, FunctionAndStreamNameValidator
 from .names import NamesValidator
 from .param_and_return import ParamAndReturnValidator
 from .service import ServiceValidator
+from .stream import StreamValidator
 from .struct import StructValidator
+from .validator import LrpcValidator
 
-if TYPE_CHECKING:
-    from .validator import LrpcValidator
+LrpcValidatorFactory = Callable[[], LrpcValidator]
+
+_registered_validators: list[LrpcValidatorFactory] = []
+
+
+def register_validator(factory: LrpcValidatorFactory) -> None:
+    """Register an additional validator that is run for every LRPC definition, after the
+    built-in validators. The factory, typically the validator class, is called once per
+    analysis. For parallel analysis, the factory and the validator must be picklable"""
+    if factory not in _registered_validators:
+        _registered_validators.append(factory)
+
+
+def unregister_validator(factory: LrpcValidatorFactory) -> None:
+    if factory in _registered_validators:
+        _registered_validators.remove(factory)
+
+
+def _visit(
+    definition: LrpcDef,
+    validators: list[LrpcValidator],
+    services: Collection[str] | None = None,
+) -> list[LrpcValidator]:
+    if services is None:
+        definition.accept(LrpcMultiVisitor(validators))
+    else:
+        definition.accept(LrpcMultiVisitor(v for v in validators if v.PER_SERVICE), services=services)
+        definition.accept(LrpcMultiVisitor(v for v in validators if not v.PER_SERVICE))
+
+    return validators
 
 
 # pylint: disable = too-few-public-methods
@@ -31,13 +65,20 @@ class SemanticAnalyzer:
             StructValidator(),
             NamesValidator(),
             CustomTypesValidator(),
+            StreamValidator(),
+            EncodingValidator(),
+            BufferSizeValidator(),
         ]
+        self._validators.extend(factory() for factory in _registered_validators)
 
         self._log = logging.getLogger(self.__class__.__name__)
 
-    def analyze(self, *, warnings_as_errors: bool) -> None:
-        for validator in self._validators:
-            self._definition.accept(validator)
+    def analyze(self, *, warnings_as_errors: bool, jobs: int = 1, services: Collection[str] | None = None) -> None:
+        """Run all validators in a single traversal of the definition. With jobs > 1, the validators
+        are distributed over that many processes. This only pays off for very large definitions.
+        With services, validators that check every service on its own only check the services with
+        these names. Use this for a definition of which only these services changed since it was valid"""
+        for validator in self._run_validators(jobs, services):
             self._errors.extend(validator.errors())
             self._warnings.extend(validator.warnings())
 
@@ -55,3 +96,14 @@ class SemanticAnalyzer:
             self._log.info("Warnings treated as error")
             msg = f"Warnings treated as error: {self._warnings}"
             raise LrpcDefinitionError(msg)
+
+    def _run_validators(self, jobs: int, services: Collection[str] | None) -> list[LrpcValidator]:
+        if jobs <= 1:
+            return _visit(self._definition, self._validators, services)
+
+        groups = [self._validators[i::jobs] for i in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            visited = list(executor.map(_visit, [self._definition] * len(groups), groups, [services] * len(groups)))
+
+        # Validators with their results, in the original order
+        return [visited[i % jobs][i // jobs] for i in range(len(self._validators))]
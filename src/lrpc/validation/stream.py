@@ -0,0 +1,59 @@
+from lrpc.core import LrpcDef, LrpcService, LrpcStream
+from lrpc.core.encoded_size import stream_message_size
+
+from .validator import LrpcValidator
+
+
+class StreamValidator(LrpcValidator):
+    PER_SERVICE = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lrpc_def: LrpcDef
+        self._current_service: str = ""
+
+    def visit_lrpc_def(self, lrpc_def: LrpcDef) -> None:
+        self.reset()
+        self._lrpc_def = lrpc_def
+        self._current_service = ""
+
+    def visit_lrpc_service(self, service: LrpcService) -> None:
+        self._current_service = service.name()
+
+    def visit_lrpc_stream(self, stream: LrpcStream) -> None:
+        if stream.has_sequence_number() and (stream.origin() != LrpcStream.Origin.SERVER):
+            self.add_error(
+                "Sequence numbers are only supported for streams with origin server: "
+                f"{self._current_service}.{stream.name()}",
+            )
+
+        if stream.is_rate_limited():
+            self._check_rate_limit(stream)
+
+        if stream.is_batched():
+            self._check_batch(stream)
+
+    def _check_rate_limit(self, stream: LrpcStream) -> None:
+        name = f"{self._current_service}.{stream.name()}"
+
+        if stream.origin() != LrpcStream.Origin.SERVER:
+            self.add_error(f"Rate limiting is only supported for streams with origin server: {name}")
+        elif stream.is_finite():
+            self.add_error(f"Rate limiting is not supported for finite streams: {name}")
+
+    def _check_batch(self, stream: LrpcStream) -> None:
+        name = f"{self._current_service}.{stream.name()}"
+
+        if stream.origin() != LrpcStream.Origin.SERVER:
+            self.add_error(f"Batching is only supported for streams with origin server: {name}")
+            return
+
+        try:
+            sample_size = stream_message_size(stream, self._lrpc_def).maximum
+        except ValueError:
+            # Undeclared custom types are reported by the CustomTypesValidator
+            return
+
+        # The size of the batch is checked by the BufferSizeValidator
+        if sample_size is None:
+            self.add_error(f"Batched stream {name} must not contain auto strings")
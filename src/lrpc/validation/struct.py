@@ -4,6 +4,8 @@ from .validator import LrpcValidator
 
 
 class StructValidator(LrpcValidator):
+    PER_SERVICE = True
+
     def __init__(self) -> None:
         super().__init__()
         self._struct_names: set[str] = set()
@@ -2,6 +2,10 @@ from lrpc.visitors import LrpcVisitor
 
 
 class LrpcValidator(LrpcVisitor):
+    # True for validators that check every service on its own. When only some services of a definition
+    # changed, these validators only visit the changed services. Other validators visit all services
+    PER_SERVICE = False
+
     def __init__(self) -> None:
         self._errors: set[str] = set()
         self._warnings: set[str] = set()
@@ -1,2 +1,3 @@
 from .lrpc_visitor import LrpcVisitor as LrpcVisitor
+from .multi_visitor import LrpcMultiVisitor as LrpcMultiVisitor
 from .puml_visitor import PlantUmlVisitor as PlantUmlVisitor
@@ -0,0 +1,41 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .lrpc_visitor import LrpcVisitor
+
+VISIT_METHODS = [name for name in vars(LrpcVisitor) if name.startswith("visit_")]
+
+
+class LrpcMultiVisitor(LrpcVisitor):
+    """Visitor that forwards every visit to multiple visitors, in the order in which the visitors
+    are specified. This visits the LRPC definition for all visitors in a single traversal"""
+
+    def __init__(self, visitors: Iterable[LrpcVisitor]) -> None:
+        self._visitors = list(visitors)
+        # Only forward to the visitors that override a method, so that
+        # visitors that handle just a few nodes do not slow down the traversal
+        self._targets: dict[str, list[Callable[..., None]]] = {
+            name: [getattr(v, name) for v in self._visitors if getattr(type(v), name) is not getattr(LrpcVisitor, name)]
+            for name in VISIT_METHODS
+        }
+
+    def visitors(self) -> list[LrpcVisitor]:
+        return self._visitors
+
+    def targets(self, name: str) -> list[Callable[..., None]]:
+        """Bound visit methods that a visit with the given name is forwarded to"""
+        return self._targets[name]
+
+
+def _forward(name: str) -> Callable[..., None]:
+    def visit(self: LrpcMultiVisitor, *args: Any) -> None:
+        for target in self.targets(name):
+            target(*args)
+
+    visit.__name__ = name
+    visit.__doc__ = getattr(LrpcVisitor, name).__doc__
+    return visit
+
+
+for _name in VISIT_METHODS:
+    setattr(LrpcMultiVisitor, _name, _forward(_name))
@@ -0,0 +1,221 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from lrpc.core.encoded_size import (
+    BATCH_HEADER_SIZE,
+    MESSAGE_HEADER_SIZE,
+    SEQUENCE_NUMBER_SIZE,
+    EncodedSize,
+    encoded_size,
+    function_request_size,
+    function_response_size,
+    stream_request_size,
+    stream_response_size,
+)
+
+from .lrpc_visitor import LrpcVisitor
+
+if TYPE_CHECKING:
+    from lrpc.core import LrpcDef, LrpcFun, LrpcService, LrpcStream, LrpcVar, RpcSettings
+
+# UART with 8 data bits, a start bit and a stop bit
+DEFAULT_BITS_PER_BYTE = 10
+
+
+@dataclass
+class MessageReport:
+    """Size of a message in one direction and the contribution of every part of the message"""
+
+    size: EncodedSize
+    parts: list[tuple[str, str, EncodedSize]] = field(default_factory=list)
+    messages_per_frame: int = 1
+
+
+@dataclass
+class EntryReport:
+    """Sizes of the request and response of a function or stream"""
+
+    name: str
+    kind: str
+    request: MessageReport | None = None
+    response: MessageReport | None = None
+
+
+def size_string(size: EncodedSize) -> str:
+    if size.maximum == size.minimum:
+        return str(size.minimum)
+
+    maximum = "*" if size.maximum is None else str(size.maximum)
+    return f"{size.minimum}..{maximum}"
+
+
+def var_type_string(var: "LrpcVar") -> str:
+    t = var.base_type()
+    if var.is_optional():
+        return f"{t}?"
+    if var.is_array():
+        return f"{t}[{var.array_size()}]"
+    return t
+
+
+class SizeReportVisitor(LrpcVisitor):
+    """Creates a report of the minimum and maximum frame size of every function and stream.
+    When a baudrate is specified, the report also contains the link budget. Rates are specified
+    per function or stream as calls or messages per second, e.g. {'srv0.f0': 10.0}"""
+
+    def __init__(
+        self,
+        baudrate: int | None = None,
+        rates: dict[str, float] | None = None,
+        bits_per_byte: int = DEFAULT_BITS_PER_BYTE,
+    ) -> None:
+        self._baudrate = baudrate
+        self._rates = rates or {}
+        self._bits_per_byte = bits_per_byte
+        self._lrpc_def: LrpcDef
+        self._rx_buffer_size = 0
+        self._tx_buffer_size = 0
+        self._service = ""
+        self._entries: list[EntryReport] = []
+        self._entry: EntryReport
+        self._report = ""
+
+    def report(self) -> str:
+        return self._report
+
+    def visit_lrpc_def(self, lrpc_def: "LrpcDef") -> None:
+        self._lrpc_def = lrpc_def
+        self._entries = []
+
+    def visit_rpc_settings(self, settings: "RpcSettings") -> None:
+        self._rx_buffer_size = settings.rx_buffer_size()
+        self._tx_buffer_size = settings.tx_buffer_size()
+
+    def visit_lrpc_service(self, service: "LrpcService") -> None:
+        self._service = service.name()
+
+    def visit_lrpc_function(self, function: "LrpcFun") -> None:
+        self._entry = EntryReport(
+            f"{self._service}.{function.name()}",
+            "function",
+            self._message(function_request_size(function, self._lrpc_def), MESSAGE_HEADER_SIZE),
+            self._message(function_response_size(function, self._lrpc_def), MESSAGE_HEADER_SIZE),
+        )
+
+    def visit_lrpc_function_param(self, param: "LrpcVar") -> None:
+        self._add_part(self._entry.request, param)
+
+    def visit_lrpc_function_return(self, ret: "LrpcVar") -> None:
+        self._add_part(self._entry.response, ret)
+
+    def visit_lrpc_function_end(self) -> None:
+        self._entries.append(self._entry)
+
+    def visit_lrpc_stream(self, stream: "LrpcStream") -> None:
+        kind = f"{stream.origin().value} stream"
+        self._entry = EntryReport(
+            f"{self._service}.{stream.name()}",
+            kind,
+            self._message(stream_request_size(stream, self._lrpc_def), MESSAGE_HEADER_SIZE),
+        )
+
+        response_size = stream_response_size(stream, self._lrpc_def)
+        if response_size is not None:
+            header = BATCH_HEADER_SIZE if stream.is_batched() else MESSAGE_HEADER_SIZE
+            self._entry.response = self._message(response_size, header)
+            self._entry.response.messages_per_frame = stream.batch_size()
+            if stream.has_sequence_number():
+                sequence_size = EncodedSize(SEQUENCE_NUMBER_SIZE, SEQUENCE_NUMBER_SIZE)
+                self._entry.response.parts.append(("sequence", "uint8_t", sequence_size))
+
+    def visit_lrpc_stream_param(self, param: "LrpcVar") -> None:
+        self._add_part(self._entry.request, param)
+
+    def visit_lrpc_stream_return(self, ret: "LrpcVar") -> None:
+        self._add_part(self._entry.response, ret)
+
+    def visit_lrpc_stream_end(self) -> None:
+        self._entries.append(self._entry)
+
+    def visit_lrpc_def_end(self) -> None:
+        lines = [f"Buffer sizes: rx {self._rx_buffer_size}, tx {self._tx_buffer_size}"]
+
+        for entry in self._entries:
+            lines.append("")
+            lines.append(f"{entry.name} ({entry.kind})")
+            lines.extend(self._message_lines("request", entry.request, self._rx_buffer_size))
+            lines.extend(self._message_lines("response", entry.response, self._tx_buffer_size))
+
+        if self._baudrate is not None:
+            lines.append("")
+            lines.extend(self._link_budget_lines(self._baudrate))
+
+        self._report = "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _message(size: EncodedSize, header: int) -> MessageReport:
+        return MessageReport(size, [("header", "", EncodedSize(header, header))])
+
+    def _add_part(self, message: MessageReport | None, var: "LrpcVar") -> None:
+        if message is not None:
+            message.parts.append((var.name(), var_type_string(var), encoded_size(var, self._lrpc_def)))
+
+    @staticmethod
+    def _frame_maximum(message: MessageReport | None, buffer_size: int) -> int:
+        if message is None:
+            return 0
+
+        # Auto strings and bytearrays are limited by the buffer
+        maximum = buffer_size if message.size.maximum is None else min(message.size.maximum, buffer_size)
+        return max(maximum, message.size.minimum)
+
+    def _message_lines(self, direction: str, message: MessageReport | None, buffer_size: int) -> list[str]:
+        if message is None:
+            return []
+
+        frame = size_string(EncodedSize(message.size.minimum, self._frame_maximum(message, buffer_size)))
+        batch = f" ({message.messages_per_frame} messages)" if message.messages_per_frame > 1 else ""
+        lines = [f"  {direction:<9} {frame} bytes{batch}"]
+
+        name_width = max(len(p[0]) for p in message.parts)
+        type_width = max(len(p[1]) for p in message.parts)
+        for name, var_type, size in message.parts:
+            lines.append(f"    {name:<{name_width}}  {var_type:<{type_width}}  {size_string(size)}")
+
+        return lines
+
+    def _link_budget_lines(self, baudrate: int) -> list[str]:
+        bytes_per_second = baudrate / self._bits_per_byte
+        lines = [f"Link budget at {baudrate} baud ({bytes_per_second:.0f} bytes/s in each direction)"]
+
+        unknown = set(self._rates) - {e.name for e in self._entries}
+        if len(unknown) != 0:
+            raise ValueError(f"Rate specified for unknown function or stream: {', '.join(sorted(unknown))}")
+
+        rx_load = 0.0
+        tx_load = 0.0
+        for entry in self._entries:
+            request = self._frame_maximum(entry.request, self._rx_buffer_size)
+            response = self._frame_maximum(entry.response, self._tx_buffer_size)
+            # A server stream is started once, after which only the server transmits
+            if entry.kind == "server stream":
+                request = 0
+
+            messages_per_frame = 1 if entry.response is None else entry.response.messages_per_frame
+            max_rate = bytes_per_second * messages_per_frame / max(request, response)
+            line = f"  {entry.name:<30} max {max_rate:10.1f}/s"
+
+            rate = self._rates.get(entry.name)
+            if rate is not None:
+                frames_per_second = rate / messages_per_frame
+                rx_load += frames_per_second * request
+                tx_load += frames_per_second * response
+                line += f"  target {rate:10.1f}/s"
+                if rate > max_rate:
+                    line += "  exceeds link capacity"
+
+            lines.append(line)
+
+        lines.append(f"  Utilization client -> server: {100 * rx_load / bytes_per_second:.1f} %")
+        lines.append(f"  Utilization server -> client: {100 * tx_load / bytes_per_second:.1f} %")
+        return lines
@@ -0,0 +1,174 @@
+"""Throughput benchmark of the Python client codec.
+
+Encoding with lrpc_encode and decoding with LrpcDecoder are measured for every type class in
+test_lrpc_encode_decode.lrpc.yaml. Decoding of complete responses with LrpcClient.decode and a
+round trip through an in-memory loopback transport are measured with the functions of srv1.
+
+Usage: python -m tests.benchmarks.bench_codec -o results.json [--baseline previous.json]
+"""
+
+import json
+import platform
+import timeit
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Literal
+
+import click
+
+from lrpc.client import LrpcClient, LrpcDecoder, lrpc_encode
+from lrpc.core import LrpcDef, LrpcVar, LrpcVarDict
+from lrpc.types import LrpcType
+from lrpc.utils import load_lrpc_def
+
+DEFINITION = Path(__file__).parent.parent.joinpath("testdata", "test_lrpc_encode_decode.lrpc.yaml")
+
+MY_STRUCT1 = {"f0": 4567, "f1": 123, "f2": True}
+
+
+@dataclass(frozen=True)
+class CodecCase:
+    name: str
+    var: LrpcVar
+    value: LrpcType
+
+
+def codec_cases() -> list[CodecCase]:
+    def case(name: str, var_type: str, value: LrpcType, count: int | Literal["?"] = 1) -> CodecCase:
+        return CodecCase(name, LrpcVar(LrpcVarDict(name="v", type=var_type, count=count)), value)
+
+    return [
+        case("uint8_t", "uint8_t", 123),
+        case("int32_t", "int32_t", -123456),
+        case("uint64_t", "uint64_t", 2**60),
+        case("double", "double", 3.14159),
+        case("bool", "bool", value=True),
+        case("fixed string", "string_32", "The quick brown fox"),
+        case("auto string", "string", "The quick brown fox jumps over the lazy dog"),
+        case("bytearray", "bytearray", bytes(range(64))),
+        case("optional (set)", "uint32_t", 123456, "?"),
+        case("optional (empty)", "uint32_t", None, "?"),
+        case("array", "uint16_t", list(range(32)), 32),
+        case("array of strings", "string_8", ["abc", "defgh", "ij", "k"], 4),
+        case("enum", "enum@MyEnum1", "test2"),
+        case("struct", "struct@MyStruct1", MY_STRUCT1),
+        case("nested struct", "struct@MyStruct2", {"f0": MY_STRUCT1}),
+        case(
+            "struct with optional and array",
+            "struct@MyStruct3",
+            {"f0": ["ab", "c"], "f1": {"f0": MY_STRUCT1}, "f2": "test1"},
+        ),
+        case(
+            "packed struct",
+            "struct@MyStruct4",
+            {"f0": True, "f1": False, "f2": 5, "f3": -3, "f4": "test2", "f5": 1234, "f6": True},
+        ),
+    ]
+
+
+class LoopbackTransport:
+    """Transport with an in-memory server that echoes every request as response. This is a valid
+    response for functions that return the same types as their parameters, like srv1.add5"""
+
+    def __init__(self) -> None:
+        self._received: deque[int] = deque()
+
+    def read(self, count: int) -> bytes:
+        return bytes(self._received.popleft() for _ in range(min(count, len(self._received))))
+
+    def write(self, data: bytes) -> None:
+        self._received.extend(data)
+
+
+def measure(fn: Callable[[], object], message_size: int, number: int | None) -> dict[str, float]:
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+
+    # The minimum of multiple runs is the least noisy estimate of the execution time
+    seconds = min(timer.repeat(repeat=3, number=number)) / number
+    return {
+        "messages_per_second": 1 / seconds,
+        "ns_per_byte": 1e9 * seconds / message_size,
+        "message_size": message_size,
+    }
+
+
+def decode_value(encoded: bytes, var: LrpcVar, lrpc_def: LrpcDef) -> LrpcType:
+    return LrpcDecoder(encoded, lrpc_def).lrpc_decode(var)
+
+
+def encode_decode_results(lrpc_def: LrpcDef, number: int | None) -> dict[str, dict[str, dict[str, float]]]:
+    encode = {}
+    decode = {}
+    for c in codec_cases():
+        encoded = lrpc_encode(c.value, c.var, lrpc_def)
+        encode[c.name] = measure(partial(lrpc_encode, c.value, c.var, lrpc_def), len(encoded), number)
+        decode[c.name] = measure(partial(decode_value, encoded, c.var, lrpc_def), len(encoded), number)
+
+    return {"encode": encode, "decode": decode}
+
+
+def client_results(lrpc_def: LrpcDef, number: int | None) -> dict[str, dict[str, dict[str, float]]]:
+    client = LrpcClient(lrpc_def, LoopbackTransport())
+    calls: dict[str, tuple[str, LrpcType]] = {
+        "add5": ("add5", 123),
+        "bytearray (16)": ("bytearray", bytes(16)),
+        "bytearray (128)": ("bytearray", bytes(128)),
+    }
+
+    decode = {}
+    round_trip = {}
+    for name, (function, p0) in calls.items():
+        # The echoed request is the response
+        response = client.encode("srv1", function, p0=p0)
+        decode[name] = measure(partial(client.decode, response), len(response), number)
+        round_trip[name] = measure(partial(client.communicate, "srv1", function, p0=p0), 2 * len(response), number)
+
+    return {"client_decode": decode, "round_trip": round_trip}
+
+
+def run_benchmark(number: int | None = None) -> dict[str, Any]:
+    """Throughput of every codec operation. When number is None, the number of
+    iterations is chosen such that a single measurement takes at least 0.2 s"""
+    lrpc_def = load_lrpc_def(DEFINITION)
+    return {
+        "lrpc_version": version("lotusrpc"),
+        "python_version": platform.python_version(),
+        "results": encode_decode_results(lrpc_def, number) | client_results(lrpc_def, number),
+    }
+
+
+def report(benchmark: dict[str, Any], baseline: dict[str, Any] | None) -> list[str]:
+    lines = []
+    for operation, cases in benchmark["results"].items():
+        lines.append(f"{operation}")
+        for name, result in cases.items():
+            line = f"  {name:<32} {result['messages_per_second']:12.0f} msg/s {result['ns_per_byte']:10.1f} ns/byte"
+            if baseline is not None:
+                previous = baseline["results"].get(operation, {}).get(name)
+                if previous is not None:
+                    line += f"  {result['messages_per_second'] / previous['messages_per_second']:6.2f}x baseline"
+            lines.append(line)
+
+    return lines
+
+
+@click.command()
+@click.option("-o", "--output", help="JSON file for the results", required=True, type=click.Path(path_type=Path))
+@click.option("--baseline", help="Results of a previous run to compare with", type=click.Path(path_type=Path))
+def bench_codec(output: Path, baseline: Path | None) -> None:
+    benchmark = run_benchmark()
+    output.write_text(json.dumps(benchmark, indent=2) + "\n", encoding="utf-8")
+
+    baseline_results = None if baseline is None else json.loads(baseline.read_text(encoding="utf-8"))
+    for line in report(benchmark, baseline_results):
+        click.echo(line)
+
+
+if __name__ == "__main__":
+    bench_codec()  # pylint: disable=no-value-for-parameter
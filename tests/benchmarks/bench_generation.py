@@ -0,0 +1,206 @@
+"""Benchmark of loading, validating and generating code for synthetic LRPC definitions of increasing size.
+
+Every stage is timed separately for every size. The scaling exponent of a stage is the slope of
+the execution time against the number of functions on a log-log scale between the smallest and
+the largest definition. An exponent well above 1 means that the stage scales super-linearly.
+
+Usage: python -m tests.benchmarks.bench_generation -o results.json [--baseline previous.json]
+"""
+
+import json
+import math
+import platform
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+import click
+import yaml
+
+from lrpc.codegen import (
+    ConstantsFileVisitor,
+    EnumFileVisitor,
+    MetaServiceVisitor,
+    ServerIncludeVisitor,
+    ServiceIncludeVisitor,
+    ServiceShimVisitor,
+    StructFileVisitor,
+)
+from lrpc.core import LrpcDef, LrpcDefDict
+from lrpc.resources.meta import meta_def_file
+from lrpc.schema import lrpc_schema_validator
+from lrpc.utils import OverlayMerger, YamlValues
+from lrpc.utils.load_definition import load_yaml, parse_definition
+from lrpc.validation import SemanticAnalyzer
+from lrpc.visitors import LrpcVisitor
+
+from .synthetic import SyntheticParams, synthetic_definition, synthetic_overlays
+
+T = TypeVar("T")
+
+VISITORS: dict[str, Callable[[Path], LrpcVisitor]] = {
+    "ServerIncludeVisitor": ServerIncludeVisitor,
+    "ServiceIncludeVisitor": ServiceIncludeVisitor,
+    "StructFileVisitor": StructFileVisitor,
+    "EnumFileVisitor": EnumFileVisitor,
+    "ServiceShimVisitor": ServiceShimVisitor,
+    "ConstantsFileVisitor": ConstantsFileVisitor,
+    "MetaServiceVisitor": MetaServiceVisitor,
+}
+
+
+def timed(stages: dict[str, float], stage: str, fn: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = fn()
+    stages[stage] = time.perf_counter() - start
+    return result
+
+
+def parse(definition_text: str, overlay_texts: list[str]) -> tuple[YamlValues, list[YamlValues]]:
+    return parse_definition(definition_text), [load_yaml(o) for o in overlay_texts]
+
+
+def merge(base: YamlValues, overlays: list[YamlValues]) -> YamlValues:
+    # Same as DefinitionLoader, which shares the unmodified parts of the definition with its inputs
+    merger = OverlayMerger(base)
+    for overlay in overlays:
+        merger.merge(overlay)
+    return merger.result()
+
+
+def generate(stages: dict[str, float], lrpc_def: LrpcDef) -> None:
+    """Execution time in seconds of every code generation visitor"""
+    with tempfile.TemporaryDirectory() as output:
+        for name, visitor in VISITORS.items():
+            timed(stages, name, partial(lrpc_def.accept, visitor(Path(output))))
+
+
+def run_stages(params: SyntheticParams) -> dict[str, float]:
+    """Execution time in seconds of every stage for a single definition"""
+    definition_text = synthetic_definition(params)
+    overlay_texts = synthetic_overlays(params)
+    with meta_def_file() as mdf, mdf.open(encoding="utf-8") as meta_def:
+        meta = yaml.safe_load(meta_def)
+
+    stages: dict[str, float] = {}
+    base, overlays = timed(stages, "parse", partial(parse, definition_text, overlay_texts))
+    definition = timed(stages, "merge", partial(merge, base, [meta, *overlays]))
+    timed(stages, "schema", lambda: lrpc_schema_validator().validate(definition))
+    lrpc_def = timed(stages, "construct", lambda: LrpcDef(cast(LrpcDefDict, definition)))
+    timed(stages, "analyze", lambda: SemanticAnalyzer(lrpc_def).analyze(warnings_as_errors=False))
+    generate(stages, lrpc_def)
+
+    stages["total"] = sum(stages.values())
+    return stages
+
+
+def scaled_params(params: SyntheticParams, steps: int) -> list[SyntheticParams]:
+    """Definitions that double in size with every step, up to the specified definition"""
+    sizes = []
+    for step in range(steps):
+        divisor = 2 ** (steps - 1 - step)
+        sizes.append(
+            SyntheticParams(
+                services=max(1, params.services // divisor),
+                functions=max(1, params.functions // divisor),
+                structs=max(1, params.structs // divisor),
+                depth=params.depth,
+                overlays=params.overlays,
+            ),
+        )
+
+    return sizes
+
+
+def scaling_exponents(results: list[dict[str, Any]]) -> dict[str, float]:
+    first = results[0]
+    last = results[-1]
+    size_ratio = last["total_functions"] / first["total_functions"]
+    if size_ratio <= 1:
+        return {}
+
+    return {
+        stage: math.log(last["stages"][stage] / first["stages"][stage]) / math.log(size_ratio)
+        for stage in first["stages"]
+        if first["stages"][stage] > 0
+    }
+
+
+def run_benchmark(params: SyntheticParams, steps: int, repeat: int) -> dict[str, Any]:
+    results = []
+    for p in scaled_params(params, steps):
+        # The minimum of multiple runs is the least noisy estimate of the execution time
+        runs = [run_stages(p) for _ in range(repeat)]
+        stages = {stage: min(r[stage] for r in runs) for stage in runs[0]}
+        results.append({"params": p.as_dict(), "total_functions": p.total_functions(), "stages": stages})
+
+    return {
+        "lrpc_version": version("lotusrpc"),
+        "python_version": platform.python_version(),
+        "results": results,
+        "scaling": scaling_exponents(results),
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Time of every stage of the largest definition relative to the baseline"""
+    current_stages = current["results"][-1]["stages"]
+    baseline_stages = baseline["results"][-1]["stages"]
+    lines = []
+    for stage, seconds in current_stages.items():
+        if baseline_stages.get(stage, 0) > 0:
+            lines.append(f"{stage:<24} {seconds / baseline_stages[stage]:6.2f}x baseline")
+
+    return lines
+
+
+def report(benchmark: dict[str, Any]) -> list[str]:
+    stages = list(benchmark["results"][0]["stages"])
+    lines = [f"{'functions':>9} " + " ".join(f"{s[:12]:>12}" for s in stages)]
+    for result in benchmark["results"]:
+        times = " ".join(f"{1000 * result['stages'][s]:10.1f}ms" for s in stages)
+        lines.append(f"{result['total_functions']:>9} {times}")
+
+    lines.append(f"{'exponent':>9} " + " ".join(f"{benchmark['scaling'].get(s, 0):12.2f}" for s in stages))
+    return lines
+
+
+@click.command()
+@click.option("-o", "--output", help="JSON file for the results", required=True, type=click.Path(path_type=Path))
+@click.option("--baseline", help="Results of a previous run to compare with", type=click.Path(path_type=Path))
+@click.option("--services", default=10, show_default=True, type=click.IntRange(min=1))
+@click.option("--functions", help="Functions per service", default=200, show_default=True, type=click.IntRange(1, 200))
+@click.option("--structs", default=50, show_default=True, type=click.IntRange(min=1))
+@click.option("--depth", help="Struct nesting depth", default=3, show_default=True, type=click.IntRange(min=1))
+@click.option("--overlays", default=2, show_default=True, type=click.IntRange(min=0))
+@click.option("--steps", help="Number of definition sizes", default=4, show_default=True, type=click.IntRange(min=1))
+@click.option("--repeat", help="Runs per definition size", default=3, show_default=True, type=click.IntRange(min=1))
+def bench_generation(  # noqa: PLR0913  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    output: Path,
+    baseline: Path | None,
+    services: int,
+    functions: int,
+    structs: int,
+    depth: int,
+    overlays: int,
+    steps: int,
+    repeat: int,
+) -> None:
+    params = SyntheticParams(services, functions, structs, depth, overlays)
+    benchmark = run_benchmark(params, steps, repeat)
+    output.write_text(json.dumps(benchmark, indent=2) + "\n", encoding="utf-8")
+
+    for line in report(benchmark):
+        click.echo(line)
+
+    if baseline is not None:
+        for line in compare(benchmark, json.loads(baseline.read_text(encoding="utf-8"))):
+            click.echo(line)
+
+
+if __name__ == "__main__":
+    bench_generation()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,84 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import yaml
+
+SCALAR_TYPES = ["uint8_t", "int16_t", "uint32_t", "float", "bool", "string_16"]
+
+
+@dataclass(frozen=True)
+class SyntheticParams:
+    """Size of a synthetic LRPC definition. Every function has a parameter of one of the structs
+    and returns one of the scalar types. Every struct is the head of a chain of nested structs
+    of the specified depth. Every overlay adds a function to every service"""
+
+    services: int = 1
+    functions: int = 10
+    structs: int = 5
+    depth: int = 1
+    overlays: int = 0
+
+    def total_functions(self) -> int:
+        return self.services * (self.functions + self.overlays)
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _struct_name(index: int, level: int) -> str:
+    return f"S{index}_{level}"
+
+
+def _structs(params: SyntheticParams) -> list[dict[str, Any]]:
+    structs: list[dict[str, Any]] = []
+    for i in range(params.structs):
+        for level in range(params.depth):
+            fields: list[dict[str, Any]] = [
+                {"name": f"f{n}", "type": t} for n, t in enumerate(SCALAR_TYPES[: 2 + (level % 3)])
+            ]
+            fields.append({"name": "e", "type": "@Mode"})
+            if level + 1 < params.depth:
+                fields.append({"name": "nested", "type": f"@{_struct_name(i, level + 1)}", "count": 2})
+            structs.append({"name": _struct_name(i, level), "fields": fields})
+
+    return structs
+
+
+def _function(index: int, params: SyntheticParams) -> dict[str, Any]:
+    return {
+        "name": f"f{index}",
+        "params": [
+            {"name": "p0", "type": f"@{_struct_name(index % params.structs, 0)}"},
+            {"name": "p1", "type": SCALAR_TYPES[index % len(SCALAR_TYPES)], "count": 1 + (index % 4)},
+        ],
+        "returns": [{"name": "r0", "type": SCALAR_TYPES[(index + 1) % len(SCALAR_TYPES)]}],
+    }
+
+
+def synthetic_definition(params: SyntheticParams) -> str:
+    definition = {
+        "name": "Synthetic",
+        "settings": {"namespace": "synth", "rx_buffer_size": 256, "tx_buffer_size": 256},
+        "services": [
+            {"name": f"srv{s}", "functions": [_function(f, params) for f in range(params.functions)]}
+            for s in range(params.services)
+        ],
+        "structs": _structs(params),
+        "enums": [{"name": "Mode", "fields": ["Off", "On", "Auto"]}],
+    }
+
+    return yaml.safe_dump(definition, sort_keys=False)
+
+
+def synthetic_overlays(params: SyntheticParams) -> list[str]:
+    overlays = []
+    for o in range(params.overlays):
+        function = _function(o, params)
+        function["name"] = f"ov{o}"
+        overlay = {
+            "merge_strategy": "add",
+            "services": [{"name": f"srv{s}", "functions": [function]} for s in range(params.services)],
+        }
+        overlays.append(yaml.safe_dump(overlay, sort_keys=False))
+
+    return overlays
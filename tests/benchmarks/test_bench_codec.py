@@ -0,0 +1,31 @@
+from lrpc.client import LrpcClient, LrpcDecoder, lrpc_encode
+from lrpc.utils import load_lrpc_def
+
+from .bench_codec import DEFINITION, LoopbackTransport, codec_cases, report, run_benchmark
+
+
+def test_codec_cases_round_trip() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+    for c in codec_cases():
+        encoded = lrpc_encode(c.value, c.var, lrpc_def)
+        assert LrpcDecoder(encoded, lrpc_def).lrpc_decode(c.var) == c.value, c.name
+
+
+def test_loopback_transport() -> None:
+    client = LrpcClient(load_lrpc_def(DEFINITION), LoopbackTransport())
+
+    assert client.communicate("srv1", "add5", p0=123).payload == {"r0": 123}
+    assert client.communicate("srv1", "bytearray", p0=b"\x01\x02").payload == {"r0": b"\x01\x02"}
+
+
+def test_run_benchmark() -> None:
+    benchmark = run_benchmark(number=2)
+
+    assert set(benchmark["results"]) == {"encode", "decode", "client_decode", "round_trip"}
+    assert set(benchmark["results"]["encode"]) == {c.name for c in codec_cases()}
+    for cases in benchmark["results"].values():
+        for result in cases.values():
+            assert result["messages_per_second"] > 0
+            assert result["ns_per_byte"] > 0
+
+    assert len(report(benchmark, benchmark)) == 4 + sum(len(c) for c in benchmark["results"].values())
@@ -0,0 +1,35 @@
+from lrpc.utils import DefinitionLoader
+
+from .bench_generation import VISITORS, run_benchmark, scaled_params
+from .synthetic import SyntheticParams, synthetic_definition, synthetic_overlays
+
+
+def test_synthetic_definition_is_valid() -> None:
+    params = SyntheticParams(services=2, functions=5, structs=3, depth=3, overlays=2)
+    loader = DefinitionLoader(synthetic_definition(params))
+    for overlay in synthetic_overlays(params):
+        loader.add_overlay(overlay)
+    lrpc_def = loader.lrpc_def()
+
+    assert len(lrpc_def.services()) == 2
+    assert sum(len(s.functions()) for s in lrpc_def.services()) == params.total_functions()
+    assert len(lrpc_def.structs()) == 9
+
+
+def test_scaled_params() -> None:
+    sizes = scaled_params(SyntheticParams(services=4, functions=40, structs=8, depth=2, overlays=1), 3)
+
+    assert [p.services for p in sizes] == [1, 2, 4]
+    assert [p.functions for p in sizes] == [10, 20, 40]
+    assert [p.structs for p in sizes] == [2, 4, 8]
+    assert all(p.depth == 2 for p in sizes)
+
+
+def test_run_benchmark() -> None:
+    benchmark = run_benchmark(SyntheticParams(services=2, functions=4, structs=2), steps=2, repeat=1)
+
+    assert len(benchmark["results"]) == 2
+    stages = benchmark["results"][-1]["stages"]
+    assert {"parse", "merge", "schema", "construct", "analyze", "total"} <= set(stages)
+    assert set(VISITORS) <= set(stages)
+    assert set(benchmark["scaling"]) == set(stages)
@@ -10,6 +10,7 @@
 #include <cstddef>
 #endif
 #include <cstdint>
+#include <limits>
 #include <numeric>
 #include <string>
 #include <type_traits>
@@ -994,4 +995,231 @@ TEST(TestEtlRwExtensions, roundTripArrayOfFixedSizeString)
     EXPECT_EQ("ab", dest.at(0));
     EXPECT_EQ("cd", dest.at(1));
     EXPECT_EQ(0U, reader.available_bytes());
-}
\ No newline at end of file
+}
+
+
+TEST(TestEtlRwExtensions, is_varint)
+{
+    EXPECT_FALSE(lrpc::is_varint<uint32_t>::value);
+    EXPECT_TRUE(lrpc::is_varint<lrpc::tags::varint<uint32_t>>::value);
+    EXPECT_TRUE((std::is_same<uint32_t, lrpc::varint_type<lrpc::tags::varint<uint32_t>>::type>::value));
+}
+
+TEST(TestEtlRwExtensions, readVarint)
+{
+    etl::vector<uint8_t, 7> storage{0x7F, 0xAC, 0x02, 0xFF, 0xFF, 0xFF, 0x0F};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+
+    EXPECT_EQ(127U, lrpc::read_unchecked<lrpc::tags::varint<uint32_t>>(reader));
+    EXPECT_EQ(300U, lrpc::read_unchecked<lrpc::tags::varint<uint32_t>>(reader));
+    EXPECT_EQ(0xFFFFFFFFU, lrpc::read_unchecked<lrpc::tags::varint<uint32_t>>(reader));
+    EXPECT_EQ(0U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, readVarintZigzag)
+{
+    etl::vector<uint8_t, 8> storage{0x00, 0x01, 0x02, 0x7F, 0xFE, 0xFF, 0x03, 0x01};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+
+    EXPECT_EQ(0, lrpc::read_unchecked<lrpc::tags::varint<int16_t>>(reader));
+    EXPECT_EQ(-1, lrpc::read_unchecked<lrpc::tags::varint<int16_t>>(reader));
+    EXPECT_EQ(1, lrpc::read_unchecked<lrpc::tags::varint<int16_t>>(reader));
+    EXPECT_EQ(-64, lrpc::read_unchecked<lrpc::tags::varint<int16_t>>(reader));
+    EXPECT_EQ(32767, lrpc::read_unchecked<lrpc::tags::varint<int16_t>>(reader));
+    EXPECT_EQ(-1, lrpc::read_unchecked<lrpc::tags::varint<int8_t>>(reader));
+    EXPECT_EQ(0U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, readVarintIncomplete)
+{
+    etl::vector<uint8_t, 2> storage{0x80, 0x80};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+
+    EXPECT_EQ(0U, lrpc::read_unchecked<lrpc::tags::varint<uint32_t>>(reader));
+    EXPECT_EQ(0U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, writeVarint)
+{
+    lrpc::array<uint8_t, 10> storage{};
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+
+    lrpc::write_unchecked<lrpc::tags::varint<uint32_t>>(writer, 300);
+    lrpc::write_unchecked<lrpc::tags::varint<int16_t>>(writer, -32768);
+    lrpc::write_unchecked<lrpc::tags::varint<int8_t>>(writer, 1);
+
+    const auto written = writer.used_data();
+    ASSERT_EQ(6, written.size());
+    EXPECT_EQ(0xAC, written.at(0));
+    EXPECT_EQ(0x02, written.at(1));
+    EXPECT_EQ(0xFF, written.at(2));
+    EXPECT_EQ(0xFF, written.at(3));
+    EXPECT_EQ(0x03, written.at(4));
+    EXPECT_EQ(0x02, written.at(5));
+}
+
+TEST(TestEtlRwExtensions, roundTripVarint64)
+{
+    lrpc::array<uint8_t, 20> storage{};
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+    lrpc::write_unchecked<lrpc::tags::varint<int64_t>>(writer, std::numeric_limits<int64_t>::min());
+    lrpc::write_unchecked<lrpc::tags::varint<uint64_t>>(writer, std::numeric_limits<uint64_t>::max());
+    EXPECT_EQ(20U, writer.size_bytes());
+
+    etl::byte_stream_reader reader(storage.data(), storage.size(), etl::endian::little);
+    EXPECT_EQ(std::numeric_limits<int64_t>::min(), lrpc::read_unchecked<lrpc::tags::varint<int64_t>>(reader));
+    EXPECT_EQ(std::numeric_limits<uint64_t>::max(), lrpc::read_unchecked<lrpc::tags::varint<uint64_t>>(reader));
+}
+
+TEST(TestEtlRwExtensions, roundTripArrayOfVarint)
+{
+    etl::vector<uint8_t, 6> storage(6);
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+    const lrpc::array<uint16_t, 3> values{1, 200, 3};
+    lrpc::write_unchecked<lrpc::tags::array_n<lrpc::tags::varint<uint16_t>>>(writer, values, 3);
+    EXPECT_EQ(4U, writer.size_bytes());
+
+    lrpc::array<uint16_t, 3> dest{};
+    etl::byte_stream_reader reader(storage.begin(), writer.size_bytes(), etl::endian::little);
+    lrpc::read_unchecked<lrpc::tags::array_n<lrpc::tags::varint<uint16_t>>>(reader, dest, 3);
+    EXPECT_EQ(1, dest.at(0));
+    EXPECT_EQ(200, dest.at(1));
+    EXPECT_EQ(3, dest.at(2));
+    EXPECT_EQ(0U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, roundTripOptionalVarint)
+{
+    etl::vector<uint8_t, 3> storage(3);
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+    const lrpc::optional<int32_t> value{-200};
+    lrpc::write_unchecked<lrpc::optional<lrpc::tags::varint<int32_t>>>(writer, value);
+    EXPECT_EQ(3U, writer.size_bytes());
+
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+    const auto read = lrpc::read_unchecked<lrpc::optional<lrpc::tags::varint<int32_t>>>(reader);
+    ASSERT_TRUE(read.has_value());
+    EXPECT_EQ(-200, read.value());
+}
+
+TEST(TestEtlRwExtensions, writeBitFields)
+{
+    lrpc::array<uint8_t, 4> storage{};
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+
+    lrpc::BitWriter bitWriter{writer};
+    bitWriter.write(1, 1);
+    bitWriter.write(0, 1);
+    bitWriter.write(5, 3);
+    bitWriter.write(static_cast<uint64_t>(int8_t{-3}), 4);
+    bitWriter.write(55, 6);
+    bitWriter.flush();
+
+    const auto written = writer.used_data();
+    ASSERT_EQ(2, written.size());
+    EXPECT_EQ(0xB5, written.at(0));
+    EXPECT_EQ(0x6F, written.at(1));
+}
+
+TEST(TestEtlRwExtensions, readBitFields)
+{
+    etl::vector<uint8_t, 3> storage{0xB5, 0x6F, 0x01};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+
+    lrpc::BitReader bitReader{reader};
+    EXPECT_EQ(1U, bitReader.read(1));
+    EXPECT_EQ(0U, bitReader.read(1));
+    EXPECT_EQ(5U, bitReader.read(3));
+    EXPECT_EQ(-3, bitReader.readSigned(4));
+    EXPECT_EQ(55U, bitReader.read(6));
+    EXPECT_EQ(1U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, roundTripBitField64)
+{
+    lrpc::array<uint8_t, 9> storage{};
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+
+    lrpc::BitWriter bitWriter{writer};
+    bitWriter.write(1, 1);
+    bitWriter.write(static_cast<uint64_t>(std::numeric_limits<int64_t>::min()), 64);
+    bitWriter.flush();
+    EXPECT_EQ(9U, writer.size_bytes());
+
+    etl::byte_stream_reader reader(storage.data(), storage.size(), etl::endian::little);
+    lrpc::BitReader bitReader{reader};
+    EXPECT_EQ(1U, bitReader.read(1));
+    EXPECT_EQ(std::numeric_limits<int64_t>::min(), bitReader.readSigned(64));
+}
+
+TEST(TestEtlRwExtensions, readFloat16)
+{
+    etl::vector<uint8_t, 10> storage{0x00, 0x00, 0x00, 0x3E, 0xFF, 0xFB, 0x01, 0x00, 0x00, 0x7C};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+
+    EXPECT_EQ(0.0F, lrpc::read_unchecked<lrpc::tags::float16>(reader));
+    EXPECT_EQ(1.5F, lrpc::read_unchecked<lrpc::tags::float16>(reader));
+    EXPECT_EQ(-65504.0F, lrpc::read_unchecked<lrpc::tags::float16>(reader));
+    // smallest subnormal
+    EXPECT_EQ(5.9604644775390625e-08F, lrpc::read_unchecked<lrpc::tags::float16>(reader));
+    EXPECT_EQ(std::numeric_limits<float>::infinity(), lrpc::read_unchecked<lrpc::tags::float16>(reader));
+    EXPECT_EQ(0U, reader.available_bytes());
+}
+
+TEST(TestEtlRwExtensions, writeFloat16)
+{
+    lrpc::array<uint8_t, 10> storage{};
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+
+    lrpc::write_unchecked<lrpc::tags::float16>(writer, 1.5F);
+    lrpc::write_unchecked<lrpc::tags::float16>(writer, -65504.0F);
+    // rounded to nearest even
+    lrpc::write_unchecked<lrpc::tags::float16>(writer, 1.00048828125F);
+    // too large for half precision
+    lrpc::write_unchecked<lrpc::tags::float16>(writer, 1e6F);
+    // too small for half precision
+    lrpc::write_unchecked<lrpc::tags::float16>(writer, -1e-10F);
+
+    const auto written = writer.used_data();
+    ASSERT_EQ(10, written.size());
+    EXPECT_EQ(0x00, written.at(0));
+    EXPECT_EQ(0x3E, written.at(1));
+    EXPECT_EQ(0xFF, written.at(2));
+    EXPECT_EQ(0xFB, written.at(3));
+    EXPECT_EQ(0x00, written.at(4));
+    EXPECT_EQ(0x3C, written.at(5));
+    EXPECT_EQ(0x00, written.at(6));
+    EXPECT_EQ(0x7C, written.at(7));
+    EXPECT_EQ(0x00, written.at(8));
+    EXPECT_EQ(0x80, written.at(9));
+}
+
+TEST(TestEtlRwExtensions, roundTripArrayOfFloat16)
+{
+    etl::vector<uint8_t, 6> storage(6);
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+    const lrpc::array<float, 2> values{0.25F, -3.0F};
+    lrpc::write_unchecked<lrpc::tags::array_n<lrpc::tags::float16>>(writer, values, 3);
+    EXPECT_EQ(6U, writer.size_bytes());
+
+    lrpc::array<float, 3> dest{1.0F, 1.0F, 1.0F};
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+    lrpc::read_unchecked<lrpc::tags::array_n<lrpc::tags::float16>>(reader, dest, 3);
+    EXPECT_EQ(0.25F, dest.at(0));
+    EXPECT_EQ(-3.0F, dest.at(1));
+    EXPECT_EQ(0.0F, dest.at(2));
+}
+
+TEST(TestEtlRwExtensions, roundTripOptionalFloat16)
+{
+    etl::vector<uint8_t, 3> storage(3);
+    etl::byte_stream_writer writer(storage, etl::endian::little);
+    const lrpc::optional<float> value{-0.5F};
+    lrpc::write_unchecked<lrpc::optional<lrpc::tags::float16>>(writer, value);
+    EXPECT_EQ(3U, writer.size_bytes());
+
+    etl::byte_stream_reader reader(storage.begin(), storage.end(), etl::endian::little);
+    const auto read = lrpc::read_unchecked<lrpc::optional<lrpc::tags::float16>>(reader);
+    ASSERT_TRUE(read.has_value());
+    EXPECT_EQ(-0.5F, read.value());
+}
@@ -0,0 +1,92 @@
+#include <cstdint>
+
+#include <gmock/gmock.h>
+#include <gtest/gtest.h>
+
+#include "TestUtils.hpp"
+#include "generated/Server2/Server2.hpp"
+#include "generated/core/lrpccore/ReceiveQueue.hpp"
+
+class MockReceiveQueueS0 : public srv0_shim
+{
+public:
+    MOCK_METHOD(void, f0, (bool p0, lrpc::string_view p1), (override));
+    MOCK_METHOD(void, f1, (lrpc::string_view p0, bool p1), (override));
+    MOCK_METHOD(void, f2, (lrpc::string_view p0, lrpc::string_view p1), (override));
+};
+
+class TestReceiveQueue : public testutils::TestServerBase<Server2, MockReceiveQueueS0>
+{
+public:
+    bool push(const lrpc::string_view hex) { return queue.pushFromIsr(testutils::hexToBytes(hex)); }
+
+    lrpc::ReceiveQueue<Server2, 16> queue{*this};
+};
+
+// Message f0(true, "") is 5 bytes: 0400000100
+
+TEST_F(TestReceiveQueue, dispatchOnPoll)
+{
+    EXPECT_CALL(service, f0(true, lrpc::string_view(""))).Times(0);
+    EXPECT_TRUE(push("0400000100"));
+    EXPECT_EQ("", response());
+
+    ::testing::Mock::VerifyAndClearExpectations(&service);
+
+    EXPECT_CALL(service, f0(true, lrpc::string_view("")));
+    EXPECT_EQ(5U, queue.poll());
+    EXPECT_EQ("020000", response());
+}
+
+TEST_F(TestReceiveQueue, pollEmptyQueue)
+{
+    EXPECT_EQ(0U, queue.poll());
+    EXPECT_EQ("", response());
+}
+
+TEST_F(TestReceiveQueue, messageSplitOverPushesAndPolls)
+{
+    EXPECT_CALL(service, f0(true, lrpc::string_view(""))).Times(2);
+
+    EXPECT_TRUE(push("04"));
+    EXPECT_TRUE(queue.pushFromIsr(uint8_t{0x00}));
+    EXPECT_EQ(2U, queue.poll());
+    EXPECT_TRUE(push("0001000400"));
+    EXPECT_EQ(5U, queue.poll());
+    EXPECT_TRUE(push("000100"));
+    EXPECT_EQ(3U, queue.poll());
+}
+
+TEST_F(TestReceiveQueue, wrapAround)
+{
+    EXPECT_CALL(service, f0(true, lrpc::string_view(""))).Times(4);
+
+    // 4 messages of 5 bytes do not fit in a queue of 16 bytes at once
+    for (int i = 0; i < 4; ++i)
+    {
+        EXPECT_TRUE(push("0400000100"));
+        EXPECT_EQ(5U, queue.poll());
+    }
+
+    EXPECT_EQ(0U, queue.dropped());
+}
+
+TEST_F(TestReceiveQueue, burstDroppedWhenFull)
+{
+    EXPECT_CALL(service, f0(true, lrpc::string_view(""))).Times(3);
+
+    EXPECT_TRUE(push("0400000100"));
+    EXPECT_TRUE(push("0400000100"));
+    EXPECT_TRUE(push("0400000100"));
+    // 1 byte left in the queue
+    EXPECT_FALSE(push("0400000100"));
+    EXPECT_EQ(5U, queue.dropped());
+
+    EXPECT_EQ(15U, queue.poll());
+
+    // space is available again after poll
+    EXPECT_CALL(service, f1(lrpc::string_view("Test"), true));
+    EXPECT_TRUE(push("080001546573740001"));
+    EXPECT_EQ(9U, queue.poll());
+    EXPECT_EQ("020001", response());
+}
@@ -25,7 +25,7 @@ namespace
     static_assert(
         std::is_same<test_rd::RetrieveDefinition, lrpc::Server<0, test_rd::LrpcMeta_service, 256, TxBufferSize>>::value,
         "Definition not as expected");
-    static_assert(CompressedDefSize == 432, "Compressed definition size not as expected");
+    static_assert(CompressedDefSize == 480, "Compressed definition size not as expected");
 
     constexpr size_t NumberFullPackets{CompressedDefSize / ChunkPayloadSize};
     constexpr size_t LastPacketPayloadSize{CompressedDefSize % ChunkPayloadSize};
@@ -36,13 +36,13 @@ namespace
 
 using TestRetrieveDefinition = testutils::TestServerBase<test_rd::RetrieveDefinition, MockRetrieveDefinitionS0, false>;
 
-// definition has a length of 432 bytes in compressed form
+// definition has a length of 480 bytes in compressed form
 // definition stream message from server to client has an overhead of
 // 5 bytes per chunk: message length, service ID, stream ID, chunk size, 'final' param
 // TX buffer size has been chosen in the definition as 112 bytes.
 // This leaves 112 - 5 = 107 bytes for the chunk payload. This means
 // that the compressed definition is transferred from server to client
-// in 4 full packets (107 bytes each) and 1 partial packet (4 bytes)
+// in 4 full packets (107 bytes each) and 1 partial packet (52 bytes)
 //
 // To update after re-running lrpcg on TestRetrieveDefinition.lrpc.yaml:
 //   1. Read tests/cpp/generated/RetrieveDefinition/LrpcMeta_constants.hpp
@@ -57,7 +57,7 @@ using TestRetrieveDefinition = testutils::TestServerBase<test_rd::RetrieveDefini
 //          changes if TxBufferSize changes in the definition settings.
 //        - "6B": chunk payload size in hex (107 = 0x6B) — only changes if TxBufferSize
 //          changes in the definition settings.
-//        - "08FF01" and "04": length byte and payload size of the partial last packet.
+//        - "38FF01" and "34": length byte and payload size of the partial last packet.
 //          Recompute as: length = DefStreamPacketOverhead + LastPacketPayloadSize - 1,
 //          payload size = CompressedDefSize % ChunkPayloadSize. If the new definition
 //          divides evenly (remainder 0), remove the partial-packet block entirely.
@@ -88,9 +88,9 @@ TEST_F(TestRetrieveDefinition, retrieveDefinition)
     const auto message = response.substr(start, LastPacketSizeHex);
 
     // length, service ID and stream ID
-    EXPECT_EQ("08FF01", message.substr(0, 6));
-    // bytearray length (4 remaining bytes)
-    EXPECT_EQ("04", message.substr(6, 2));
+    EXPECT_EQ("38FF01", message.substr(0, 6));
+    // bytearray length (52 remaining bytes)
+    EXPECT_EQ("34", message.substr(6, 2));
     // final
     EXPECT_EQ("01", message.substr(LastPacketSizeHex - HexDigitsPerByte, HexDigitsPerByte));
 }
\ No newline at end of file
@@ -64,6 +64,9 @@ public:
     MOCK_METHOD(uint32_t, f42, (), (override));
     MOCK_METHOD(void, f43, (uint64_t p0), (override));
     MOCK_METHOD(uint64_t, f44, (), (override));
+    MOCK_METHOD(uint32_t, f45, (int32_t p0, (lrpc::span<const uint16_t>)p1), (override));
+    MOCK_METHOD(srv1::PackedData, f46, (const srv1::PackedData& p0), (override));
+    MOCK_METHOD(float, f47, (float p0), (override));
     MOCK_METHOD(void, stream0, (lrpc::bytearray, bool), (override));
 };
 
@@ -71,6 +74,8 @@ using TestServer1 = testutils::TestServerBase<srv1::Server1, MockServer1S0>;
 
 static_assert(std::is_same<srv1::Server1, lrpc::Server<0, srv1::LrpcMeta_service, 100, 200>>::value,
               "RX and/or TX buffer size are unequal to the definition file");
+static_assert(srv1::srv0_shim::RequiredRxBufferSize == 24, "Unexpected size of the largest request");
+static_assert(srv1::srv0_shim::RequiredTxBufferSize == 13, "Unexpected size of the largest response");
 
 // Decode void function f0. Make sure f1 is not called
 TEST_F(TestServer1, decodeF0)
@@ -445,8 +450,73 @@ TEST_F(TestServer1, decodeF44)
     EXPECT_EQ("0A002CF0DEBC9A78563412", response);
 }
 
+// Decode function f45 with varint args and return value
+TEST_F(TestServer1, decodeF45)
+{
+    const std::vector<uint16_t> expected{0x0001, 0x012C};
+    EXPECT_CALL(service, f45(-2, testutils::SPAN_EQ(expected))).WillOnce(Return(300));
+    const auto response = receive("06002E0301AC02");
+    EXPECT_EQ("04002EAC02", response);
+}
+
+// Decode function f46 with packed struct arg and return value
+TEST_F(TestServer1, decodeF46)
+{
+    const srv1::PackedData expected{true, 5, -3, srv1::MyEnum::V2, 0x1234, true};
+    const srv1::PackedData returned{false, 7, -8, srv1::MyEnum::V3, 0xABCD, false};
+    EXPECT_CALL(service, f46(expected)).WillOnce(Return(returned));
+    const auto response = receive("07002FDB02341201");
+    EXPECT_EQ("07002F8E03CDAB00", response);
+}
+
+// Decode function f47 with float16 arg and return value
+TEST_F(TestServer1, decodeF47)
+{
+    EXPECT_CALL(service, f47(1.5F)).WillOnce(Return(-2.25F));
+    const auto response = receive("040030003E");
+    EXPECT_EQ("04003080C0", response);
+}
+
 TEST_F(TestServer1, retrieveDefinition)
 {
     const auto response = receive("02FF01");
     EXPECT_EQ("04FF010001", response);
 }
+
+// Multiple messages in a single call to lrpcReceive
+TEST_F(TestServer1, receiveMultipleMessages)
+{
+    const ::testing::InSequence seq;
+    EXPECT_CALL(service, f2(0x7B));
+    EXPECT_CALL(service, f3(0xCDAB));
+    EXPECT_CALL(service, f0());
+
+    const auto response = receive("0300027B" "040003ABCD" "020000");
+    EXPECT_EQ("020000", response);
+}
+
+// Messages split over multiple calls to lrpcReceive
+TEST_F(TestServer1, receiveSplitMessages)
+{
+    const ::testing::InSequence seq;
+    EXPECT_CALL(service, f3(0xCDAB));
+    EXPECT_CALL(service, f2(0x7B));
+
+    EXPECT_EQ("", receive("04"));
+    EXPECT_EQ("", receive("0003"));
+    EXPECT_EQ("020003", receive("ABCD03"));
+    EXPECT_EQ("020003", receive("00"));
+    EXPECT_EQ("020002", receive("027B"));
+}
+
+// Single byte receive mixed with receiving spans
+TEST_F(TestServer1, receiveSingleBytes)
+{
+    EXPECT_CALL(service, f3(0xCDAB));
+
+    lrpcReceive(uint8_t{0x04});
+    lrpcReceive(uint8_t{0x00});
+    EXPECT_EQ("", receive("03AB"));
+    lrpcReceive(uint8_t{0xCD});
+    EXPECT_EQ("020003", response());
+}
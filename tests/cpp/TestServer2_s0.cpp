@@ -1,4 +1,5 @@
 #include <type_traits>
+#include <vector>
 
 #include <gmock/gmock.h>
 #include <gtest/gtest.h>
@@ -19,6 +20,28 @@ using TestServer2 = testutils::TestServerBase<Server2, MockServer2S00>;
 static_assert(std::is_same<Server2, lrpc::Server<1, LrpcMeta_service, 100, 256>>::value,
               "RX and/or TX buffer size are unequal to the definition file");
 
+// Serializes responses alternately into two application owned buffers
+class TestServer2TransmitBuffer : public TestServer2
+{
+public:
+    Server2::TransmitBuffer& lrpcTransmitBuffer() override
+    {
+        auto& buffer = transmitBuffers.at(nextBuffer);
+        nextBuffer = (nextBuffer + 1U) % transmitBuffers.size();
+        return buffer;
+    }
+
+    void lrpcTransmit(lrpc::span<const uint8_t> bytes) override
+    {
+        transmittedData.push_back(bytes.data());
+        TestServer2::lrpcTransmit(bytes);
+    }
+
+    lrpc::array<Server2::TransmitBuffer, 2> transmitBuffers{};
+    size_t nextBuffer{0};
+    std::vector<const uint8_t*> transmittedData;
+};
+
 // Decode void function with auto string as last param
 TEST_F(TestServer2, decodeF0)
 {
@@ -60,4 +83,33 @@ TEST_F(TestServer2, versionInfo)
     EXPECT_TRUE(std::get<0>(version).empty());
     EXPECT_TRUE(std::get<1>(version).empty());
     EXPECT_FALSE(std::get<2>(version).empty());
+}
+
+// Responses are serialized directly into the buffers provided by the application
+TEST_F(TestServer2TransmitBuffer, transmitFromApplicationBuffers)
+{
+    EXPECT_CALL(service, f1(lrpc::string_view("Test"), true)).Times(3);
+
+    EXPECT_EQ("020001", receive("080001546573740001"));
+    EXPECT_EQ("020001", receive("080001546573740001"));
+    EXPECT_EQ("020001", receive("080001546573740001"));
+
+    ASSERT_EQ(3U, transmittedData.size());
+    EXPECT_EQ(transmitBuffers.at(0).data(), transmittedData.at(0));
+    EXPECT_EQ(transmitBuffers.at(1).data(), transmittedData.at(1));
+    EXPECT_EQ(transmitBuffers.at(0).data(), transmittedData.at(2));
+
+    EXPECT_EQ("020001", testutils::bytesToHex(lrpc::span<const uint8_t>(transmitBuffers.at(1).data(), 3)));
+}
+
+static_assert(meta::RxBufferSize == 100, "");
+static_assert(meta::TxBufferSize == 256, "");
+static_assert(meta::MaxServiceId == 1, "");
+static_assert(meta::Features == 0, "");
+
+TEST_F(TestServer2, capabilities)
+{
+    // rx buffer size 100, tx buffer size 256, max service ID 1, no features
+    const auto response = receive("02FF03");
+    EXPECT_EQ("0BFF03640000010100000000", response);
 }
\ No newline at end of file
@@ -7,6 +7,8 @@
 #include "TestUtils.hpp"
 #include "generated/Server5/Server5.hpp"
 
+using ::testing::Return;
+
 class MockServer5Srv0 : public srv5::srv0_shim
 {
 public:
@@ -21,6 +23,13 @@ public:
     MOCK_METHOD(void, server_infinite_stop, (), (override));
     MOCK_METHOD(void, server_finite, (), (override));
     MOCK_METHOD(void, server_finite_stop, (), (override));
+    MOCK_METHOD(void, server_batched, (), (override));
+    MOCK_METHOD(void, server_batched_stop, (), (override));
+    MOCK_METHOD(void, server_sequenced, (), (override));
+    MOCK_METHOD(void, server_sequenced_stop, (), (override));
+    MOCK_METHOD(void, server_rate_limited, (), (override));
+    MOCK_METHOD(void, server_rate_limited_stop, (), (override));
+    MOCK_METHOD(uint32_t, lrpcTimeUs, (), (const, override));
 };
 
 class MockServer5Srv2 : public srv5::srv2_shim
@@ -50,6 +59,8 @@ using TestServer5Srv2 = testutils::TestServerBase<srv5::Server5, MockServer5Srv2
 
 static_assert(std::is_same<srv5::Server5, lrpc::Server<68, srv5::LrpcMeta_service, 256, 256>>::value,
               "RX and/or TX buffer size are unequal to the definition file");
+// Definition hash, batched streams, sequence numbers and rate limited streams
+static_assert(srv5::lrpc_meta::Features == 0x3A, "");
 
 TEST_F(TestServer5Srv0, client_infinite)
 {
@@ -123,6 +134,75 @@ TEST_F(TestServer5Srv1, server_finite_response)
     EXPECT_EQ("054221010001", response());
 }
 
+TEST_F(TestServer5Srv1, server_batched_response)
+{
+    service.server_batched_response(0x1234, false);
+    service.server_batched_response(0x5678, false);
+    EXPECT_EQ("", response());
+
+    service.server_batched_response(0x9ABC, false);
+    EXPECT_EQ("0C422203341200785600BC9A00", response());
+}
+
+TEST_F(TestServer5Srv1, server_batched_response_final)
+{
+    service.server_batched_response(0x1234, true);
+    EXPECT_EQ("06422201341201", response());
+}
+
+TEST_F(TestServer5Srv1, server_batched_flush)
+{
+    service.server_batched_flush();
+    EXPECT_EQ("", response());
+
+    service.server_batched_response(0x1234, false);
+    service.server_batched_flush();
+    EXPECT_EQ("06422201341200", response());
+}
+
+TEST_F(TestServer5Srv1, server_sequenced_response)
+{
+    service.server_sequenced_response(0x12);
+    EXPECT_EQ("0442230012", response());
+
+    service.server_sequenced_response(0x34);
+    EXPECT_EQ("0442230134", response());
+}
+
+TEST_F(TestServer5Srv1, server_sequenced_response_wraps)
+{
+    for (int i = 0; i < 256; ++i)
+    {
+        service.server_sequenced_response(0x12);
+        (void)response();
+    }
+
+    service.server_sequenced_response(0x34);
+    EXPECT_EQ("0442230034", response());
+}
+
+// max_rate 1000 allows one message per 1000 us
+TEST_F(TestServer5Srv1, server_rate_limited_response)
+{
+    EXPECT_CALL(service, lrpcTimeUs())
+        .WillOnce(Return(10000U))
+        .WillOnce(Return(10500U))
+        .WillOnce(Return(11000U))
+        .WillOnce(Return(11999U));
+
+    service.server_rate_limited_response(0x12);
+    EXPECT_EQ("03422412", response());
+
+    service.server_rate_limited_response(0x34);
+    EXPECT_EQ("03422412", response());
+
+    service.server_rate_limited_response(0x56);
+    EXPECT_EQ("03422456", response());
+
+    service.server_rate_limited_response(0x78);
+    EXPECT_EQ("03422456", response());
+}
+
 TEST_F(TestServer5Srv2, client_infinite)
 {
     EXPECT_CALL(service, client_infinite(srv5::DoorState::Open));
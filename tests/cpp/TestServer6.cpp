@@ -0,0 +1,88 @@
+#include <cstdint>
+#include <tuple>
+#include <type_traits>
+#include <vector>
+
+#include <etl/optional.h>
+
+#include <gmock/gmock.h>
+#include <gtest/gtest.h>
+
+#include "TestUtils.hpp"
+#include "generated/Server6/Server6.hpp"
+
+using ::testing::Return;
+
+// Server6 is generated with the table codec
+class MockServer6Srv0 : public srv6::srv0_shim
+{
+public:
+    MOCK_METHOD(srv6::TableData, f0, (const srv6::TableData& p0), (override));
+    MOCK_METHOD((lrpc::optional<srv6::SmallData>), f1, ((lrpc::span<const srv6::SmallData>)p0), (override));
+    MOCK_METHOD(srv6::InlineData, f2, (const srv6::InlineData& p0), (override));
+    MOCK_METHOD((std::tuple<srv6::NestedData, bool>), f3, ((lrpc::span<const uint8_t>)p0, srv6::MyEnum p1), (override));
+    MOCK_METHOD(void, f4, (), (override));
+};
+
+using TestServer6 = testutils::TestServerBase<srv6::Server6, MockServer6Srv0>;
+
+static_assert(std::is_same<srv6::Server6, lrpc::Server<0, srv6::LrpcMeta_service, 100, 100>>::value,
+              "RX and/or TX buffer size are unequal to the definition file");
+
+TEST(TestServer6Tables, fieldTables)
+{
+    EXPECT_EQ(8U, lrpc::fieldTable<srv6::TableData>().size());
+    EXPECT_EQ(2U, lrpc::fieldTable<srv6::SmallData>().size());
+    EXPECT_EQ(2U, lrpc::fieldTable<srv6::NestedData>().size());
+}
+
+// Decode and encode a struct with all field types of the table codec
+TEST_F(TestServer6, f0)
+{
+    const srv6::TableData expected{0x12, {{-1, 0x1234, -300}}, srv6::MyEnum::V2, true, 0xDEADBEEF, -2, 1.5F, -0.25};
+    const srv6::TableData returned{0xAB, {{1, 2, 3}}, srv6::MyEnum::V1, false, 7, 0x0102030405060708, -2.0F, 1024.5};
+    EXPECT_CALL(service, f0(expected)).WillOnce(Return(returned));
+
+    const auto response = receive("23000012FFFF3412D4FE0201EFBEADDEFEFFFFFFFFFFFFFF0000C03F000000000000D0BF");
+    EXPECT_EQ("230000AB0100020003000100070000000807060504030201000000C00000000000029040", response);
+}
+
+// Array of table codec structs as parameter and optional table codec struct as return value
+TEST_F(TestServer6, f1)
+{
+    const std::vector<srv6::SmallData> expected{{0x1234, -1}, {0xABCD, 5}};
+    EXPECT_CALL(service, f1(testutils::SPAN_EQ(expected)))
+        .WillOnce(Return(lrpc::optional<srv6::SmallData>{srv6::SmallData{0x5678, -128}}))
+        .WillOnce(Return(lrpc::optional<srv6::SmallData>{}));
+
+    EXPECT_EQ("06000101785680", receive("0800013412FFCDAB05"));
+    EXPECT_EQ("03000100", receive("0800013412FFCDAB05"));
+}
+
+// Struct with a string falls back to the inline codec, so the function uses an inline shim
+TEST_F(TestServer6, f2)
+{
+    const srv6::InlineData expected{"abc", {0x1234, -2}};
+    EXPECT_CALL(service, f2(expected)).WillOnce(Return(srv6::InlineData{"wxyz", {1, 2}}));
+
+    const auto response = receive("0A000261626300003412FE");
+    EXPECT_EQ("0A00027778797A00010002", response);
+}
+
+// Nested table codec struct and multiple return values, invoked by the generic function shim
+TEST_F(TestServer6, f3)
+{
+    const std::vector<uint8_t> expected{7, 8};
+    const srv6::NestedData returned{{{{0x1234, -1}, {0x5678, 2}}}, 9};
+    EXPECT_CALL(service, f3(testutils::SPAN_EQ(expected), srv6::MyEnum::V2))
+        .WillOnce(Return(std::make_tuple(returned, true)));
+
+    EXPECT_EQ("0A00033412FF7856020901", receive("050003070802"));
+}
+
+// Function without parameters and return values, invoked by the generic function shim
+TEST_F(TestServer6, f4)
+{
+    EXPECT_CALL(service, f4());
+    EXPECT_EQ("020004", receive("020004"));
+}
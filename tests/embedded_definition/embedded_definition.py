@@ -18,7 +18,7 @@ def embedded_definition_for_testing() -> bytes:
 
     ed = b""
     ed += build_message(b"\xfd\x37\x7a\x58\x5a\x00\x00\x04\xe6\xd6\xb4\x46\x02\x00\x21\x01", final=False)
-    ed += build_message(b"\x16\x00\x00\x00\x74\x2f\xe5\xa3\xe0\x03\x9b\x01\x6e\x5d\x00\x37", final=False)
+    ed += build_message(b"\x16\x00\x00\x00\x74\x2f\xe5\xa3\xe0\x04\x82\x01\x9f\x5d\x00\x37", final=False)
     ed += build_message(b"\x18\x49\xfd\xfa\xfb\x56\x60\x9f\xc6\xef\x9a\xb1\x72\x37\x10\x50", final=False)
     ed += build_message(b"\x15\xa2\x39\xaf\xd9\xf5\xfe\x63\x41\xa3\xd6\xc8\x67\x3f\x54\x9c", final=False)
     ed += build_message(b"\xc8\xbf\x8a\x91\x8f\x25\x66\x50\x76\xee\x66\xe9\x0e\x92\xec\xed", final=False)
@@ -37,12 +37,15 @@ def embedded_definition_for_testing() -> bytes:
     ed += build_message(b"\x07\xce\xf4\x53\x75\xc5\xbc\x9c\xc5\xfa\x97\xc9\x75\x63\x89\x16", final=False)
     ed += build_message(b"\x73\x04\x76\x77\x42\xc7\x27\xf1\xac\x11\xba\xd7\x57\x8d\xcf\xf3", final=False)
     ed += build_message(b"\x2d\x4d\x27\x2f\xa1\xf6\xe0\xe1\x57\x78\x16\x00\x0c\x25\x61\xd5", final=False)
-    ed += build_message(b"\xbe\x45\x74\xde\xe5\x1b\x62\x08\x47\x3e\xac\x6a\x08\x87\xd6\x61", final=False)
-    ed += build_message(b"\x53\xc5\x59\xfc\xe5\x93\x70\xb0\xa5\x52\xa8\x15\xea\x89\xd4\x7f", final=False)
-    ed += build_message(b"\x48\x8f\x96\x80\xdd\x95\x4b\x10\x12\xc6\xa3\x84\x67\xd2\x60\xcd", final=False)
-    ed += build_message(b"\x66\x19\xf5\x34\xee\x16\x13\x5f\x4f\x7d\x43\xdb\x5c\x39\x20\xf1", final=False)
-    ed += build_message(b"\xb0\x18\xbc\x92\x7c\xb9\x02\xd2\x44\x9b\x3e\xc0\x00\x00\x00\x00", final=False)
-    ed += build_message(b"\x76\xd4\x05\xea\x8f\xc5\x62\xa3\x00\x01\x8a\x03\x9c\x07\x00\x00", final=False)
-    ed += build_message(b"\x2a\xd1\x07\xc9\xb1\xc4\x67\xfb\x02\x00\x00\x00\x00\x04\x59\x5a", final=True)
+    ed += build_message(b"\xbe\x45\x74\xde\xe5\x1b\x62\x08\x47\x4f\x32\xb8\x4b\x61\x9f\x79", final=False)
+    ed += build_message(b"\xb6\xea\x04\xa9\x5a\xfa\xb1\x9d\x76\x0c\x12\x32\xe6\xae\x5d\xe7", final=False)
+    ed += build_message(b"\x31\x64\x19\xe0\x9d\xd3\xad\xa1\xbe\x6e\x84\x31\x26\x83\xf6\x53", final=False)
+    ed += build_message(b"\xf0\xe3\xde\x5e\x27\xe2\xde\xf2\x61\x29\x3e\xd1\x58\x66\xfe\x1c", final=False)
+    ed += build_message(b"\x6a\x43\x40\xbb\xa3\x21\xad\xdb\xaa\x0d\x01\x24\x35\xfd\xcb\xd1", final=False)
+    ed += build_message(b"\xaa\x38\x86\x28\x92\x72\xba\x12\x72\xc4\x67\x49\xdc\x39\xb1\x20", final=False)
+    ed += build_message(b"\x1c\xbb\x42\x8a\x2d\xb5\xca\x33\xa9\xda\x66\xa5\xaa\x32\x69\x6c", final=False)
+    ed += build_message(b"\x68\x40\xaf\x30\xc9\x2c\x01\x1f\x6b\xff\x01\x95\x40\x00\x00\x00", final=False)
+    ed += build_message(b"\x05\xce\x18\xbc\x98\x7c\x43\x2e\x00\x01\xbb\x03\x83\x09\x00\x00", final=False)
+    ed += build_message(b"\xe1\x6f\xc5\x04\xb1\xc4\x67\xfb\x02\x00\x00\x00\x00\x04\x59\x5a", final=True)
 
     return ed
@@ -0,0 +1,52 @@
+from lrpc.tools.lrpcg.definition_diff import changed_services
+from lrpc.utils import YamlValues
+
+
+def definition(**changes: YamlValues) -> YamlValues:
+    result: dict[str, YamlValues] = {
+        "name": "test",
+        "settings": {"namespace": "ns"},
+        "services": [
+            {"name": "srv0", "functions": [{"name": "f0"}]},
+            {"name": "srv1", "functions": [{"name": "f0"}]},
+        ],
+    }
+    result.update(changes)
+    return result
+
+
+def test_unchanged() -> None:
+    assert changed_services(definition(), definition()) == set()
+
+
+def test_changed_service() -> None:
+    services: YamlValues = [
+        {"name": "srv0", "functions": [{"name": "f0"}]},
+        {"name": "srv1", "functions": [{"name": "f1"}]},
+    ]
+    assert changed_services(definition(), definition(services=services)) == {"srv1"}
+
+
+def test_changed_settings() -> None:
+    assert changed_services(definition(), definition(settings={"namespace": "other"})) is None
+    assert changed_services(definition(), definition(structs=[{"name": "s0", "fields": []}])) is None
+
+
+def test_changed_service_names() -> None:
+    renamed: YamlValues = [{"name": "srv0", "functions": [{"name": "f0"}]}, {"name": "srv2"}]
+    reordered: YamlValues = [{"name": "srv1", "functions": [{"name": "f0"}]}, {"name": "srv0"}]
+    removed: YamlValues = [{"name": "srv0", "functions": [{"name": "f0"}]}]
+
+    assert changed_services(definition(), definition(services=renamed)) is None
+    assert changed_services(definition(), definition(services=reordered)) is None
+    assert changed_services(definition(), definition(services=removed)) is None
+
+
+def test_invalid_services() -> None:
+    duplicate: YamlValues = [{"name": "srv0"}, {"name": "srv0"}]
+    unnamed: YamlValues = [{"functions": []}]
+
+    assert changed_services(definition(), definition(services=duplicate)) is None
+    assert changed_services(definition(), definition(services=unnamed)) is None
+    assert changed_services(definition(), definition(services=None)) is None
+    assert changed_services(definition(), None) is None
@@ -0,0 +1,79 @@
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lrpc.tools.lrpcg.file_watcher import FileWatcher, NotifyFileWatcher, create_file_watcher
+
+
+def test_changed(tmp_path: Path) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    overlay = tmp_path / "overlay.yaml"
+    definition.write_text("a", encoding="utf-8")
+    overlay.write_text("b", encoding="utf-8")
+
+    watcher = FileWatcher([definition, overlay])
+    assert not watcher.changed()
+
+    overlay.write_text("c", encoding="utf-8")
+    assert watcher.changed()
+    assert not watcher.changed()
+
+    # Only the content matters
+    definition.write_text("a", encoding="utf-8")
+    assert not watcher.changed()
+
+
+def test_removed_file(tmp_path: Path) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    definition.write_text("a", encoding="utf-8")
+
+    watcher = FileWatcher([definition])
+    definition.unlink()
+    assert watcher.changed()
+
+    definition.write_text("a", encoding="utf-8")
+    assert watcher.changed()
+
+
+def test_wait_for_change(tmp_path: Path) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    definition.write_text("a", encoding="utf-8")
+    watcher = FileWatcher([definition], interval=0)
+
+    definition.write_text("b", encoding="utf-8")
+    watcher.wait_for_change()
+
+
+def test_notify_wait_for_change(tmp_path: Path) -> None:
+    pytest.importorskip("watchfiles")
+    definition = tmp_path / "test.lrpc.yaml"
+    other = tmp_path / "other.yaml"
+    definition.write_text("a", encoding="utf-8")
+    watcher = create_file_watcher([definition])
+    assert watcher.method() == "file system notifications"
+
+    def edit() -> None:
+        # Files that are not watched and writing the same content are not changes
+        other.write_text("x", encoding="utf-8")
+        definition.write_text("a", encoding="utf-8")
+        definition.write_text("b", encoding="utf-8")
+
+    timer = threading.Timer(0.2, edit)
+    timer.start()
+    watcher.wait_for_change()
+    timer.join()
+    assert definition.read_text(encoding="utf-8") == "b"
+    assert not watcher.changed()
+
+
+def test_polling_without_watchfiles(tmp_path: Path) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    definition.write_text("a", encoding="utf-8")
+
+    with patch("lrpc.tools.lrpcg.file_watcher.WATCHFILES_AVAILABLE", new=False):
+        watcher = create_file_watcher([definition])
+
+    assert not isinstance(watcher, NotifyFileWatcher)
+    assert watcher.method() == "polling"
@@ -1,13 +1,19 @@
 import json
+import logging
+import os
 import re
+from collections.abc import Generator
 from importlib.metadata import version
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 from click.testing import CliRunner
 
-from lrpc.tools.lrpcg.lrpcg import run_cli
+from lrpc.resources.meta import meta_def_file
+from lrpc.tools.lrpcg.file_watcher import FileWatcher
+from lrpc.tools.lrpcg.lrpcg import CppOptions, IncrementalCppGenerator, run_cli
 
 TESTDATA = Path(__file__).parent.parent / "testdata"
 SERVER1 = str(TESTDATA / "TestServer1.lrpc.yaml")
@@ -48,7 +54,7 @@ def test_help(runner: CliRunner) -> None:
     assert result.exit_code == 0
     commands_section = result.output.split("Commands:\n")[1]
     assert set(re.findall(r"^ {2}(\w+)", commands_section, re.MULTILINE)) == {
-        "cpp", "cppcore", "merge", "schema", "puml",
+        "cpp", "cppcore", "merge", "schema", "puml", "sizes", "build",
     }
 
 
@@ -127,6 +133,224 @@ def test_cpp_existing_testdata(runner: CliRunner) -> None:
         assert Path("output/srv0_shim.hpp").exists()
 
 
+def test_cpp_unchanged_files_not_written(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        runner.invoke(run_cli, ["cpp", "-d", "test.lrpc.yaml", "-o", "output"])
+        shim = Path("output/srv0_shim.hpp")
+        os.utime(shim, (0, 0))
+
+        result = runner.invoke(run_cli, ["cpp", "-d", "test.lrpc.yaml", "-o", "output"])
+        assert result.exit_code == 0
+        assert shim.stat().st_mtime == 0
+
+
+def test_cpp_stale_files_removed(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        two_services = MINIMAL_DEF + "  - name: srv1\n    functions:\n      - name: f0\n"
+        Path("test.lrpc.yaml").write_text(two_services, encoding="utf-8")
+        runner.invoke(run_cli, ["cpp", "-d", "test.lrpc.yaml", "-o", "output"])
+        assert Path("output/srv1_shim.hpp").exists()
+
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["cpp", "-d", "test.lrpc.yaml", "-o", "output"])
+        assert result.exit_code == 0
+        assert Path("output/srv0_shim.hpp").exists()
+        assert not Path("output/srv1_shim.hpp").exists()
+        assert not Path("output/srv1_includes.hpp").exists()
+
+def test_cpp_depfile_and_manifest(runner: CliRunner) -> None:
+    overlay = "merge_strategy: add\nconstants:\n  - name: MY_CONST\n    value: 42\n"
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        Path("overlay.yaml").write_text(overlay, encoding="utf-8")
+        args = ["cpp", "-d", "test.lrpc.yaml", "-ov", "overlay.yaml", "-o", "output"]
+        result = runner.invoke(run_cli, [*args, "--depfile", "lrpc.d", "--manifest", "lrpc.json"])
+        assert result.exit_code == 0
+
+        targets, dependencies = Path("lrpc.d").read_text(encoding="utf-8").split(": ")
+        assert Path("output/srv0_shim.hpp").absolute().as_posix() in targets.split(" ")
+        assert Path("test.lrpc.yaml").absolute().as_posix() in dependencies
+        assert Path("overlay.yaml").absolute().as_posix() in dependencies
+        assert "meta.lrpc.yaml" in dependencies
+
+        manifest = json.loads(Path("lrpc.json").read_text(encoding="utf-8"))
+        assert len(manifest["inputs"]) == 3
+        assert Path("output/MinimalTest.hpp").absolute().as_posix() in manifest["outputs"]
+
+def test_cpp_parallel_jobs(runner: CliRunner) -> None:
+    server2 = str(TESTDATA / "TestServer2.lrpc.yaml")
+    with runner.isolated_filesystem():
+        result = runner.invoke(run_cli, ["cpp", "-d", server2, "-o", "sequential"])
+        assert result.exit_code == 0
+        result = runner.invoke(run_cli, ["cpp", "-d", server2, "-o", "parallel", "-j", "4"])
+        assert result.exit_code == 0
+
+        sequential = sorted(p.relative_to("sequential") for p in Path("sequential").rglob("*.hpp"))
+        parallel = sorted(p.relative_to("parallel") for p in Path("parallel").rglob("*.hpp"))
+        assert sequential == parallel
+        for p in sequential:
+            expected = (Path("sequential") / p).read_text(encoding="utf-8")
+            assert (Path("parallel") / p).read_text(encoding="utf-8") == expected
+
+
+def test_cpp_invalid_jobs(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        result = runner.invoke(run_cli, ["cpp", "-d", SERVER1, "-o", "output", "-j", "0"])
+        assert result.exit_code != 0
+
+def test_cpp_watch(runner: CliRunner) -> None:
+    changes = [MINIMAL_DEF + "  - name: srv1\n    functions:\n      - name: f0\n", "invalid: definition\n"]
+
+    def change_definition(_: object) -> None:
+        if len(changes) == 0:
+            raise KeyboardInterrupt
+        Path("test.lrpc.yaml").write_text(changes.pop(0), encoding="utf-8")
+
+    with (
+        runner.isolated_filesystem(),
+        patch("lrpc.tools.lrpcg.lrpcg.create_file_watcher", FileWatcher),
+        patch.object(FileWatcher, "wait_for_change", change_definition),
+    ):
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["cpp", "-d", "test.lrpc.yaml", "-o", "output", "--watch"])
+        # Errors in the definition do not stop watching
+        assert result.exit_code == 0
+        assert Path("output/srv1_shim.hpp").exists()
+
+
+INCREMENTAL_DEF = """\
+name: IncrementalTest
+settings:
+  rx_buffer_size: 64
+  tx_buffer_size: 64
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params: [{ name: p0, type: "@Data" }]
+  - name: srv1
+    functions:
+      - name: f0
+structs:
+  - name: Data
+    fields: [{ name: a, type: uint8_t }]
+"""
+SERVICE_CHANGED = INCREMENTAL_DEF.replace("      - name: f0\nstructs", "      - name: f1\nstructs")
+STRUCT_CHANGED = INCREMENTAL_DEF.replace("uint8_t }]", "uint16_t }]")
+SERVICE_ID_CHANGED = STRUCT_CHANGED.replace("  - name: srv0\n", "  - name: srv0\n    id: 4\n")
+DUPLICATE_FUNCTION_ID = INCREMENTAL_DEF.replace("\nstructs", "\n      - name: f1\n        id: 0\nstructs")
+
+
+@pytest.fixture
+def meta_def() -> Generator[Path, None, None]:
+    with meta_def_file() as path:
+        yield path
+
+
+def cpp_options(output: Path, jobs: int = 1, depfile: Path | None = None) -> CppOptions:
+    return CppOptions(
+        output=output,
+        generate_core=True,
+        codec="inline",
+        jobs=jobs,
+        depfile=depfile,
+        manifest=None,
+        warnings_as_errors=False,
+    )
+
+
+def generated_files(output: Path) -> dict[str, str]:
+    return {p.relative_to(output).as_posix(): p.read_text(encoding="utf-8") for p in output.rglob("*") if p.is_file()}
+
+
+def full_generation(tmp_path: Path, definition: str, meta_def: Path) -> dict[str, str]:
+    full = tmp_path / "full"
+    full.mkdir(exist_ok=True)
+    (full / "test.lrpc.yaml").write_text(definition, encoding="utf-8")
+    assert IncrementalCppGenerator([full / "test.lrpc.yaml", meta_def], cpp_options(full / "output")).generate()
+    return generated_files(full / "output")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_incremental_generation(tmp_path: Path, caplog: pytest.LogCaptureFixture, meta_def: Path, jobs: int) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    output = tmp_path / "output"
+    definition.write_text(INCREMENTAL_DEF, encoding="utf-8")
+    depfile = tmp_path / "test.d"
+    generator = IncrementalCppGenerator([definition, meta_def], cpp_options(output, jobs, depfile))
+
+    # Definition and the changed services, or None if all files are generated
+    changes = [
+        (SERVICE_CHANGED, "srv1"),
+        (SERVICE_CHANGED, "none"),
+        (STRUCT_CHANGED, None),
+        # The ID of srv1 follows the ID of srv0
+        (SERVICE_ID_CHANGED, None),
+    ]
+
+    with caplog.at_level(logging.INFO, logger="LRPCG"):
+        assert generator.generate()
+        for change, changed_services in changes:
+            caplog.clear()
+            definition.write_text(change, encoding="utf-8")
+            assert generator.generate()
+
+            if changed_services is None:
+                assert "Generated LRPC code for test.lrpc.yaml" in caplog.text
+            else:
+                assert (
+                    f"Generated LRPC code for changed services of test.lrpc.yaml in {output}: {changed_services}"
+                    in caplog.text
+                )
+
+            # Same files as generating all files
+            assert generated_files(output) == full_generation(tmp_path, change, meta_def)
+            assert "srv0_shim.hpp" in depfile.read_text(encoding="utf-8")
+
+
+def test_incremental_generation_after_error(tmp_path: Path, caplog: pytest.LogCaptureFixture, meta_def: Path) -> None:
+    definition = tmp_path / "test.lrpc.yaml"
+    definition.write_text(INCREMENTAL_DEF, encoding="utf-8")
+    generator = IncrementalCppGenerator([definition, meta_def], cpp_options(tmp_path / "output"))
+    assert generator.generate()
+
+    definition.write_text(DUPLICATE_FUNCTION_ID, encoding="utf-8")
+    assert not generator.generate()
+
+    # Only compared to the last successful run
+    definition.write_text(SERVICE_CHANGED, encoding="utf-8")
+    with caplog.at_level(logging.INFO, logger="LRPCG"):
+        assert generator.generate()
+        assert "changed services of test.lrpc.yaml in " in caplog.text
+
+    assert generated_files(tmp_path / "output") == full_generation(tmp_path, SERVICE_CHANGED, meta_def)
+
+
+def test_cpp_watch_stdin(runner: CliRunner) -> None:
+    result = runner.invoke(run_cli, ["cpp", "-d", "-", "-o", "output", "--watch"], input=MINIMAL_DEF)
+    assert result.exit_code == 1
+
+
+def test_cpp_table_codec(runner: CliRunner, caplog: pytest.LogCaptureFixture) -> None:
+    with runner.isolated_filesystem(), caplog.at_level(logging.INFO, logger="LRPCG"):
+        result = runner.invoke(run_cli, ["cpp", "-d", SERVER1, "-o", "output", "--codec", "table"])
+        assert result.exit_code == 0
+        assert "fieldTable<srv1::CompositeData>" in Path("output/CompositeData.hpp").read_text(encoding="utf-8")
+        assert "&srv0_shim::function_table_shim," in Path("output/srv0_shim.hpp").read_text(encoding="utf-8")
+        assert "Codec table: " in caplog.text
+        assert "table bytes on a 32 bit target" in caplog.text
+        # Definition hash and table codec
+        constants = Path("output/LrpcMeta_constants.hpp").read_text(encoding="utf-8")
+        assert "static constexpr uint32_t Features {0x00000042};" in constants
+
+
+def test_cpp_invalid_codec(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        result = runner.invoke(run_cli, ["cpp", "-d", SERVER1, "-o", "output", "--codec", "compact"])
+        assert result.exit_code != 0
+
+
 # --- cppcore ---
 
 
@@ -137,6 +361,8 @@ def test_cppcore_happy_path(runner: CliRunner) -> None:
         core_dir = Path("output/lrpccore")
         assert core_dir.is_dir()
         assert any(core_dir.iterdir())
+        assert (core_dir / "ReceiveQueue.hpp").exists()
+        assert (core_dir / "TableCodec.hpp").exists()
 
 
 def test_cppcore_byte_type_char(runner: CliRunner) -> None:
@@ -244,3 +470,139 @@ def test_puml_warnings_as_errors(runner: CliRunner) -> None:
         assert result.exit_code == 1
         assert result.exception is not None
         assert not Path("output/WithWarning.puml").exists()
+
+
+# --- sizes ---
+
+SIZES_DEF = """\
+name: SizesTest
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: uint16_t }
+          - { name: p1, type: string }
+    streams:
+      - name: s0
+        origin: server
+        params:
+          - { name: p0, type: uint32_t }
+"""
+
+
+def test_sizes_missing_definition_file(runner: CliRunner) -> None:
+    result = runner.invoke(run_cli, ["sizes"])
+    assert result.exit_code == 2
+
+
+def test_sizes_happy_path(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(SIZES_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["sizes", "-d", "test.lrpc.yaml"])
+        assert result.exit_code == 0
+        assert "srv0.f0 (function)" in result.output
+        assert "request   6..256 bytes" in result.output
+        assert "p1      string    1..*" in result.output
+        assert "srv0.s0 (server stream)" in result.output
+        assert "response  7 bytes" in result.output
+        assert "Link budget" not in result.output
+
+
+def test_sizes_link_budget(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(SIZES_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["sizes", "-d", "test.lrpc.yaml", "-b", "9600", "-r", "srv0.s0=96"])
+        assert result.exit_code == 0
+        assert "Link budget at 9600 baud (960 bytes/s in each direction)" in result.output
+        # 960 bytes/s for messages of 7 bytes
+        assert "max      137.1/s  target       96.0/s" in result.output
+        assert "Utilization client -> server: 0.0 %" in result.output
+        assert "Utilization server -> client: 70.0 %" in result.output
+
+
+def test_sizes_rate_without_baudrate(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(SIZES_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["sizes", "-d", "test.lrpc.yaml", "-r", "srv0.s0=96"])
+        assert result.exit_code == 2
+
+
+def test_sizes_rate_for_unknown_stream(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(SIZES_DEF, encoding="utf-8")
+        result = runner.invoke(run_cli, ["sizes", "-d", "test.lrpc.yaml", "-b", "9600", "-r", "srv0.s1=1"])
+        assert result.exit_code == 1
+
+
+# --- build ---
+
+BUILD_MANIFEST = """\
+core:
+  output: generated/core
+definitions:
+  - definition: defs/test.lrpc.yaml
+    output: generated/test
+  - definition: defs/test.lrpc.yaml
+    overlays: [defs/overlay.yaml]
+    output: generated/overlay
+    codec: table
+"""
+
+
+def test_build_happy_path(runner: CliRunner) -> None:
+    overlay = "merge_strategy: add\nconstants:\n  - name: MY_CONST\n    value: 42\n"
+    with runner.isolated_filesystem():
+        Path("defs").mkdir()
+        Path("defs/test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        Path("defs/overlay.yaml").write_text(overlay, encoding="utf-8")
+        Path("build.yaml").write_text(BUILD_MANIFEST, encoding="utf-8")
+
+        result = runner.invoke(run_cli, ["build", "build.yaml", "-j", "2"])
+        assert result.exit_code == 0
+        assert Path("generated/core/lrpccore/Server.hpp").exists()
+        assert Path("generated/test/srv0_shim.hpp").exists()
+        assert not Path("generated/test/lrpccore").exists()
+        assert not Path("generated/test/MinimalTest_Constants.hpp").exists()
+        assert Path("generated/overlay/MinimalTest_Constants.hpp").exists()
+
+
+def test_build_without_shared_core(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        manifest = "definitions:\n  - definition: test.lrpc.yaml\n    output: out\n"
+        Path("build.yaml").write_text(manifest, encoding="utf-8")
+
+        result = runner.invoke(run_cli, ["build", "build.yaml"])
+        assert result.exit_code == 0
+        assert Path("out/lrpccore/Server.hpp").exists()
+
+
+def test_build_continues_after_failure(runner: CliRunner) -> None:
+    manifest = """\
+definitions:
+  - definition: missing.lrpc.yaml
+    output: a
+  - definition: test.lrpc.yaml
+    output: b
+"""
+    with runner.isolated_filesystem():
+        Path("test.lrpc.yaml").write_text(MINIMAL_DEF, encoding="utf-8")
+        Path("build.yaml").write_text(manifest, encoding="utf-8")
+
+        result = runner.invoke(run_cli, ["build", "build.yaml"])
+        assert result.exit_code == 1
+        assert Path("b/srv0_shim.hpp").exists()
+
+
+def test_build_invalid_manifest(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        Path("build.yaml").write_text("definitions:\n  - definition: test.lrpc.yaml\n", encoding="utf-8")
+
+        result = runner.invoke(run_cli, ["build", "build.yaml"])
+        assert result.exit_code == 1
+
+
+def test_build_missing_manifest(runner: CliRunner) -> None:
+    result = runner.invoke(run_cli, ["build", "missing.yaml"])
+    assert result.exit_code == 2
@@ -0,0 +1,145 @@
+import pytest
+
+from lrpc.core import definition
+from lrpc.core.buffer_size import (
+    MAX_BUFFER_SIZE,
+    auto_buffer_size,
+    request_sizes,
+    required_buffer_size,
+    required_service_buffer_size,
+    response_sizes,
+)
+from lrpc.core.encoded_size import EncodedSize
+from lrpc.utils import load_lrpc_def
+
+DEFINITION = """name: test
+settings:
+  rx_buffer_size: auto
+  tx_buffer_size: auto
+  definition_hash_length: 0
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: uint16_t, count: 4 }
+        returns:
+          - { name: r0, type: string_10 }
+    streams:
+      - name: s0
+        origin: client
+        finite: true
+        params:
+          - { name: p0, type: uint32_t }
+      - name: s1
+        origin: server
+        batch: 3
+        sequence: true
+        params:
+          - { name: p0, type: int8_t }
+"""
+
+
+def test_request_sizes() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+    sizes = {f"{s.service}.{s.name}": s for s in request_sizes(lrpc_def)}
+
+    assert sizes["srv0.f0"].size == EncodedSize(11, 11)
+    assert sizes["srv0.f0"].description() == "Function srv0.f0"
+    # Client stream message with final parameter
+    assert sizes["srv0.s0"].size == EncodedSize(8, 8)
+    # Start or stop the server stream
+    assert sizes["srv0.s1"].size == EncodedSize(4, 4)
+    assert sizes["LrpcMeta.version"].size == EncodedSize(3, 3)
+
+
+def test_response_sizes() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+    sizes = {f"{s.service}.{s.name}": s for s in response_sizes(lrpc_def)}
+
+    assert sizes["srv0.f0"].size == EncodedSize(14, 14)
+    # Client streams have no response
+    assert "srv0.s0" not in sizes
+    # Batch header and 3 messages with sequence number
+    assert sizes["srv0.s1"].size == EncodedSize(10, 10)
+    assert sizes["srv0.s1"].description() == "Batched stream srv0.s1"
+    # Errors generated by the server do not have a message
+    assert sizes["LrpcMeta.error"].size == EncodedSize(11, 11)
+    assert sizes["LrpcMeta.capabilities"].size == EncodedSize(12, 12)
+
+
+def test_auto_buffer_sizes() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+
+    assert lrpc_def.settings().rx_buffer_size() == 11
+    assert lrpc_def.settings().rx_buffer_size_is_auto()
+    assert lrpc_def.settings().tx_buffer_size() == required_buffer_size(response_sizes(lrpc_def))
+    assert lrpc_def.settings().tx_buffer_size_is_auto()
+
+
+def test_required_service_buffer_size() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+
+    assert required_service_buffer_size(request_sizes(lrpc_def), "srv0") == 11
+    assert required_service_buffer_size(response_sizes(lrpc_def), "srv0") == 14
+    assert required_service_buffer_size(request_sizes(lrpc_def), "LrpcMeta") == 4
+    assert required_service_buffer_size(response_sizes(lrpc_def), "unknown") == 0
+
+
+def test_auto_buffer_size_with_auto_string() -> None:
+    rpc_def = """name: test
+settings:
+  rx_buffer_size: auto
+  tx_buffer_size: 100
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: string }
+"""
+    lrpc_def = load_lrpc_def(rpc_def)
+    requests = request_sizes(lrpc_def)
+
+    assert required_buffer_size(requests) == 4
+    assert auto_buffer_size(requests) == MAX_BUFFER_SIZE
+    assert lrpc_def.settings().rx_buffer_size() == MAX_BUFFER_SIZE
+    assert lrpc_def.settings().tx_buffer_size() == 100
+    assert not lrpc_def.settings().tx_buffer_size_is_auto()
+
+
+def test_sizes_only_computed_for_auto_buffer_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    def not_called(_lrpc_def: definition.LrpcDef) -> None:
+        raise AssertionError("Message sizes must not be computed")
+
+    rpc_def = """name: test
+settings:
+  rx_buffer_size: {rx}
+  tx_buffer_size: 100
+services:
+  - name: srv0
+    functions:
+      - name: f0
+"""
+    monkeypatch.setattr(definition, "response_sizes", not_called)
+    lrpc_def = load_lrpc_def(rpc_def.format(rx="auto"))
+    assert lrpc_def.settings().rx_buffer_size() == required_buffer_size(request_sizes(lrpc_def))
+
+    monkeypatch.setattr(definition, "request_sizes", not_called)
+    assert load_lrpc_def(rpc_def.format(rx=50)).settings().rx_buffer_size() == 50
+
+
+def test_bytearray_limited_by_buffer() -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: bytearray }
+"""
+    lrpc_def = load_lrpc_def(rpc_def)
+    f0 = next(s for s in request_sizes(lrpc_def) if s.name == "f0")
+
+    assert not f0.is_bounded()
+    assert f0.required_buffer_size() == 4
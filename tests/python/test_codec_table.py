@@ -0,0 +1,119 @@
+from lrpc.codegen.codec_table import (
+    CodecFootprint,
+    codec_footprint,
+    function_table_size,
+    supports_function_table,
+    supports_table_codec,
+    table_field_type,
+)
+from lrpc.utils import load_lrpc_def
+
+DEFINITION = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: "@s0" }
+          - { name: p1, type: "@s1" }
+          - { name: p2, type: "@s3" }
+      - name: f1
+        params:
+          - { name: p0, type: uint8_t, count: 2 }
+        returns:
+          - { name: r0, type: "@s2" }
+          - { name: r1, type: "@e0" }
+      - name: f2
+        returns:
+          - { name: r0, type: uint8_t, count: 2 }
+      - name: f3
+structs:
+  - name: s0
+    fields:
+      - { name: f0, type: uint32_t, count: 3 }
+      - { name: f1, type: "@e0" }
+      - { name: f2, type: double }
+  - name: s1
+    fields:
+      - { name: f0, type: string_8 }
+      - { name: f1, type: uint8_t, count: "?" }
+  - name: s2
+    fields:
+      - { name: f0, type: "@s0", count: 2 }
+  - name: s3
+    fields:
+      - { name: f0, type: "@s1" }
+enums:
+  - name: e0
+    fields: [a, b]
+"""
+
+
+def test_table_field_type() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+    s0 = lrpc_def.struct("s0")
+    s1 = lrpc_def.struct("s1")
+    s2 = lrpc_def.struct("s2")
+
+    assert [table_field_type(f) for f in s0.fields()] == ["Uint32", "Uint8", "Double"]
+    assert [table_field_type(f) for f in s1.fields()] == [None, None]
+    assert [table_field_type(f) for f in s2.fields()] == ["Struct"]
+
+
+def test_supports_table_codec() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+
+    assert supports_table_codec(lrpc_def.struct("s0"), lrpc_def)
+    assert not supports_table_codec(lrpc_def.struct("s1"), lrpc_def)
+    # Nested structs must support the table codec as well
+    assert supports_table_codec(lrpc_def.struct("s2"), lrpc_def)
+    assert not supports_table_codec(lrpc_def.struct("s3"), lrpc_def)
+
+
+def test_supports_function_table() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+
+    def supported(name: str) -> bool:
+        function = lrpc_def.function("srv0", name)
+        assert function is not None
+        return supports_function_table(function, lrpc_def)
+
+    assert not supported("f0")
+    assert supported("f1")
+    # Arrays are returned as a span
+    assert not supported("f2")
+    assert supported("f3")
+
+
+def test_function_table_size() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+
+    assert function_table_size(lrpc_def.services()[0].functions(), lrpc_def) == 4
+    assert function_table_size([], lrpc_def) == 0
+
+
+def test_table_bytes() -> None:
+    footprint = CodecFootprint(
+        inline_struct_codecs=1,
+        inline_function_shims=2,
+        field_descriptors=3,
+        function_descriptors=2,
+    )
+
+    assert footprint.table_bytes() == (3 * 12) + (2 * 12)
+    assert footprint.table_bytes(pointer_size=8) == (3 * 16) + (2 * 24)
+
+
+def test_codec_footprint() -> None:
+    lrpc_def = load_lrpc_def(DEFINITION)
+    meta_functions = len(lrpc_def.meta_service().functions())
+
+    inline = codec_footprint(lrpc_def, "inline")
+    assert inline == CodecFootprint(4, 4 + meta_functions, 0, 0)
+    assert inline.table_bytes() == 0
+
+    table = codec_footprint(lrpc_def, "table")
+    assert table.inline_struct_codecs == 2
+    assert table.inline_function_shims < inline.inline_function_shims
+    assert table.field_descriptors >= 3 + 1 + 1 + 2
+    assert table.function_descriptors >= 4
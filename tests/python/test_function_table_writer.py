@@ -0,0 +1,138 @@
+from io import StringIO
+
+from lrpc.codegen.cppfile import CppFile
+from lrpc.codegen.function_table_writer import FunctionTableWriter
+from lrpc.core import LrpcFun, LrpcFunDict
+
+
+def assert_function_table(functions: list[LrpcFunDict], expected: str) -> None:
+    mock_file = StringIO()
+    writer = FunctionTableWriter(CppFile.from_writer(mock_file.write), "srv0_shim", "ns")
+    writer.write_function_table([LrpcFun(f) for f in functions])
+
+    assert mock_file.getvalue() == expected
+
+
+def test_no_params_no_returns() -> None:
+    functions: list[LrpcFunDict] = [{"name": "f0", "id": 1}]
+    expected = """// Function descriptors for the generic function shim
+static void f0_handler(lrpc::Service& service, const uint8_t* /*params*/, uint8_t* /*returns*/)
+{
+    static_cast<srv0_shim&>(service).f0();
+}
+
+static constexpr size_t FunctionBufferSize{1};
+
+static const lrpc::FunctionDescriptor& functionDescriptor(const size_t functionId)
+{
+    static constexpr lrpc::FunctionDescriptor descriptors[]
+    {
+        {nullptr, nullptr, nullptr},
+        {&lrpc::noFields, &lrpc::noFields, &f0_handler},
+    };
+    return descriptors[functionId];
+}
+
+void function_table_shim(Reader& reader)
+{
+    const auto functionId = static_cast<uint8_t>(reader.data().at(2));
+    const auto& function = functionDescriptor(functionId);
+    lrpc::array<uint8_t, FunctionBufferSize> params{};
+    lrpc::array<uint8_t, FunctionBufferSize> returns{};
+    lrpc::readFields(reader, params.data(), function.params());
+    function.handler(*this, params.data(), returns.data());
+    const auto returnFields = function.returns();
+    const auto _lrpc_paramWriter = [&returns, &returnFields](Writer& writer)
+    {
+        lrpc::writeFields(writer, returns.data(), returnFields);
+    };
+    server().transmit(id(), functionId, _lrpc_paramWriter);
+}
+"""
+
+    assert_function_table(functions, expected)
+
+
+def test_params_and_returns() -> None:
+    functions: list[LrpcFunDict] = [
+        {
+            "name": "f0",
+            "id": 0,
+            "params": [{"name": "a", "type": "struct@s0"}, {"name": "b", "type": "uint16_t", "count": 2}],
+            "returns": [{"name": "c", "type": "enum@e0"}, {"name": "d", "type": "float"}],
+        },
+    ]
+    expected = """// Function descriptors for the generic function shim
+struct f0_params
+{
+    s0 a;
+    lrpc::array<uint16_t, 2> b;
+};
+
+static lrpc::span<const lrpc::FieldDescriptor> f0_params_fields()
+{
+    static_assert(std::is_standard_layout<f0_params>::value, "Table codec requires a standard layout struct");
+    static constexpr lrpc::FieldDescriptor fields[]
+    {
+        {offsetof(f0_params, a), lrpc::FieldType::Struct, 1, sizeof(ns::s0), &lrpc::fieldTable<ns::s0>},
+        {offsetof(f0_params, b), lrpc::FieldType::Uint16, 2, 0, nullptr},
+    };
+    return fields;
+}
+
+struct f0_returns
+{
+    e0 c;
+    float d;
+};
+
+static lrpc::span<const lrpc::FieldDescriptor> f0_returns_fields()
+{
+    static_assert(std::is_standard_layout<f0_returns>::value, "Table codec requires a standard layout struct");
+    static_assert(sizeof(f0_returns::c) == 1, "Table codec requires enum field c to have size 1");
+    static constexpr lrpc::FieldDescriptor fields[]
+    {
+        {offsetof(f0_returns, c), lrpc::FieldType::Uint8, 1, 0, nullptr},
+        {offsetof(f0_returns, d), lrpc::FieldType::Float, 1, 0, nullptr},
+    };
+    return fields;
+}
+
+static void f0_handler(lrpc::Service& service, const uint8_t* params, uint8_t* returns)
+{
+    f0_params p{};
+    (void)std::memcpy(&p, params, sizeof(p));
+    const auto result = static_cast<srv0_shim&>(service).f0(p.a, p.b);
+    const f0_returns r{std::get<0>(result), std::get<1>(result)};
+    (void)std::memcpy(returns, &r, sizeof(r));
+}
+
+static constexpr size_t FunctionBufferSize{lrpc::table_codec::maxSize(sizeof(f0_params), sizeof(f0_returns))};
+
+static const lrpc::FunctionDescriptor& functionDescriptor(const size_t functionId)
+{
+    static constexpr lrpc::FunctionDescriptor descriptors[]
+    {
+        {&f0_params_fields, &f0_returns_fields, &f0_handler},
+    };
+    return descriptors[functionId];
+}
+
+void function_table_shim(Reader& reader)
+{
+    const auto functionId = static_cast<uint8_t>(reader.data().at(2));
+    const auto& function = functionDescriptor(functionId);
+    lrpc::array<uint8_t, FunctionBufferSize> params{};
+    lrpc::array<uint8_t, FunctionBufferSize> returns{};
+    lrpc::readFields(reader, params.data(), function.params());
+    function.handler(*this, params.data(), returns.data());
+    const auto returnFields = function.returns();
+    const auto _lrpc_paramWriter = [&returns, &returnFields](Writer& writer)
+    {
+        lrpc::writeFields(writer, returns.data(), returnFields);
+    };
+    server().transmit(id(), functionId, _lrpc_paramWriter);
+}
+"""
+
+    assert_function_table(functions, expected)
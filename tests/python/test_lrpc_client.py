@@ -6,6 +6,7 @@ from importlib.metadata import version
 import pytest
 
 from lrpc.client import LrpcClient
+from lrpc.core.meta import LrpcMetaFeature
 from tests.embedded_definition import embedded_definition_for_testing
 
 from .utilities import load_test_definition
@@ -391,6 +392,87 @@ class TestLrpcClient:
         assert response.service_name == "srv2"
         assert response.function_or_stream_name == "server_finite"
 
+    def test_decode_all_stream_server_batched(self) -> None:
+        responses = self.client().decode_all(b"\x09\x02\x04\x03\x11\x00\x22\x00\x33\x01")
+
+        assert len(responses) == 3
+        assert [r.payload for r in responses] == [
+            {"p0": 0x11, "final": False},
+            {"p0": 0x22, "final": False},
+            {"p0": 0x33, "final": True},
+        ]
+        assert all(r.function_or_stream_name == "server_batched" for r in responses)
+
+    def test_decode_all_stream_server_batched_partial(self) -> None:
+        responses = self.client().decode_all(b"\x05\x02\x04\x01\x11\x01")
+
+        assert len(responses) == 1
+        assert responses[0].payload == {"p0": 0x11, "final": True}
+
+    def test_decode_all_stream_server_batched_remaining_bytes(self) -> None:
+        with pytest.raises(ValueError, match=re.escape("1 remaining bytes after decoding srv2.server_batched")):
+            self.client().decode_all(b"\x06\x02\x04\x01\x11\x01\x22")
+
+    def test_decode_all_stream_server_batched_no_count(self) -> None:
+        with pytest.raises(ValueError, match=re.escape("Batched message for srv2.server_batched does not contain")):
+            self.client().decode_all(b"\x02\x02\x04")
+
+    def test_decode_stream_server_batched_multiple(self) -> None:
+        with pytest.raises(ValueError, match=re.escape("Message contains 2 responses. Use decode_all")):
+            self.client().decode(b"\x07\x02\x04\x02\x11\x00\x22\x01")
+
+    def test_communicate_stream_server_batched_start(self) -> None:
+        response_bytes = b"\x07\x02\x04\x02\x11\x00\x22\x00" + b"\x05\x02\x04\x01\x33\x01"
+        responses = list(self.client(response_bytes).communicate_all("srv2", "server_batched", start=True))
+
+        assert [r.payload for r in responses] == [{"p0": 0x11}, {"p0": 0x22}, {"p0": 0x33}]
+        assert all(r.is_expected_response for r in responses)
+
+    def test_decode_stream_server_sequenced(self, caplog: pytest.LogCaptureFixture) -> None:
+        client = self.client()
+
+        response = client.decode(b"\x04\x02\x05\xfe\x11")
+        assert response.payload == {"p0": 0x11}
+        assert response.sequence_number == 0xFE
+
+        # wraps around, 0xFF and 0x00 are missing
+        assert client.decode(b"\x04\x02\x05\x01\x22").sequence_number == 1
+        assert "2 message(s) missing in stream srv2.server_sequenced" in caplog.text
+
+        # late
+        client.decode(b"\x04\x02\x05\x00\x33")
+        client.decode(b"\x04\x02\x05\x02\x44")
+
+        statistics = client.stream_statistics("srv2", "server_sequenced")
+        assert statistics.received == 4
+        assert statistics.missing == 2
+        assert statistics.out_of_order == 1
+
+    def test_decode_stream_server_without_sequence_number(self) -> None:
+        assert self.client().decode(b"\x05\x02\x02\x11\x22\x00").sequence_number is None
+
+        with pytest.raises(ValueError, match=re.escape("srv2.server_infinite is not a stream with sequence numbers")):
+            self.client().stream_statistics("srv2", "server_infinite")
+
+    def test_decode_all_stream_server_batched_sequenced(self) -> None:
+        client = self.client()
+        responses = client.decode_all(b"\x07\x02\x06\x02\x07\x11\x09\x22")
+
+        assert [r.payload for r in responses] == [{"p0": 0x11}, {"p0": 0x22}]
+        assert [r.sequence_number for r in responses] == [7, 9]
+        assert client.stream_statistics("srv2", "server_batched_sequenced").missing == 1
+
+    def test_communicate_stream_server_sequenced_restart(self) -> None:
+        client = self.client(b"\x04\x02\x05\x10\x11" + b"\x04\x02\x05\x50\x22")
+
+        assert client.communicate("srv2", "server_sequenced", start=True).sequence_number == 0x10
+        # starting the stream again does not count the messages in between as missing
+        assert client.communicate("srv2", "server_sequenced", start=True).sequence_number == 0x50
+
+        statistics = client.stream_statistics("srv2", "server_sequenced")
+        assert statistics.received == 2
+        assert statistics.missing == 0
+
     @staticmethod
     def make_version_response(def_version: str, def_hash: str, lrpc_version: str) -> bytes:
         message_length = 3 + len(def_version) + 1 + len(def_hash) + 1 + len(lrpc_version) + 1
@@ -473,6 +555,55 @@ class TestLrpcClient:
         assert "Definition version: [disabled] vs [wrong version]" in caplog.messages
         assert f"Definition hash: {local_hash_16}... vs {local_hash_16}..." in caplog.messages
 
+    @staticmethod
+    def make_capabilities_response(rx_buffer_size: int, features: int = 0x05) -> bytes:
+        # tx buffer size 32, max service ID 2, by default embedded definition and definition version
+        return b"\x0b\xff\x03" + struct.pack("<HHBI", rx_buffer_size, 32, 2, features)
+
+    def test_server_capabilities(self) -> None:
+        client = self.client(self.make_capabilities_response(16))
+        capabilities = client.server_capabilities()
+
+        assert capabilities == {"rx_buffer_size": 16, "tx_buffer_size": 32, "max_service_id": 2, "features": 5}
+        assert capabilities["features"] == (LrpcMetaFeature.EMBEDDED_DEFINITION | LrpcMetaFeature.DEFINITION_VERSION)
+        assert isinstance(capabilities["features"], LrpcMetaFeature)
+
+        # capabilities are cached, the transport has no more data
+        assert client.server_capabilities() == capabilities
+
+    def test_check_server_features(self) -> None:
+        # The definition has batched streams and streams with sequence numbers. Other features do not matter
+        features = LrpcMetaFeature.BATCHED_STREAMS | LrpcMetaFeature.SEQUENCE_NUMBERS | LrpcMetaFeature.TABLE_CODEC
+        client = self.client(self.make_capabilities_response(16, features))
+
+        assert client.check_server_features()
+
+    def test_check_server_features_mismatch(self, caplog: pytest.LogCaptureFixture) -> None:
+        client = self.client(self.make_capabilities_response(16, LrpcMetaFeature.BATCHED_STREAMS))
+
+        assert not client.check_server_features()
+        assert caplog.messages == [
+            "Server feature mismatch detected. Details client vs server:",
+            "BATCHED_STREAMS: True vs True",
+            "SEQUENCE_NUMBERS: True vs False",
+        ]
+
+    def test_request_exceeds_server_rx_buffer(self) -> None:
+        client = self.client(self.make_capabilities_response(16))
+        client.server_capabilities()
+
+        # 1 byte message length, service ID, function ID, bytearray size and 13 bytes payload
+        with pytest.raises(
+            ValueError,
+            match=re.escape("Request of 17 bytes does not fit in the receive buffer of the server (16 bytes)"),
+        ):
+            client.communicate("srv1", "bytearray", p0=b"\x00" * 13)
+
+    def test_request_size_unchecked_without_capabilities(self) -> None:
+        client = self.client(b"\x04\x01\x02\x01\x00")
+        response = client.communicate("srv1", "bytearray", p0=b"\x00" * 13)
+        assert response.payload["r0"] == b"\x00"
+
     @staticmethod
     def test_from_server_when_not_embedded() -> None:
         # meta.definition message with empty bytearray chunk param. final=True
@@ -386,6 +386,50 @@ def test_decode_nested_struct() -> None:
     assert lrpc_decode(b"\xd7\x11\x7b\x01", var, lrpc_def) == {"f0": {"f1": 123, "f0": 4567, "f2": True}}
 
 
+def test_decode_float16() -> None:
+    var = LrpcVar({"name": "v1", "type": "float16"})
+
+    assert lrpc_decode(b"\x00\x00", var, lrpc_def) == 0.0
+    assert lrpc_decode(b"\x00\x3e", var, lrpc_def) == 1.5
+    assert lrpc_decode(b"\xff\xfb", var, lrpc_def) == -65504.0
+
+
+def test_decode_fixed_point() -> None:
+    var = LrpcVar({"name": "v1", "type": "int16_t", "scale": 2**-15})
+
+    assert lrpc_decode(b"\x00\x40", var, lrpc_def) == 0.5
+    assert lrpc_decode(b"\x00\x80", var, lrpc_def) == -1.0
+
+    var = LrpcVar({"name": "v1", "type": "uint8_t", "scale": 0.5, "offset": -40})
+    assert lrpc_decode(b"\x7b", var, lrpc_def) == 21.5
+
+
+def test_decode_array_of_fixed_point_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": 2, "scale": 0.25, "encoding": "varint"})
+
+    assert lrpc_decode(b"\x04\xc8\x01", var, lrpc_def) == [1.0, 50.0]
+
+
+def test_decode_packed_struct() -> None:
+    var = LrpcVar({"name": "v1", "type": "struct@MyStruct4"})
+
+    assert lrpc_decode(b"\xb5\x6f\x34\x12\x01", var, lrpc_def) == {
+        "f0": True,
+        "f1": False,
+        "f2": 5,
+        "f3": -3,
+        "f4": "test2",
+        "f5": 0x1234,
+        "f6": True,
+    }
+
+    with pytest.raises(ValueError, match=re.escape("Value 1 (0x1) is not valid for enum MyEnum1")):
+        lrpc_decode(b"\xb5\x03\x34\x12\x01", var, lrpc_def)
+
+    with pytest.raises(ValueError, match="Incomplete bit fields: expected 2 bytes but got 1"):
+        lrpc_decode(b"\xb5", var, lrpc_def)
+
+
 def test_decode_enum() -> None:
     var = LrpcVar({"name": "v1", "type": "enum@MyEnum1"})
 
@@ -411,3 +455,50 @@ def test_decode_array_of_struct() -> None:
     assert len(decoded) == 2
     assert decoded[0] == {"f0": {"f1": 123, "f0": 4567, "f2": True}}
     assert decoded[1] == {"f0": {"f1": 51, "f0": 8721, "f2": False}}
+
+
+def test_decode_varint_unsigned() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint32_t", "encoding": "varint"})
+
+    assert lrpc_decode(b"\x00", var, lrpc_def) == 0
+    assert lrpc_decode(b"\x7f", var, lrpc_def) == 127
+    assert lrpc_decode(b"\x80\x01", var, lrpc_def) == 128
+    assert lrpc_decode(b"\xac\x02", var, lrpc_def) == 300
+    assert lrpc_decode(b"\xff\xff\xff\xff\x0f", var, lrpc_def) == 0xFFFFFFFF
+
+    decoder = LrpcDecoder(b"\xac\x02\x05", lrpc_def)
+    assert decoder.lrpc_decode(var) == 300
+    assert decoder.remaining() == 1
+
+
+def test_decode_varint_signed() -> None:
+    var = LrpcVar({"name": "v1", "type": "int16_t", "encoding": "varint"})
+
+    assert lrpc_decode(b"\x00", var, lrpc_def) == 0
+    assert lrpc_decode(b"\x01", var, lrpc_def) == -1
+    assert lrpc_decode(b"\x02", var, lrpc_def) == 1
+    assert lrpc_decode(b"\xfe\xff\x03", var, lrpc_def) == 32767
+    assert lrpc_decode(b"\xff\xff\x03", var, lrpc_def) == -32768
+
+
+def test_decode_varint_incomplete() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint32_t", "encoding": "varint"})
+
+    with pytest.raises(ValueError, match="Incomplete varint for v1"):
+        lrpc_decode(b"\x80\x80", var, lrpc_def)
+
+
+def test_decode_varint_too_big() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint8_t", "encoding": "varint"})
+
+    with pytest.raises(ValueError, match="Varint for v1 exceeds the size of uint8_t"):
+        lrpc_decode(b"\x80\x02", var, lrpc_def)
+
+    with pytest.raises(ValueError, match="Varint for v1 exceeds the size of uint8_t"):
+        lrpc_decode(b"\x80\x80\x01", var, lrpc_def)
+
+
+def test_decode_array_of_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "int8_t", "count": 3, "encoding": "varint"})
+
+    assert lrpc_decode(b"\x01\x02\x03", var, lrpc_def) == [-1, 1, -2]
@@ -1,3 +1,4 @@
+import lzma
 import math
 import re
 import tempfile
@@ -5,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from lrpc.core import LrpcDef, LrpcFun, LrpcStream
@@ -649,6 +651,32 @@ services:
     assert get_stream(lrpc_def, "srv1", "s2").id() == 3
 
 
+def test_json_definition() -> None:
+    def_str = """{
+  "name": "test",
+  "services": [
+    {
+      "name": "srv1",
+      "streams": [{"name": "s1", "origin": "server"}],
+      "functions": [{"name": "f1"}]
+    }
+  ]
+}
+"""
+    lrpc_def = load_lrpc_def(def_str)
+
+    assert get_stream(lrpc_def, "srv1", "s1").id() == 0
+    assert get_function(lrpc_def, "srv1", "f1").id() == 1
+
+
+def test_yaml_flow_mapping_definition() -> None:
+    def_str = "{name: test, services: [{name: srv1, functions: [{name: f1}], streams: [{name: s1, origin: server}]}]}"
+    lrpc_def = load_lrpc_def(def_str)
+
+    assert get_function(lrpc_def, "srv1", "f1").id() == 0
+    assert get_stream(lrpc_def, "srv1", "s1").id() == 1
+
+
 def test_explicit_stream_and_function_id() -> None:
     def_str = """name: test
 services:
@@ -866,6 +894,9 @@ services:
     assert (
         "service[LrpcMeta]"
         "-function[version+2]-return[definition]-return[definition_hash]-return[lrpc]-return_end-param_end-function_end"
+        "-function[capabilities+3]"
+        "-return[rx_buffer_size]-return[tx_buffer_size]-return[max_service_id]-return[features]-return_end"
+        "-param_end-function_end"
         "-stream[error+0+server]"
         "-param[start]-param_end-return[type]-return[p1]-return[p2]-return[p3]-return[message]-return_end-stream_end"
         "-stream[definition+1+server]"
@@ -949,6 +980,40 @@ def test_validation_wrong_type_rx_buffer_size() -> None:
         LrpcDef(d)  # type: ignore[arg-type]
 
 
+def test_validation_nested_var() -> None:
+    d = {
+        "name": "test",
+        "services": [
+            {"name": "srv0", "functions": [{"name": "f0", "params": [{"name": "p0", "type": 1}]}]},
+        ],
+    }
+
+    with pytest.raises(ValidationError, match=re.escape("Input should be a valid string")):
+        LrpcDef(d)  # type: ignore[arg-type]
+
+
+def test_trusted_definition() -> None:
+    def_str = """name: test
+services:
+  - name: s1
+    functions:
+      - name: f1
+        params:
+          - { name: p0, type: "@e1" }
+enums:
+  - name: e1
+    fields: [a, b]
+"""
+    lrpc_def = load_lrpc_def(def_str)
+    raw = yaml.safe_load(lzma.decompress(lrpc_def.compressed_definition()))
+
+    trusted_def = LrpcDef(raw, trusted=True)
+
+    assert trusted_def.compressed_definition() == lrpc_def.compressed_definition()
+    assert trusted_def.definition_hash() == lrpc_def.definition_hash()
+    assert get_function(trusted_def, "s1", "f1").param("p0").base_type_is_enum()
+
+
 def test_embed_definition_default_false() -> None:
     def_str = """name: test
 services:
@@ -999,7 +1064,7 @@ services:
     lrpc_def1 = load_lrpc_def(def_str)
     compressed = lrpc_def1.compressed_definition()
 
-    assert len(compressed) == 388
+    assert len(compressed) == 444
 
     lrpc_def2 = LrpcDef.decompress(compressed)
 
@@ -323,6 +323,73 @@ def test_encode_nested_struct() -> None:
     assert encoded == b"\xd7\x11\x7b\x01"
 
 
+def test_encode_float16() -> None:
+    var = LrpcVar({"name": "v1", "type": "float16"})
+
+    assert encode_var(0, var) == b"\x00\x00"
+    assert encode_var(1.5, var) == b"\x00\x3e"
+    assert encode_var(-65504.0, var) == b"\xff\xfb"
+
+    with pytest.raises(OverflowError):
+        encode_var(1e6, var)
+
+
+def test_encode_fixed_point() -> None:
+    var = LrpcVar({"name": "v1", "type": "int16_t", "scale": 2**-15})
+
+    assert encode_var(0.5, var) == b"\x00\x40"
+    assert encode_var(-1, var) == b"\x00\x80"
+
+    with pytest.raises(struct.error, match=number_out_of_range_pattern(-32768, 32767)):
+        encode_var(1.0, var)
+
+    with pytest.raises(TypeError, match="Type error for v1: expected int or float, but got <class 'str'>"):
+        encode_var("0.5", var)
+
+
+def test_encode_fixed_point_with_offset() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint8_t", "scale": 0.5, "offset": -40})
+
+    assert encode_var(-40, var) == b"\x00"
+    assert encode_var(21.4, var) == b"\x7b"
+    assert encode_var(87.5, var) == b"\xff"
+
+
+def test_encode_array_of_fixed_point_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": 2, "scale": 0.1, "encoding": "varint"})
+
+    assert encode_var([1.0, 20.0], var) == b"\x0a\xc8\x01"
+
+
+def test_encode_packed_struct() -> None:
+    var = LrpcVar({"name": "v1", "type": "struct@MyStruct4"})
+    value: dict[str, LrpcType] = {"f0": True, "f1": False, "f2": 5, "f3": -3, "f4": "test2", "f5": 0x1234, "f6": True}
+
+    # f0..f4 are packed in 15 bits, f5 is a regular field, f6 is a bit field of its own
+    assert encode_var(value, var) == b"\xb5\x6f\x34\x12\x01"
+
+    f2_too_large: dict[str, LrpcType] = {**value, "f2": 8}
+    f3_too_small: dict[str, LrpcType] = {**value, "f3": -9}
+    f0_not_bool: dict[str, LrpcType] = {**value, "f0": 1}
+    f2_not_int: dict[str, LrpcType] = {**value, "f2": 1.0}
+    f4_invalid: dict[str, LrpcType] = {**value, "f4": "test3"}
+
+    with pytest.raises(ValueError, match=re.escape("Value 8 for f2 does not fit in 3 bits")):
+        encode_var(f2_too_large, var)
+
+    with pytest.raises(ValueError, match=re.escape("Value -9 for f3 does not fit in 4 bits")):
+        encode_var(f3_too_small, var)
+
+    with pytest.raises(TypeError, match=re.escape("Type error for f0: expected bool, but got <class 'int'>")):
+        encode_var(f0_not_bool, var)
+
+    with pytest.raises(TypeError, match=re.escape("Type error for f2: expected int, but got <class 'float'>")):
+        encode_var(f2_not_int, var)
+
+    with pytest.raises(ValueError, match=re.escape("Enum error for f4 of type MyEnum1: test3 is not a valid enum")):
+        encode_var(f4_invalid, var)
+
+
 def test_encode_unknown_struct() -> None:
     var = LrpcVar({"name": "v1", "type": "struct@UnknownStruct"})
 
@@ -412,3 +479,59 @@ def test_encode_array_of_double() -> None:
 
     with pytest.raises(ValueError, match=re.escape("Length error for v1: expected 2, but got 3")):
         encode_var([0, 123.456, 456.789], var)
+
+
+def test_encode_varint_unsigned() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint32_t", "encoding": "varint"})
+
+    assert encode_var(0, var) == b"\x00"
+    assert encode_var(127, var) == b"\x7f"
+    assert encode_var(128, var) == b"\x80\x01"
+    assert encode_var(300, var) == b"\xac\x02"
+    assert encode_var(0xFFFFFFFF, var) == b"\xff\xff\xff\xff\x0f"
+
+    with pytest.raises(struct.error, match=number_out_of_range_pattern(0, 4294967295)):
+        encode_var(-1, var)
+
+    with pytest.raises(struct.error, match=number_out_of_range_pattern(0, 4294967295)):
+        encode_var(0x100000000, var)
+
+    with pytest.raises(TypeError, match="Type error for v1: expected int, but got <class 'float'>"):
+        encode_var(1.5, var)
+
+    with pytest.raises(TypeError, match="Type error for v1: expected int, but got <class 'bool'>"):
+        encode_var(True, var)  # noqa: FBT003
+
+
+def test_encode_varint_signed() -> None:
+    var = LrpcVar({"name": "v1", "type": "int16_t", "encoding": "varint"})
+
+    assert encode_var(0, var) == b"\x00"
+    assert encode_var(-1, var) == b"\x01"
+    assert encode_var(1, var) == b"\x02"
+    assert encode_var(-64, var) == b"\x7f"
+    assert encode_var(64, var) == b"\x80\x01"
+    assert encode_var(32767, var) == b"\xfe\xff\x03"
+    assert encode_var(-32768, var) == b"\xff\xff\x03"
+
+    with pytest.raises(struct.error, match=number_out_of_range_pattern(-32768, 32767)):
+        encode_var(32768, var)
+
+
+def test_encode_varint_int64_t() -> None:
+    var = LrpcVar({"name": "v1", "type": "int64_t", "encoding": "varint"})
+
+    assert encode_var(-(2**63), var) == b"\xff" * 9 + b"\x01"
+
+
+def test_encode_array_of_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": 3, "encoding": "varint"})
+
+    assert encode_var([1, 200, 3], var) == b"\x01\xc8\x01\x03"
+
+
+def test_encode_optional_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": "?", "encoding": "varint"})
+
+    assert encode_var(None, var) == b"\x00"
+    assert encode_var(200, var) == b"\x01\xc8\x01"
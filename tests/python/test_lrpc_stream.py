@@ -123,6 +123,59 @@ def test_server_stream_finite_with_params() -> None:
     assert stream.returns()[1].name() == "final"
 
 
+def test_server_stream_batched() -> None:
+    s: LrpcStreamDict = {
+        "name": "s1",
+        "id": 123,
+        "origin": "server",
+        "batch": 8,
+        "params": [{"name": "p1", "type": "uint8_t"}],
+    }
+
+    stream = LrpcStream(s)
+
+    assert stream.is_batched()
+    assert stream.batch_size() == 8
+
+
+def test_server_stream_not_batched() -> None:
+    s: LrpcStreamDict = {"name": "s1", "id": 123, "origin": "server"}
+
+    stream = LrpcStream(s)
+
+    assert stream.is_batched() is False
+    assert stream.batch_size() == 1
+    assert stream.has_sequence_number() is False
+
+
+def test_server_stream_sequenced() -> None:
+    s: LrpcStreamDict = {"name": "s1", "id": 123, "origin": "server", "sequence": True}
+
+    stream = LrpcStream(s)
+
+    assert stream.has_sequence_number()
+    # the sequence number is not part of the stream returns
+    assert stream.number_returns() == 0
+
+
+def test_server_stream_rate_limited() -> None:
+    s: LrpcStreamDict = {"name": "s1", "id": 123, "origin": "server", "max_rate": 100}
+
+    stream = LrpcStream(s)
+
+    assert stream.is_rate_limited()
+    assert stream.max_rate() == 100
+
+
+def test_server_stream_not_rate_limited() -> None:
+    s: LrpcStreamDict = {"name": "s1", "id": 123, "origin": "server"}
+
+    stream = LrpcStream(s)
+
+    assert not stream.is_rate_limited()
+    assert stream.max_rate() is None
+
+
 def test_stream_param() -> None:
     s: LrpcStreamDict = {"name": "s1", "id": 123, "origin": "server", "params": [{"name": "p1", "type": "uint8_t"}]}
 
@@ -126,3 +126,48 @@ def test_validation_additional_fields() -> None:
 
     with pytest.raises(ValidationError, match=re.escape("Extra inputs are not permitted")):
         LrpcStruct(s)  # type: ignore[arg-type]
+
+
+def test_packed() -> None:
+    s: LrpcStructDict = {
+        "name": "MyStruct",
+        "packed": True,
+        "fields": [
+            {"name": "f1", "type": "bool"},
+            {"name": "f2", "type": "uint8_t", "bits": 3},
+            {"name": "f3", "type": "uint16_t"},
+            {"name": "f4", "type": "bool", "count": 2},
+            {"name": "f5", "type": "enum@MyEnum", "bits": 2},
+        ],
+    }
+
+    struct = LrpcStruct(s)
+
+    assert struct.is_packed() is True
+
+    fields = struct.fields()
+    assert fields[0].is_bit_field() is True
+    assert fields[0].bit_width() == 1
+    assert fields[1].bit_width() == 3
+    assert fields[2].is_bit_field() is False
+    assert fields[3].is_bit_field() is False
+    assert fields[4].bit_width() == 2
+
+    groups = [[f.name() for f in group] for group in struct.field_groups()]
+    assert groups == [["f1", "f2"], ["f3"], ["f4"], ["f5"]]
+
+
+def test_not_packed() -> None:
+    s: LrpcStructDict = {
+        "name": "MyStruct",
+        "fields": [
+            {"name": "f1", "type": "bool"},
+            {"name": "f2", "type": "bool"},
+        ],
+    }
+
+    struct = LrpcStruct(s)
+
+    assert struct.is_packed() is False
+    assert struct.fields()[0].is_bit_field() is False
+    assert [[f.name() for f in group] for group in struct.field_groups()] == [["f1"], ["f2"]]
@@ -196,6 +196,15 @@ def test_validation_missing_name() -> None:
         LrpcVar(v)  # type: ignore[arg-type]
 
 
+def test_trusted_skips_validation() -> None:
+    v = {"name": "v1", "type": "uint8_t", "unknown": 1}
+
+    with pytest.raises(ValidationError, match=re.escape("Extra inputs are not permitted")):
+        LrpcVar(v)  # type: ignore[arg-type]
+
+    assert LrpcVar(v, trusted=True).name() == "v1"  # type: ignore[arg-type]
+
+
 def test_validation_missing_type() -> None:
     v = {"name": "v1"}
 
@@ -384,3 +393,77 @@ class TestLrpcVarByteArray:
         assert v.array_size() == -1
         with pytest.raises(TypeError, match="Pack type is not defined for LrpcVar of type optional"):
             v.pack_type()
+
+
+def test_encoding() -> None:
+    assert LrpcVar({"name": "v1", "type": "uint32_t"}).encoding() == LrpcVar.Encoding.FIXED
+    assert LrpcVar({"name": "v1", "type": "uint32_t"}).is_varint() is False
+
+    var = LrpcVar({"name": "v1", "type": "uint32_t", "encoding": "varint"})
+    assert var.encoding() == LrpcVar.Encoding.VARINT
+    assert var.is_varint()
+    assert var.contained().is_varint()
+
+    with pytest.raises(ValueError, match=re.escape("'zigzag' is not a valid LrpcVar.Encoding")):
+        LrpcVar({"name": "v1", "type": "uint32_t", "encoding": "zigzag"})
+
+
+def test_rw_type_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "int32_t", "encoding": "varint"})
+    assert var.rw_type() == "lrpc::tags::varint<int32_t>"
+    assert var.rw_type("ns") == "lrpc::tags::varint<int32_t>"
+    assert var.param_type() == "int32_t"
+
+
+def test_rw_type_array_of_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": 4, "encoding": "varint"})
+    assert var.rw_type() == "lrpc::tags::array_n<lrpc::tags::varint<uint16_t>>"
+    assert var.param_type() == "lrpc::span<const uint16_t>"
+
+
+def test_rw_type_optional_of_varint() -> None:
+    var = LrpcVar({"name": "v1", "type": "uint16_t", "count": "?", "encoding": "varint"})
+    assert var.rw_type() == "lrpc::optional<lrpc::tags::varint<uint16_t>>"
+    assert var.param_type() == "lrpc::optional<uint16_t>"
+
+
+def test_float16() -> None:
+    var = LrpcVar({"name": "v1", "type": "float16"})
+    assert var.base_type_is_float()
+    assert var.base_type_is_float16()
+    assert var.pack_type() == "e"
+    assert var.field_type() == "float"
+    assert var.param_type() == "float"
+    assert var.return_type() == "float"
+    assert var.rw_type() == "lrpc::tags::float16"
+    assert LrpcVar({"name": "v1", "type": "float"}).base_type_is_float16() is False
+
+
+def test_rw_type_array_of_float16() -> None:
+    var = LrpcVar({"name": "v1", "type": "float16", "count": 4})
+    assert var.rw_type() == "lrpc::tags::array_n<lrpc::tags::float16>"
+    assert var.field_type() == "lrpc::array<float, 4>"
+    assert var.param_type() == "lrpc::span<const float>"
+
+
+def test_rw_type_optional_of_float16() -> None:
+    var = LrpcVar({"name": "v1", "type": "float16", "count": "?"})
+    assert var.rw_type() == "lrpc::optional<lrpc::tags::float16>"
+    assert var.param_type() == "lrpc::optional<float>"
+
+
+def test_fixed_point() -> None:
+    var = LrpcVar({"name": "v1", "type": "int16_t"})
+    assert var.is_fixed_point() is False
+    assert var.scale() == 1.0
+    assert var.offset() == 0.0
+
+    var = LrpcVar({"name": "v1", "type": "int16_t", "scale": 0.5, "offset": -40})
+    assert var.is_fixed_point()
+    assert var.scale() == 0.5
+    assert var.offset() == -40.0
+    assert var.param_type() == "int16_t"
+    assert var.rw_type() == "int16_t"
+    assert var.contained().is_fixed_point()
+
+    assert LrpcVar({"name": "v1", "type": "int16_t", "offset": 1.5}).is_fixed_point()
@@ -7,7 +7,10 @@ from lrpc.codegen.meta_constants_writer import MetaConstantsWriter
 
 def test_with_namespace() -> None:
     mock_file = StringIO()
-    writer = MetaConstantsWriter(CppFile.from_writer(mock_file.write))
+    writer = MetaConstantsWriter(
+        CppFile.from_writer(mock_file.write),
+        {"rx_buffer_size": 100, "tx_buffer_size": 25, "max_service_id": 3, "features": 0},
+    )
     writer.write_constants(
         definition_version=None,
         definition_hash=None,
@@ -33,6 +36,11 @@ namespace test123
         f'"{lrpc_version}"'
         """};
 
+        static constexpr uint16_t RxBufferSize {100};
+        static constexpr uint16_t TxBufferSize {25};
+        static constexpr uint8_t MaxServiceId {3};
+        static constexpr uint32_t Features {0x00000000};
+
         static constexpr size_t DefinitionStreamChunkSize {20};
 
         static constexpr lrpc::array<uint8_t, 0> CompressedDefinition =
@@ -51,7 +59,10 @@ namespace test123
 
 def test_without_namespace() -> None:
     mock_file = StringIO()
-    writer = MetaConstantsWriter(CppFile.from_writer(mock_file.write))
+    writer = MetaConstantsWriter(
+        CppFile.from_writer(mock_file.write),
+        {"rx_buffer_size": 256, "tx_buffer_size": 35, "max_service_id": 0, "features": 1},
+    )
     writer.write_constants(
         definition_version=None,
         definition_hash=None,
@@ -75,6 +86,11 @@ namespace lrpc_meta
         f'"{lrpc_version}"'
         """};
 
+    static constexpr uint16_t RxBufferSize {256};
+    static constexpr uint16_t TxBufferSize {35};
+    static constexpr uint8_t MaxServiceId {0};
+    static constexpr uint32_t Features {0x00000001};
+
     static constexpr size_t DefinitionStreamChunkSize {30};
 
     static constexpr lrpc::array<uint8_t, 0> CompressedDefinition =
@@ -92,7 +108,10 @@ namespace lrpc_meta
 
 def test_with_definition_hash_and_version() -> None:
     mock_file = StringIO()
-    writer = MetaConstantsWriter(CppFile.from_writer(mock_file.write))
+    writer = MetaConstantsWriter(
+        CppFile.from_writer(mock_file.write),
+        {"rx_buffer_size": 100, "tx_buffer_size": 25, "max_service_id": 3, "features": 6},
+    )
     writer.write_constants(
         definition_version="1.2.3.4",
         definition_hash="AABBCCDD",
@@ -118,6 +137,11 @@ namespace test123
         f'"{lrpc_version}"'
         """};
 
+        static constexpr uint16_t RxBufferSize {100};
+        static constexpr uint16_t TxBufferSize {25};
+        static constexpr uint8_t MaxServiceId {3};
+        static constexpr uint32_t Features {0x00000006};
+
         static constexpr size_t DefinitionStreamChunkSize {20};
 
         static constexpr lrpc::array<uint8_t, 0> CompressedDefinition =
@@ -137,7 +161,10 @@ namespace test123
 def test_without_namespace_with_compressed_definition() -> None:
     mock_file = StringIO()
     compressed_def = b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\x13"
-    writer = MetaConstantsWriter(CppFile.from_writer(mock_file.write))
+    writer = MetaConstantsWriter(
+        CppFile.from_writer(mock_file.write),
+        {"rx_buffer_size": 256, "tx_buffer_size": 35, "max_service_id": 0, "features": 1},
+    )
     writer.write_constants(
         definition_version=None,
         definition_hash=None,
@@ -161,6 +188,11 @@ namespace lrpc_meta
         f'"{lrpc_version}"'
         """};
 
+    static constexpr uint16_t RxBufferSize {256};
+    static constexpr uint16_t TxBufferSize {35};
+    static constexpr uint8_t MaxServiceId {0};
+    static constexpr uint32_t Features {0x00000001};
+
     static constexpr size_t DefinitionStreamChunkSize {30};
 
     static constexpr lrpc::array<uint8_t, 20> CompressedDefinition =
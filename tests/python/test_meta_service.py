@@ -1,4 +1,5 @@
 from lrpc.core import LrpcDef
+from lrpc.core.meta import LrpcMetaFeature, stream_features
 from lrpc.utils import load_lrpc_def
 
 
@@ -31,6 +32,27 @@ def test_meta_service_properties() -> None:
     assert meta_streams[1].name() == "definition"
 
     meta_functions = meta_service.functions()
-    assert len(meta_functions) == 1
+    assert len(meta_functions) == 2
     assert meta_functions[0].id() == 2
     assert meta_functions[0].name() == "version"
+    assert meta_functions[1].id() == 3
+    assert meta_functions[1].name() == "capabilities"
+
+
+def test_stream_features() -> None:
+    def_str = """name: test
+services:
+  - name: "srv0"
+    functions:
+      - name: "f0"
+    streams:
+      - name: "s0"
+        origin: server
+        batch: 4
+      - name: "s1"
+        origin: server
+        max_rate: 100
+"""
+    features = stream_features(load_lrpc_def(def_str))
+    assert features == LrpcMetaFeature.BATCHED_STREAMS | LrpcMetaFeature.RATE_LIMITED_STREAMS
+    assert stream_features(load_meta_def()) == LrpcMetaFeature(0)
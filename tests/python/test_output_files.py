@@ -0,0 +1,152 @@
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from lrpc.codegen.output_files import (
+    manifest_file,
+    submit_tracked,
+    track_generated_files,
+    write_build_manifest,
+    write_depfile,
+    write_if_changed,
+)
+
+
+def test_write_if_changed() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "test.hpp"
+
+        assert write_if_changed(path, "hello\n")
+        os.utime(path, (0, 0))
+
+        assert not write_if_changed(path, "hello\n")
+        assert path.stat().st_mtime == 0
+
+        assert write_if_changed(path, "world\n")
+        assert path.read_text(encoding="utf-8") == "world\n"
+
+
+def test_track_generated_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        write_if_changed(output / "b.hpp", "b")
+
+        with track_generated_files(output, "test") as generated:
+            write_if_changed(output / "a.hpp", "a")
+            write_if_changed(output / "b.hpp", "b")
+
+        assert generated.written == [(output / "a.hpp").absolute()]
+        assert generated.unchanged == [(output / "b.hpp").absolute()]
+        assert not generated.removed
+
+        manifest = json.loads(manifest_file(output, "test").read_text(encoding="utf-8"))
+        assert list(manifest["files"]) == ["a.hpp", "b.hpp"]
+
+
+def test_track_files_of_worker_threads() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        names = [f"{i}.hpp" for i in range(10)]
+
+        with track_generated_files(output, "test") as generated, ThreadPoolExecutor(max_workers=4) as executor:
+            for name in reversed(names):
+                submit_tracked(executor, write_if_changed, output / name, name)
+
+        assert generated.written == sorted((output / n).absolute() for n in names)
+
+
+def test_remove_stale_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        with track_generated_files(output, "test"):
+            write_if_changed(output / "a.hpp", "a")
+            write_if_changed(output / "b.hpp", "b")
+
+        # Files not generated by this definition are never removed
+        write_if_changed(output / "c.hpp", "c")
+        with track_generated_files(output, "other"):
+            write_if_changed(output / "d.hpp", "d")
+
+        with track_generated_files(output, "test") as generated:
+            write_if_changed(output / "a.hpp", "a")
+
+        assert generated.removed == [(output / "b.hpp").absolute()]
+        assert not (output / "b.hpp").exists()
+        assert (output / "c.hpp").exists()
+        assert (output / "d.hpp").exists()
+
+
+def test_partial_run_keeps_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        with track_generated_files(output, "test"):
+            write_if_changed(output / "a.hpp", "a")
+            write_if_changed(output / "b.hpp", "b")
+
+        with track_generated_files(output, "test", partial=True) as generated:
+            write_if_changed(output / "a.hpp", "a2")
+
+        assert generated.written == [(output / "a.hpp").absolute()]
+        assert generated.unchanged == [(output / "b.hpp").absolute()]
+        assert not generated.removed
+        assert (output / "b.hpp").exists()
+
+        manifest = json.loads(manifest_file(output, "test").read_text(encoding="utf-8"))
+        assert list(manifest["files"]) == ["a.hpp", "b.hpp"]
+
+
+def test_no_stale_files_removed_on_error() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        with track_generated_files(output, "test"):
+            write_if_changed(output / "a.hpp", "a")
+
+        with pytest.raises(ValueError, match="error"), track_generated_files(output, "test"):
+            raise ValueError("error")
+
+        assert (output / "a.hpp").exists()
+
+
+def test_broken_manifest() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        write_if_changed(output / "a.hpp", "a")
+        manifest_file(output, "test").write_text("not json", encoding="utf-8")
+
+        with track_generated_files(output, "test") as generated:
+            pass
+
+        assert not generated.removed
+        assert (output / "a.hpp").exists()
+
+
+def test_write_depfile() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        depfile = output / "test.d"
+        write_depfile(depfile, [output / "a.hpp", output / "b.hpp"], [output / "my def.yaml", output / "x$.yaml"])
+
+        out = output.absolute().as_posix()
+        assert depfile.read_text(encoding="utf-8") == (
+            f"{out}/a.hpp {out}/b.hpp: \\\n  {out}/my\\ def.yaml \\\n  {out}/x$$.yaml\n"
+        )
+
+
+def test_write_build_manifest() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        write_if_changed(output / "a.hpp", "a")
+        write_if_changed(output / "def.yaml", "name: test")
+        write_build_manifest(output / "manifest.json", [output / "a.hpp"], [output / "def.yaml"], "1.2.3")
+
+        manifest = json.loads((output / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["lrpc_version"] == "1.2.3"
+        assert list(manifest["inputs"]) == [(output / "def.yaml").absolute().as_posix()]
+        assert list(manifest["outputs"]) == [(output / "a.hpp").absolute().as_posix()]
+        assert manifest["outputs"][(output / "a.hpp").absolute().as_posix()] == (
+            "ca978112ca1bbdcafac231b39a23dc4da786eff8147c4e72b9807785afee48bb"
+        )
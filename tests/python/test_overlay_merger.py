@@ -0,0 +1,111 @@
+import re
+from typing import cast
+
+import pytest
+
+from lrpc.utils import OverlayMerger, YamlValues, merge_definitions
+from lrpc.utils import merge_definition as lrpc_merge_definition
+
+
+class TestMergeSequence:
+    @staticmethod
+    def test_same_result_as_separate_merges() -> None:
+        base: YamlValues = {
+            "name": "test",
+            "services": [{"name": "s0", "functions": [{"name": "f0"}, {"name": "f1"}]}],
+        }
+        overlays: list[YamlValues] = [
+            {"services": [{"name": "s0", "functions": [{"name": "f2"}], "merge_strategy": "add"}]},
+            {"services": [{"name": "s0", "functions": [{"name": "f0", "merge_strategy": "remove"}]}]},
+            {"services": [{"name": "s1", "functions": [{"name": "f0"}], "merge_strategy": "add"}]},
+        ]
+
+        separate = base
+        for overlay in overlays:
+            separate = lrpc_merge_definition(separate, overlay)
+
+        assert merge_definitions(base, overlays) == separate
+        assert separate == {
+            "name": "test",
+            "services": [
+                {"name": "s0", "functions": [{"name": "f1"}, {"name": "f2"}]},
+                {"name": "s1", "functions": [{"name": "f0"}]},
+            ],
+        }
+
+    @staticmethod
+    def test_unmodified_parts_are_not_copied() -> None:
+        base: dict[str, YamlValues] = {"a": {"x": 1}, "b": {"y": [1, 2]}}
+        merger = OverlayMerger(base)
+        merger.merge({"a": {"z": 2, "merge_strategy": "add"}})
+
+        result = merger.result()
+
+        assert result == {"a": {"x": 1, "z": 2}, "b": {"y": [1, 2]}}
+        assert isinstance(result, dict)
+        assert result["b"] is base["b"]
+        assert base == {"a": {"x": 1}, "b": {"y": [1, 2]}}
+
+    @staticmethod
+    def test_result_does_not_share_parts_with_inputs() -> None:
+        base: YamlValues = {"a": {"x": 1}, "b": {"y": [1, 2]}}
+        overlay: YamlValues = {"a": {"z": [3], "merge_strategy": "add"}}
+
+        result = cast(dict[str, dict[str, list[int]]], merge_definitions(base, [overlay]))
+        result["b"]["y"].append(99)
+        result["a"]["z"].append(99)
+
+        assert base == {"a": {"x": 1}, "b": {"y": [1, 2]}}
+        assert overlay == {"a": {"z": [3], "merge_strategy": "add"}}
+
+    @staticmethod
+    def test_failed_merge_leaves_definition_unchanged() -> None:
+        merger = OverlayMerger({"a": {"x": 1}, "items": [{"name": "i0", "v": 0}]})
+        merger.merge({"a": {"y": 2}, "items": [{"name": "i1", "v": 1}], "merge_strategy": "add"})
+
+        with pytest.raises(ValueError, match="Property 'x' cannot be added because it already exists in base"):
+            merger.merge({"a": {"q": 5, "x": 3}, "merge_strategy": "add"})
+        with pytest.raises(ValueError, match=re.escape("Item i2 not found in base. Strategy is 'unspecified'")):
+            merger.merge({"items": [{"name": "i1", "merge_strategy": "remove"}, {"name": "i2", "v": 2}]})
+
+        assert merger.result() == {"a": {"x": 1, "y": 2}, "items": [{"name": "i0", "v": 0}, {"name": "i1", "v": 1}]}
+
+        merger.merge({"items": [{"name": "i1", "v": 3, "merge_strategy": "replace"}]})
+        assert merger.result() == {"a": {"x": 1, "y": 2}, "items": [{"name": "i0", "v": 0}, {"name": "i1", "v": 3}]}
+
+    @staticmethod
+    def test_failed_first_merge_leaves_base_unchanged() -> None:
+        merger = OverlayMerger({"a": {"x": 1}})
+
+        with pytest.raises(ValueError, match="Property 'x' cannot be added because it already exists in base"):
+            merger.merge({"a": {"q": 5, "x": 3}, "merge_strategy": "add"})
+
+        assert merger.result() == {"a": {"x": 1}}
+
+    @staticmethod
+    def test_merge_into_property_removed_by_previous_overlay() -> None:
+        base: YamlValues = {"a": {"x": 1}, "b": 2}
+        overlays: list[YamlValues] = [{"a": None}, {"a": {"y": 2}, "merge_strategy": "add"}]
+
+        assert merge_definitions(base, overlays) == {"a": {"y": 2}, "b": 2}
+
+    @staticmethod
+    def test_duplicate_names_after_remove() -> None:
+        base: YamlValues = {"items": [{"name": "a", "v": 1}, {"name": "a", "v": 2}, {"name": "b", "v": 3}]}
+        overlays: list[YamlValues] = [
+            {"items": [{"name": "a", "merge_strategy": "remove"}]},
+            {"items": [{"name": "a", "v": 4, "merge_strategy": "replace"}]},
+        ]
+
+        assert merge_definitions(base, overlays) == {"items": [{"name": "a", "v": 4}, {"name": "b", "v": 3}]}
+
+    @staticmethod
+    def test_merge_after_result() -> None:
+        merger = OverlayMerger({"a": {"x": 1}})
+        merger.merge({"a": {"y": 2}, "merge_strategy": "add"})
+        first = merger.result()
+
+        merger.merge({"a": {"z": 3}, "merge_strategy": "add"})
+
+        assert first == {"a": {"x": 1, "y": 2}}
+        assert merger.result() == {"a": {"x": 1, "y": 2, "z": 3}}
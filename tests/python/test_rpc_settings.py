@@ -187,3 +187,18 @@ def test_validation_wrong_byte_type() -> None:
 
     with pytest.raises(ValidationError):
         RpcSettings(s)  # type: ignore[arg-type]
+
+
+def test_auto_buffer_sizes() -> None:
+    s: RpcSettingsDict = {"rx_buffer_size": "auto", "tx_buffer_size": 100}
+    settings = RpcSettings(s)
+
+    assert settings.rx_buffer_size_is_auto()
+    assert not settings.tx_buffer_size_is_auto()
+    assert settings.rx_buffer_size() == 256
+    assert settings.tx_buffer_size() == 100
+
+    settings.resolve_auto_buffer_sizes(20, 30)
+
+    assert settings.rx_buffer_size() == 20
+    assert settings.tx_buffer_size() == 100
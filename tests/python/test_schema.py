@@ -4,6 +4,7 @@ import re
 import pytest
 
 from lrpc.errors import LrpcDefinitionError
+from lrpc.schema import load_lrpc_schema, lrpc_schema_validator
 from lrpc.utils import load_lrpc_def
 
 
@@ -1023,3 +1024,320 @@ user_defined_property: 10
         match=re.escape("Additional properties are not allowed ('user_defined_property' was unexpected)"),
     ):
         load_lrpc_def(rpc_def)
+
+
+def test_schema_validator_is_cached() -> None:
+    validator = lrpc_schema_validator()
+
+    assert lrpc_schema_validator() is validator
+    assert validator.schema == load_lrpc_schema()
+    assert validator.is_valid({"name": "test", "services": [{"name": "srv0", "functions": [{"name": "f0"}]}]})
+    assert not validator.is_valid({"name": "test"})
+
+
+def test_batched_client_stream(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: client
+        batch: 4
+        params:
+          - { name: p0, type: uint8_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(["Batching is only supported for streams with origin server: srv0.s0"], caplog.text)
+
+
+def test_batched_stream_with_auto_string(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: server
+        batch: 4
+        params:
+          - { name: p0, type: string }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(["Batched stream srv0.s0 must not contain auto strings"], caplog.text)
+
+
+def test_batched_stream_exceeds_tx_buffer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+settings:
+  tx_buffer_size: 19
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: server
+        batch: 4
+        params:
+          - { name: p0, type: uint32_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        ["Batched stream srv0.s0 requires a transmit buffer of 20 bytes, but tx_buffer_size is 19"],
+        caplog.text,
+    )
+
+
+def test_function_exceeds_rx_buffer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+settings:
+  rx_buffer_size: 10
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: uint32_t, count: 2 }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        ["Function srv0.f0 requires a receive buffer of 11 bytes, but rx_buffer_size is 10"],
+        caplog.text,
+    )
+
+
+def test_meta_version_exceeds_tx_buffer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+settings:
+  tx_buffer_size: 20
+services:
+  - name: srv0
+    functions:
+      - name: f0
+"""
+
+    caplog.set_level(logging.WARNING)
+    load_lrpc_def(rpc_def, warnings_as_errors=False)
+
+    assert "LrpcMeta.version requires a transmit buffer of" in caplog.text
+    assert "but tx_buffer_size is 20" in caplog.text
+
+
+def test_sequenced_client_stream(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: client
+        sequence: true
+        params:
+          - { name: p0, type: uint8_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(["Sequence numbers are only supported for streams with origin server: srv0.s0"], caplog.text)
+
+
+def test_rate_limited_client_stream(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: client
+        max_rate: 10
+        params:
+          - { name: p0, type: uint8_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(["Rate limiting is only supported for streams with origin server: srv0.s0"], caplog.text)
+
+
+def test_rate_limited_finite_stream(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: server
+        finite: true
+        max_rate: 10
+        params:
+          - { name: p0, type: uint8_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(["Rate limiting is not supported for finite streams: srv0.s0"], caplog.text)
+
+
+def test_batched_sequenced_stream_exceeds_tx_buffer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+settings:
+  tx_buffer_size: 23
+services:
+  - name: srv0
+    streams:
+      - name: s0
+        origin: server
+        batch: 4
+        sequence: true
+        params:
+          - { name: p0, type: uint32_t }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        ["Batched stream srv0.s0 requires a transmit buffer of 24 bytes, but tx_buffer_size is 23"],
+        caplog.text,
+    )
+
+
+def test_varint_encoding_of_non_integer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: uint32_t, encoding: varint }
+          - { name: p1, type: float, encoding: varint }
+        returns:
+          - { name: r0, type: "@s0", encoding: varint }
+structs:
+  - name: s0
+    fields:
+      - { name: f0, type: bool, encoding: varint }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        [
+            "Varint encoding is only supported for integer types: s0.f0",
+            "Varint encoding is only supported for integer types: srv0.f0.p1",
+            "Varint encoding is only supported for integer types: srv0.f0.r0",
+        ],
+        caplog.text,
+    )
+
+
+def test_bit_width_outside_packed_struct(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: uint8_t, bits: 3 }
+          - { name: p1, type: "@s0" }
+structs:
+  - name: s0
+    fields:
+      - { name: f0, type: uint8_t, bits: 3 }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        [
+            "Bit width is only supported for fields of packed structs: s0.f0",
+            "Bit width is only supported for fields of packed structs: srv0.f0.p0",
+        ],
+        caplog.text,
+    )
+
+
+def test_invalid_bit_fields(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: "@s0" }
+structs:
+  - name: s0
+    packed: true
+    fields:
+      - { name: f0, type: float, bits: 3 }
+      - { name: f1, type: uint8_t, bits: 3, count: 2 }
+      - { name: f2, type: uint8_t, bits: 9 }
+      - { name: f3, type: bool, bits: 2 }
+      - { name: f4, type: "@e0", bits: 2 }
+      - { name: f5, type: int64_t, bits: 64 }
+enums:
+  - name: e0
+    fields: [a, b, c, d, e]
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        [
+            "Bit width is only supported for bool, integer and enum fields: s0.f0",
+            "Bit width is only supported for bool, integer and enum fields: s0.f1",
+            "Bit width 9 of s0.f2 exceeds the size of uint8_t",
+            "Bit width 2 of s0.f3 exceeds the size of bool",
+            "Bit width 2 of s0.f4 is too small for the IDs of e0",
+        ],
+        caplog.text,
+    )
+
+
+def test_fixed_point_of_non_integer(caplog: pytest.LogCaptureFixture) -> None:
+    rpc_def = """name: test
+services:
+  - name: srv0
+    functions:
+      - name: f0
+        params:
+          - { name: p0, type: int16_t, scale: 0.5, offset: 1 }
+          - { name: p1, type: float, scale: 0.5 }
+        returns:
+          - { name: r0, type: bool, offset: 1 }
+"""
+
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Errors detected in LRPC definition")):
+        load_lrpc_def(rpc_def)
+
+    assert_log_entries(
+        [
+            "Scale and offset are only supported for integer types: srv0.f0.p1",
+            "Scale and offset are only supported for integer types: srv0.f0.r0",
+        ],
+        caplog.text,
+    )
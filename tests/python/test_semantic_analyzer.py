@@ -0,0 +1,119 @@
+import re
+from collections.abc import Generator
+
+import pytest
+
+from lrpc.core import LrpcDef, LrpcFun
+from lrpc.errors import LrpcDefinitionError
+from lrpc.utils import load_lrpc_def
+from lrpc.validation import LrpcValidator, SemanticAnalyzer, register_validator, unregister_validator
+from lrpc.visitors import LrpcMultiVisitor, LrpcVisitor
+
+
+class FunctionNames(LrpcVisitor):
+    def __init__(self) -> None:
+        self.names: list[str] = []
+
+    def visit_lrpc_function(self, function: LrpcFun) -> None:
+        self.names.append(function.name())
+
+
+class NoGetterValidator(LrpcValidator):
+    def visit_lrpc_def(self, _: LrpcDef) -> None:
+        self.reset()
+
+    def visit_lrpc_function(self, function: LrpcFun) -> None:
+        if function.name().startswith("get_"):
+            self.add_warning(f"Function name starts with get_: {function.name()}")
+
+
+class PerServiceNoGetterValidator(NoGetterValidator):
+    PER_SERVICE = True
+
+
+DEFINITION = """name: test
+services:
+  - name: s0
+    functions:
+      - name: f0
+      - name: get_value
+  - name: s1
+    functions:
+      - name: f1
+"""
+
+
+@pytest.fixture
+def lrpc_def() -> LrpcDef:
+    return load_lrpc_def(DEFINITION)
+
+
+@pytest.fixture
+def no_getter_validator(lrpc_def: LrpcDef) -> Generator[LrpcDef, None, None]:
+    register_validator(NoGetterValidator)
+    yield lrpc_def
+    unregister_validator(NoGetterValidator)
+
+
+def test_multi_visitor(lrpc_def: LrpcDef) -> None:
+    visitors = [FunctionNames(), FunctionNames()]
+
+    lrpc_def.accept(LrpcMultiVisitor(visitors), visit_meta_service=False)
+
+    assert visitors[0].names == ["f0", "get_value", "f1"]
+    assert visitors[1].names == ["f0", "get_value", "f1"]
+
+
+def test_visit_services(lrpc_def: LrpcDef) -> None:
+    visitor = FunctionNames()
+
+    lrpc_def.accept(visitor, visit_meta_service=False, services={"s1"})
+
+    assert visitor.names == ["f1"]
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_analyze(lrpc_def: LrpcDef, jobs: int) -> None:
+    SemanticAnalyzer(lrpc_def).analyze(warnings_as_errors=True, jobs=jobs)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_registered_validator(no_getter_validator: LrpcDef, jobs: int) -> None:
+    with pytest.raises(
+        LrpcDefinitionError,
+        match=re.escape("Warnings treated as error: ['Function name starts with get_: get_value']"),
+    ):
+        SemanticAnalyzer(no_getter_validator).analyze(warnings_as_errors=True, jobs=jobs)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_services(lrpc_def: LrpcDef, jobs: int) -> None:
+    register_validator(PerServiceNoGetterValidator)
+    try:
+        # Only s0 has a function that starts with get_
+        SemanticAnalyzer(lrpc_def).analyze(warnings_as_errors=True, jobs=jobs, services={"s1"})
+        with pytest.raises(LrpcDefinitionError, match=re.escape("Function name starts with get_: get_value")):
+            SemanticAnalyzer(lrpc_def).analyze(warnings_as_errors=True, jobs=jobs, services={"s0"})
+    finally:
+        unregister_validator(PerServiceNoGetterValidator)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_services_with_validator_for_all_services(no_getter_validator: LrpcDef, jobs: int) -> None:
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Function name starts with get_: get_value")):
+        SemanticAnalyzer(no_getter_validator).analyze(warnings_as_errors=True, jobs=jobs, services={"s1"})
+
+
+@pytest.mark.usefixtures("no_getter_validator")
+def test_registered_validator_is_used_when_loading() -> None:
+    with pytest.raises(LrpcDefinitionError, match=re.escape("Function name starts with get_: get_value")):
+        load_lrpc_def(DEFINITION)
+
+    load_lrpc_def(DEFINITION, warnings_as_errors=False)
+
+
+def test_unregister_validator(lrpc_def: LrpcDef) -> None:
+    register_validator(NoGetterValidator)
+    unregister_validator(NoGetterValidator)
+
+    SemanticAnalyzer(lrpc_def).analyze(warnings_as_errors=True)
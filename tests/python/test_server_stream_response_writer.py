@@ -123,3 +123,210 @@ def test_array_of_string_n_param() -> None:
 """
 
     assert_stream(func, expected)
+
+
+def test_batched() -> None:
+    func: LrpcStreamDict = {
+        "name": "test_stream",
+        "id": 42,
+        "origin": "server",
+        "batch": 4,
+        "params": [{"name": "p0", "type": "uint8_t"}],
+    }
+    expected = """void test_stream_response(uint8_t p0)
+{
+    const auto _lrpc_paramWriter = [&p0](Writer &writer)
+    {
+        lrpc::write_unchecked<uint8_t>(writer, p0);
+    };
+    if (_lrpc_test_stream_batch.append(_lrpc_paramWriter))
+    {
+        test_stream_flush();
+    }
+}
+
+void test_stream_flush()
+{
+    if (_lrpc_test_stream_batch.empty())
+    {
+        return;
+    }
+
+    const auto _lrpc_batchWriter = [this](Writer &writer)
+    {
+        _lrpc_test_stream_batch.writeTo(writer);
+    };
+    server().transmit(id(), 42, _lrpc_batchWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_batched_finite() -> None:
+    func: LrpcStreamDict = {
+        "name": "test_stream",
+        "id": 42,
+        "origin": "server",
+        "finite": True,
+        "batch": 4,
+        "params": [{"name": "p0", "type": "uint8_t"}],
+    }
+    expected = """void test_stream_response(uint8_t p0, bool final)
+{
+    const auto _lrpc_paramWriter = [&p0, &final](Writer &writer)
+    {
+        lrpc::write_unchecked<uint8_t>(writer, p0);
+        lrpc::write_unchecked<bool>(writer, final);
+    };
+    if (_lrpc_test_stream_batch.append(_lrpc_paramWriter) || final)
+    {
+        test_stream_flush();
+    }
+}
+
+void test_stream_flush()
+{
+    if (_lrpc_test_stream_batch.empty())
+    {
+        return;
+    }
+
+    const auto _lrpc_batchWriter = [this](Writer &writer)
+    {
+        _lrpc_test_stream_batch.writeTo(writer);
+    };
+    server().transmit(id(), 42, _lrpc_batchWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_batch_member() -> None:
+    func: LrpcStreamDict = {"name": "test_stream", "id": 42, "origin": "server", "batch": 4}
+    mock_file = StringIO()
+    writer = ServerStreamResponseWriter(CppFile.from_writer(mock_file.write))
+    writer.write_batch(LrpcStream(func), 3)
+
+    assert mock_file.getvalue() == "lrpc::StreamBatch<12> _lrpc_test_stream_batch{4};\n"
+
+
+def test_sequenced() -> None:
+    func: LrpcStreamDict = {
+        "name": "test_stream",
+        "id": 42,
+        "origin": "server",
+        "sequence": True,
+        "params": [{"name": "p0", "type": "uint8_t"}],
+    }
+    expected = """void test_stream_response(uint8_t p0)
+{
+    const auto _lrpc_sequence = _lrpc_test_stream_sequence;
+    _lrpc_test_stream_sequence = static_cast<uint8_t>(_lrpc_test_stream_sequence + 1U);
+    const auto _lrpc_paramWriter = [_lrpc_sequence, &p0](Writer &writer)
+    {
+        lrpc::write_unchecked<uint8_t>(writer, _lrpc_sequence);
+        lrpc::write_unchecked<uint8_t>(writer, p0);
+    };
+    server().transmit(id(), 42, _lrpc_paramWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_sequenced_no_params() -> None:
+    func: LrpcStreamDict = {"name": "test_stream", "id": 42, "origin": "server", "sequence": True}
+    expected = """void test_stream_response()
+{
+    const auto _lrpc_sequence = _lrpc_test_stream_sequence;
+    _lrpc_test_stream_sequence = static_cast<uint8_t>(_lrpc_test_stream_sequence + 1U);
+    const auto _lrpc_paramWriter = [_lrpc_sequence](Writer &writer)
+    {
+        lrpc::write_unchecked<uint8_t>(writer, _lrpc_sequence);
+    };
+    server().transmit(id(), 42, _lrpc_paramWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_sequence_number_member() -> None:
+    func: LrpcStreamDict = {"name": "test_stream", "id": 42, "origin": "server", "sequence": True}
+    mock_file = StringIO()
+    writer = ServerStreamResponseWriter(CppFile.from_writer(mock_file.write))
+    writer.write_sequence_number(LrpcStream(func))
+
+    assert mock_file.getvalue() == "uint8_t _lrpc_test_stream_sequence{0};\n"
+
+
+def test_rate_limited() -> None:
+    func: LrpcStreamDict = {
+        "name": "test_stream",
+        "id": 42,
+        "origin": "server",
+        "max_rate": 100,
+        "params": [{"name": "p0", "type": "uint8_t"}],
+    }
+    expected = """void test_stream_response(uint8_t p0)
+{
+    if (!_lrpc_test_stream_rateLimit.allow(lrpcTimeUs()))
+    {
+        return;
+    }
+
+    const auto _lrpc_paramWriter = [&p0](Writer &writer)
+    {
+        lrpc::write_unchecked<uint8_t>(writer, p0);
+    };
+    server().transmit(id(), 42, _lrpc_paramWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_rate_limited_batched() -> None:
+    func: LrpcStreamDict = {"name": "test_stream", "id": 42, "origin": "server", "max_rate": 100, "batch": 2}
+    expected = """void test_stream_response()
+{
+    if (!_lrpc_test_stream_rateLimit.allow(lrpcTimeUs()))
+    {
+        return;
+    }
+
+    const auto _lrpc_paramWriter = [](Writer &) {};
+    if (_lrpc_test_stream_batch.append(_lrpc_paramWriter))
+    {
+        test_stream_flush();
+    }
+}
+
+void test_stream_flush()
+{
+    if (_lrpc_test_stream_batch.empty())
+    {
+        return;
+    }
+
+    const auto _lrpc_batchWriter = [this](Writer &writer)
+    {
+        _lrpc_test_stream_batch.writeTo(writer);
+    };
+    server().transmit(id(), 42, _lrpc_batchWriter);
+}
+"""
+
+    assert_stream(func, expected)
+
+
+def test_rate_limit_member() -> None:
+    func: LrpcStreamDict = {"name": "test_stream", "id": 42, "origin": "server", "max_rate": 3}
+    mock_file = StringIO()
+    writer = ServerStreamResponseWriter(CppFile.from_writer(mock_file.write))
+    writer.write_rate_limit(LrpcStream(func))
+
+    # 333333.33 us rounded up
+    assert mock_file.getvalue() == "lrpc::RateLimit _lrpc_test_stream_rateLimit{333334};\n"
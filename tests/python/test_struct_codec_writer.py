@@ -423,3 +423,122 @@ inline ns1::test_struct read_unchecked<ns1::test_struct>(etl::byte_stream_reader
 """
 
     assert_decoder(func, expected, "ns1")
+
+
+packed_struct: LrpcStructDict = {
+    "name": "test_struct",
+    "packed": True,
+    "fields": [
+        {"name": "f1", "type": "bool"},
+        {"name": "f2", "type": "int8_t", "bits": 3},
+        {"name": "f3", "type": "uint16_t"},
+        {"name": "f4", "type": "enum@MyEnum", "bits": 2},
+    ],
+}
+
+
+def test_encoder_packed() -> None:
+    expected = """template<>
+inline void write_unchecked<test_struct>(etl::byte_stream_writer& writer, const test_struct& value)
+{
+    lrpc::BitWriter bitWriter0{writer};
+    bitWriter0.write(static_cast<uint64_t>(value.f1), 1);
+    bitWriter0.write(static_cast<uint64_t>(value.f2), 3);
+    bitWriter0.flush();
+    lrpc::write_unchecked<uint16_t>(writer, value.f3);
+    lrpc::BitWriter bitWriter2{writer};
+    bitWriter2.write(static_cast<uint64_t>(value.f4), 2);
+    bitWriter2.flush();
+}
+"""
+
+    assert_encoder(packed_struct, expected)
+
+
+def test_decoder_packed() -> None:
+    expected = """template<>
+inline test_struct read_unchecked<test_struct>(etl::byte_stream_reader& reader)
+{
+    test_struct value {};
+    lrpc::BitReader bitReader0{reader};
+    value.f1 = static_cast<bool>(bitReader0.read(1));
+    value.f2 = static_cast<int8_t>(bitReader0.readSigned(3));
+    value.f3 = lrpc::read_unchecked<uint16_t>(reader);
+    lrpc::BitReader bitReader2{reader};
+    value.f4 = static_cast<MyEnum>(bitReader2.read(2));
+    return value;
+}
+"""
+
+    assert_decoder(packed_struct, expected)
+
+
+def test_table_codec() -> None:
+    struct: LrpcStructDict = {
+        "name": "test_struct",
+        "fields": [
+            {"name": "f1", "type": "uint16_t", "count": 2},
+            {"name": "f2", "type": "bool"},
+        ],
+    }
+    expected = """template<>
+inline lrpc::span<const lrpc::FieldDescriptor> fieldTable<ns::test_struct>()
+{
+    static_assert(std::is_standard_layout<ns::test_struct>::value, "Table codec requires a standard layout struct");
+    static constexpr lrpc::FieldDescriptor fields[]
+    {
+        {offsetof(ns::test_struct, f1), lrpc::FieldType::Uint16, 2, 0, nullptr},
+        {offsetof(ns::test_struct, f2), lrpc::FieldType::Bool, 1, 0, nullptr},
+    };
+    return fields;
+}
+template<>
+inline ns::test_struct read_unchecked<ns::test_struct>(etl::byte_stream_reader& reader)
+{
+    ns::test_struct value {};
+    lrpc::readFields(reader, &value, fieldTable<ns::test_struct>());
+    return value;
+}
+template<>
+inline void write_unchecked<ns::test_struct>(etl::byte_stream_writer& writer, const ns::test_struct& value)
+{
+    lrpc::writeFields(writer, &value, fieldTable<ns::test_struct>());
+}
+"""
+
+    mock_file = StringIO()
+    writer = StructCodecWriter(CppFile.from_writer(mock_file.write), LrpcStruct(struct), "ns")
+    writer.write_field_table()
+    writer.write_table_decoder()
+    writer.write_table_encoder()
+
+    assert mock_file.getvalue() == expected
+
+
+def test_table_codec_nested_struct() -> None:
+    struct: LrpcStructDict = {
+        "name": "test_struct",
+        "fields": [
+            {"name": "f1", "type": "struct@nested", "count": 2},
+            {"name": "f2", "type": "enum@my_enum"},
+        ],
+    }
+    expected = """template<>
+inline lrpc::span<const lrpc::FieldDescriptor> fieldTable<ns::test_struct>()
+{
+    static_assert(std::is_standard_layout<ns::test_struct>::value, "Table codec requires a standard layout struct");
+    static_assert(sizeof(ns::test_struct::f2) == 1, "Table codec requires enum field f2 to have size 1");
+    static constexpr lrpc::FieldDescriptor fields[]
+    {
+        {offsetof(ns::test_struct, f1), lrpc::FieldType::Struct, 2, sizeof(ns::nested), &lrpc::fieldTable<ns::nested>},
+        {offsetof(ns::test_struct, f2), lrpc::FieldType::Uint8, 1, 0, nullptr},
+    };
+    return fields;
+}
+"""
+
+    mock_file = StringIO()
+    writer = StructCodecWriter(CppFile.from_writer(mock_file.write), LrpcStruct(struct), "ns")
+    writer.write_field_table()
+
+    assert mock_file.getvalue() == expected